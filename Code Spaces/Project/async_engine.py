@@ -0,0 +1,221 @@
+"""Asyncio translation engine with per-backend concurrency and rate limits."""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backends import BatchMismatchError, pack_batches
+from metrics import Metrics, SIZE_BUCKETS
+from rate_limit import backoff_delay, is_rate_limit_error
+from scheduler import BackendScheduler
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BATCH_CHARS = 4000  # Characters per batched request; 0 sends one text per request
+RATE_LIMIT_COOLDOWN = 5.0  # Seconds a backend gets no tokens after it throttled us
+
+
+class AsyncTranslationEngine:
+    """Translates many texts concurrently across several backends.
+
+    `concurrency` worker tasks pull texts from a queue, so that many requests
+    are in flight at most. Each backend additionally has its own semaphore and
+    token bucket, so every service is kept at (but not over) its quota.
+    Which backend gets a request is decided by a BackendScheduler from
+    measured latency and error rates. Failed requests are retried with
+    jittered exponential backoff on a backend that hasn't failed them yet.
+    The client libraries are blocking, so the HTTP calls run on a thread pool.
+
+    With batch_chars set, texts are packed into batches of up to that many
+    characters and each batch goes out as a single request, since round-trip
+    latency rather than bandwidth dominates. A batch that fails is split in
+    half until the offending text is isolated.
+
+    Request latency, batch sizes, outcomes, retries and queue depth are
+    recorded in `metrics` (a metrics.Metrics, shared with the caller if given).
+    """
+
+    def __init__(self, backends, concurrency=DEFAULT_CONCURRENCY, max_retries=DEFAULT_MAX_RETRIES,
+                 base_delay=0.5, max_delay=30.0, batch_chars=DEFAULT_BATCH_CHARS, scheduler=None, log=None,
+                 metrics=None):
+        if not backends:
+            raise ValueError("AsyncTranslationEngine needs at least one backend")
+        self.backends = list(backends)
+        self.concurrency = max(1, int(concurrency))
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.batch_chars = batch_chars
+        self.log = log or (lambda message, level="info": None)
+        self.scheduler = scheduler or BackendScheduler(self.backends, log=self.log)
+        self.metrics = metrics or Metrics()
+        self.api_calls = 0
+        self.retries = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="translate")
+        self._backend_limits = {}
+        self._limits_loop = None
+
+    def _backend_limit(self, backend):
+        # Semaphores belong to one event loop and run() starts a new one each
+        # time, so they are made on first use in each loop; translate() and
+        # translate_batch() can then be awaited directly as well
+        loop = asyncio.get_running_loop()
+        if self._limits_loop is not loop:
+            self._backend_limits = {b.name: asyncio.Semaphore(b.max_concurrency) for b in self.backends}
+            self._limits_loop = loop
+        return self._backend_limits[backend.name]
+
+    async def _request(self, backend, method, payload, items, owner=None):
+        # One HTTP request: respects the backend's semaphore and token bucket
+        # and reports latency/outcome to the scheduler
+        begun = recorded = False
+        try:
+            async with self._backend_limit(backend):
+                await backend.bucket.acquire_async()
+                self.api_calls += 1
+                self.metrics.inc('translator_api_calls_total', backend=backend.name)
+                self.metrics.observe('translator_batch_size', items, SIZE_BUCKETS, backend=backend.name)
+                started = self.scheduler.begin(backend)
+                begun = True
+                request_started = time.perf_counter()
+                loop = asyncio.get_running_loop()
+                try:
+                    result = await loop.run_in_executor(self._executor, method, payload)
+                except Exception as e:
+                    rate_limited = is_rate_limit_error(e)
+                    if rate_limited:
+                        backend.bucket.penalize(RATE_LIMIT_COOLDOWN)
+                    self.scheduler.end(backend, started, items, error=e, rate_limited=rate_limited)
+                    recorded = True
+                    self._record_request(backend, request_started, 'rate_limited' if rate_limited else 'error')
+                    raise
+                self.scheduler.end(backend, started, items)
+                recorded = True
+                self._record_request(backend, request_started, 'ok')
+                return result
+        finally:
+            if not recorded:
+                # Cancelled before the request went out or before it came back: no
+                # outcome to record, but a probe choose() reserved must be given back
+                self.scheduler.release(backend, owner, begun)
+
+    def _record_request(self, backend, started, outcome):
+        self.metrics.observe('translator_request_seconds', time.perf_counter() - started, backend=backend.name)
+        self.metrics.inc('translator_requests_total', backend=backend.name, outcome=outcome)
+
+    async def _call_batch(self, backend, batch, owner=None):
+        # A batch packed for the engine-wide budget may still be too big for
+        # this backend (MyMemory); send it as several backend-sized requests
+        results = []
+        for chunk in pack_batches(batch, backend.max_chars):
+            results.extend(await self._request(backend, backend.translate_batch, chunk, len(chunk), owner))
+        return results
+
+    async def translate(self, text, tried=()):
+        """Return (translation, backend name), or (None, None) once every retry failed."""
+        tried = set(tried)
+        for attempt in range(self.max_retries + 1):
+            owner = object()  # Identifies this attempt to the scheduler, should it get a probe
+            backend = self.scheduler.choose(exclude=tried, owner=owner)
+            tried.add(backend.name)
+            try:
+                translated = await self._request(backend, backend.translate, text, 1, owner)
+                if translated:
+                    return translated, backend.name
+                self.log(f"Translator {backend.name} returned empty/None for: '{text[:30]}...'", "info")
+            except Exception as e:
+                self.log(f"Translator {backend.name} failed for '{text[:30]}...': {e}", "warning")
+            if attempt < self.max_retries:
+                self.retries += 1
+                self.metrics.inc('translator_retries_total', kind='text')
+                await asyncio.sleep(backoff_delay(attempt, self.base_delay, self.max_delay))
+        self.log(f"All translators failed for: '{text[:50]}...'. Returning original.", "warning")
+        return None, None
+
+    async def translate_batch(self, batch, tried=()):
+        """Translate a packed batch; returns {text: (translation, backend name)}.
+
+        A failed batch is retried whole on the next backend. It is split in
+        half, so one bad text can't sink the rest, when a backend garbled it
+        (BatchMismatchError) or once every healthy backend has failed it; if
+        no backend is healthy any more it is given up instead, since halves
+        would only multiply the failing requests. Texts a successful batch
+        left empty are retried one by one elsewhere.
+        """
+        if len(batch) == 1:
+            return {batch[0]: await self.translate(batch[0], tried)}
+        tried = set(tried)
+        for attempt in range(self.max_retries + 1):
+            owner = object()
+            backend = self.scheduler.choose(exclude=tried, owner=owner)
+            tried.add(backend.name)
+            try:
+                translated = await self._call_batch(backend, batch, owner)
+                results = {}
+                for text, translation in zip(batch, translated):
+                    if translation:
+                        results[text] = (translation, backend.name)
+                    else:
+                        results[text] = await self.translate(text, {backend.name})
+                return results
+            except Exception as e:
+                self.log(f"Translator {backend.name} failed for a batch of {len(batch)}: {e}", "warning")
+                if isinstance(e, BatchMismatchError):
+                    return await self._split_batch(batch)
+                if not is_rate_limit_error(e) and not self.scheduler.has_available(exclude=tried):
+                    if not self.scheduler.has_available():
+                        break
+                    return await self._split_batch(batch)
+            if attempt < self.max_retries:
+                self.retries += 1
+                self.metrics.inc('translator_retries_total', kind='batch')
+                await asyncio.sleep(backoff_delay(attempt, self.base_delay, self.max_delay))
+        self.log(f"All translators failed for a batch of {len(batch)} texts. Returning originals.", "warning")
+        return {text: (None, None) for text in batch}
+
+    async def _split_batch(self, batch):
+        middle = len(batch) // 2
+        results = await self.translate_batch(batch[:middle])
+        results.update(await self.translate_batch(batch[middle:]))
+        return results
+
+    async def translate_all(self, texts, on_result=None, should_cancel=None):
+        """Translate `texts`; returns {text: translation or None}.
+
+        on_result(text, translation, backend_name) is called as each text
+        finishes; should_cancel() is polled before each new batch is started.
+        """
+        texts = list(dict.fromkeys(texts))
+        if self.batch_chars:
+            batches = pack_batches(texts, self.batch_chars)
+        else:
+            batches = [[text] for text in texts]
+        queue = asyncio.Queue()
+        for batch in batches:
+            queue.put_nowait(batch)
+        self.metrics.set_gauge('translator_queue_depth', queue.qsize())
+        results = {}
+
+        async def worker():
+            while not (should_cancel and should_cancel()):
+                try:
+                    batch = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                self.metrics.set_gauge('translator_queue_depth', queue.qsize())
+                for text, (translated, backend_name) in (await self.translate_batch(batch)).items():
+                    results[text] = translated
+                    if on_result:
+                        on_result(text, translated, backend_name)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(batches)))))
+        return results
+
+    def run(self, texts, on_result=None, should_cancel=None):
+        """Blocking wrapper for worker threads such as the Tk translation thread.
+
+        Runs its own event loop, so it must not be called from the Tk main loop.
+        """
+        return asyncio.run(self.translate_all(texts, on_result, should_cancel))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
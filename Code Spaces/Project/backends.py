@@ -0,0 +1,116 @@
+"""Uniform wrappers around the translation services used by the front-ends.
+
+deep_translator's GoogleTranslator / MyMemoryTranslator and the googletrans
+Translator all have slightly different call signatures; Backend hides that
+and carries the per-service rate limit and concurrency settings.
+The client libraries (and requests/httpx under them) are imported in
+create_backend(), so only the services actually used are ever loaded.
+"""
+from rate_limit import TokenBucket
+
+# Requests per second, burst size and parallel requests each service tolerates
+# before it starts throttling us, plus the largest request body it accepts.
+# MyMemory's anonymous quota and request size are much lower.
+BACKEND_LIMITS = {
+    'GoogleTranslator': {'rate': 8.0, 'burst': 8, 'max_concurrency': 8, 'max_chars': 4500},
+    'googletrans': {'rate': 5.0, 'burst': 5, 'max_concurrency': 4, 'max_chars': 4500},
+    'MyMemoryTranslator': {'rate': 1.0, 'burst': 2, 'max_concurrency': 2, 'max_chars': 450},
+}
+DEFAULT_BACKENDS = ('GoogleTranslator', 'googletrans', 'MyMemoryTranslator')
+BATCH_SEPARATOR = "\n"  # The services translate line by line and keep line breaks
+MAX_BATCH_ITEMS = 100
+
+
+class BatchMismatchError(Exception):
+    """A batched request came back with a different number of lines than it was sent."""
+
+
+def pack_batches(texts, max_chars, max_items=MAX_BATCH_ITEMS):
+    """Greedily pack texts into batches whose joined length stays within max_chars.
+
+    A single text longer than the budget gets a batch of its own.
+    """
+    batches = []
+    current = []
+    current_chars = 0
+    for text in texts:
+        needed = len(text) + (len(BATCH_SEPARATOR) if current else 0)
+        if current and (current_chars + needed > max_chars or len(current) >= max_items):
+            batches.append(current)
+            current = []
+            current_chars = 0
+            needed = len(text)
+        current.append(text)
+        current_chars += needed
+    if current:
+        batches.append(current)
+    return batches
+
+
+class Backend:
+    """One translation service plus its rate limiter."""
+
+    def __init__(self, name, client, source='en', target='bn', rate=5.0, burst=5, max_concurrency=4,
+                 max_chars=4500):
+        self.name = name
+        self.client = client
+        self.source = source
+        self.target = target
+        self.max_concurrency = max_concurrency
+        self.max_chars = max_chars
+        self.bucket = TokenBucket(rate, burst)
+
+    def translate(self, text):
+        """Blocking single-text translation; returns None for an empty answer."""
+        if type(self.client).__module__.partition('.')[0] == 'googletrans':  # Without importing googletrans
+            result = self.client.translate(text, src=self.source, dest=self.target)
+            translated = result.text if result else None
+        else:
+            translated = self.client.translate(text)
+        return translated if translated and translated.strip() else None
+
+    def translate_batch(self, texts):
+        """Blocking translation of several texts in one request.
+
+        The texts are sent newline-joined and the answer is split back into
+        lines; raises BatchMismatchError if the line count doesn't match.
+        Callers are expected to keep the batch within max_chars.
+        """
+        if len(texts) == 1:
+            return [self.translate(texts[0])]
+        # Line breaks inside a cell would shift every following line
+        joined = BATCH_SEPARATOR.join(" ".join(text.split()) for text in texts)
+        translated = self.translate(joined)
+        lines = translated.split(BATCH_SEPARATOR) if translated else []
+        if len(lines) != len(texts):
+            raise BatchMismatchError(f"{self.name} returned {len(lines)} lines for a batch of {len(texts)}")
+        return [line.strip() or None for line in lines]
+
+    def __repr__(self):
+        return f"Backend({self.name!r})"
+
+
+def create_backend(name, source='en', target='bn', **overrides):
+    if name not in BACKEND_LIMITS:
+        raise ValueError(f"Unknown translation backend: {name}")
+    limits = dict(BACKEND_LIMITS[name], **overrides)
+    from http_clients import create_googletrans_client, install_session_pools
+
+    if name == 'GoogleTranslator':
+        from deep_translator import GoogleTranslator
+
+        install_session_pools()  # deep_translator reuses one keep-alive session per thread
+        client = GoogleTranslator(source=source, target=target)
+    elif name == 'googletrans':
+        client = create_googletrans_client(max_connections=limits.get('max_concurrency', 4))
+    else:
+        from deep_translator import MyMemoryTranslator
+
+        install_session_pools()
+        # Consider: email='your_email@example.com' for better MyMemory rates
+        client = MyMemoryTranslator(source=source, target=target)
+    return Backend(name, client, source, target, **limits)
+
+
+def create_backends(names=DEFAULT_BACKENDS, source='en', target='bn'):
+    return [create_backend(name, source, target) for name in names]
@@ -0,0 +1,401 @@
+"""Throughput benchmarks for the three translator front-ends, without the network.
+
+A MockTranslationService stands in for Google/MyMemory: it answers with
+fake Bengali after a configurable latency, fails a configurable fraction
+of requests, answers "429 Too Many Requests" above its rate limit and
+translates newline-joined batches line by line (or mangles them, with
+batch_support off). Synthetic sheets repeat values at a chosen ratio, the
+way real voter/census lists do.
+
+Each target runs in its own process against a fresh cache, so peak RSS is
+per target. The pipelines timed are:
+
+    claude      claude.py  EnglishToBengaliTranslator.process_dataframe
+    gemini      gemini v1.py's perform_translation, i.e. TranslationEngine.translate_dataframe
+    translator  translator.py  translate_frame (one batch queue over all selected columns)
+
+Examples:
+
+    python benchmark.py --rows 20000 --latency 0.05
+    python benchmark.py --targets gemini --error-rate 0.05 --json results.json
+    python benchmark.py --baseline results.json   # exit code 1 on a throughput regression
+    python benchmark.py --import-times            # where start-up time goes, per front-end
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+from translation_cache import TranslationCache, normalize_text
+from lazy_imports import HEAVY_MODULES, format_import_report, import_report
+
+TARGETS = ('claude', 'gemini', 'translator')
+TEXT_COLUMNS = ['Name', 'Father Name', 'Gender', 'Marital Status', 'Occupation', 'Address']
+NUMBER_COLUMNS = ['Phone', 'NID']
+DEFAULT_TOLERANCE = 0.10  # Allowed drop in cells/sec against a baseline
+# What starting each front-end imports before its window can show (main() isn't run)
+STARTUP_IMPORTS = {
+    'claude': "import claude",
+    'gemini': "import runpy; runpy.run_path('gemini v1.py')",
+    'translator': "import translator",
+}
+
+FIRST_NAMES = ['Rahim', 'Karim', 'Abdul', 'Fatema', 'Ayesha', 'Nusrat', 'Hasan', 'Jamal', 'Rina', 'Shirin',
+               'Kamal', 'Sultana', 'Rafiq', 'Nasrin', 'Habib', 'Mitu', 'Selim', 'Taslima', 'Arif', 'Ruma']
+LAST_NAMES = ['Uddin', 'Hossain', 'Rahman', 'Islam', 'Ahmed', 'Khatun', 'Begum', 'Chowdhury', 'Sarkar', 'Miah']
+GENDERS = ['Male', 'Female']
+MARITAL_STATUSES = ['Married', 'Unmarried', 'Divorced', 'Widowed']
+OCCUPATIONS = ['Farmer', 'Teacher', 'Housewife', 'Student', 'Businessman', 'Day Labourer', 'Rickshaw Puller',
+               'Garment Worker', 'Fisherman', 'Shopkeeper']
+PLACES = ['Mirpur', 'Dhanmondi', 'Savar', 'Tongi', 'Gazipur', 'Narayanganj', 'Keraniganj', 'Uttara', 'Badda',
+          'Mohammadpur']
+
+# Lowercase letters onto Bengali ones, so mock output looks translated and is cheap to produce
+FAKE_BENGALI = str.maketrans('abcdefghijklmnopqrstuvwxyz', 'অআইঈউঊঋএঐওঔকখগঘঙচছজঝঞটঠডঢণ')
+
+
+class MockServiceError(Exception):
+    """An error answer from the mock service; the message mimics the real HTTP errors."""
+
+
+class MockTranslationService:
+    """In-process stand-in for a translation API with latency, errors and a rate limit."""
+
+    def __init__(self, latency=0.05, jitter=0.02, error_rate=0.0, rate_limit=None, batch_support=True, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit  # Requests per second before it answers 429; None for no limit
+        self.batch_support = batch_support
+        self.requests = 0
+        self.texts = 0
+        self.chars = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self._recent = deque()  # Start times of requests in the last second
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def handle(self, text):
+        """Answer one request (possibly a newline-joined batch) like the real service would."""
+        with self._lock:
+            now = time.monotonic()
+            self.requests += 1
+            while self._recent and now - self._recent[0] > 1.0:
+                self._recent.popleft()
+            self._recent.append(now)
+            if self.rate_limit and len(self._recent) > self.rate_limit:
+                self.rate_limited += 1
+                raise MockServiceError("429 Too Many Requests")
+            failed = self._random.random() < self.error_rate
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+        time.sleep(delay)
+        if failed:
+            with self._lock:
+                self.errors += 1
+            raise MockServiceError("500 Internal Server Error")
+        lines = text.split("\n")
+        with self._lock:
+            self.texts += len(lines)
+            self.chars += len(text)
+        translated = [line.lower().translate(FAKE_BENGALI) for line in lines]
+        # A service without batch support answers a joined batch as one line
+        return ("\n" if self.batch_support else " ").join(translated)
+
+    def googletrans_client(self):
+        return MockGoogletransClient(self)
+
+    def deep_translator_client(self):
+        return MockDeepTranslatorClient(self)
+
+    def stats(self):
+        return {'requests': self.requests, 'texts': self.texts, 'chars': self.chars,
+                'errors': self.errors, 'rate_limited': self.rate_limited}
+
+
+class MockResult:
+    def __init__(self, text):
+        self.text = text
+
+
+class MockGoogletransClient:
+    """googletrans.Translator look-alike: translate(text, src, dest).text"""
+
+    def __init__(self, service):
+        self.service = service
+
+    def translate(self, text, src='auto', dest='bn'):
+        return MockResult(self.service.handle(text))
+
+
+class MockDeepTranslatorClient:
+    """deep_translator look-alike: translate(text) and translate_batch(texts), one request per text."""
+
+    def __init__(self, service, source='auto', target='bn'):
+        self.service = service
+        self.source = source
+        self.target = target
+
+    def translate(self, text):
+        return self.service.handle(text)
+
+    def translate_batch(self, batch):
+        return [self.translate(text) for text in batch]
+
+
+class CountingCache(TranslationCache):
+    """TranslationCache that counts lookups and hits for the report."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = 0
+        self.hits = 0
+
+    def get(self, text, *args, **kwargs):
+        result = super().get(text, *args, **kwargs)
+        self.lookups += 1
+        self.hits += result is not None
+        return result
+
+    def get_many(self, texts, *args, **kwargs):
+        texts = list(texts)
+        result = super().get_many(texts, *args, **kwargs)
+        self.lookups += len({normalize_text(text) for text in texts})
+        self.hits += len(result)
+        return result
+
+    def hit_ratio(self):
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+def make_dataframe(rows, duplication_ratio=0.7, seed=0):
+    """Synthetic person records; about `duplication_ratio` of the text cells repeat an earlier value.
+
+    Phone and NID columns are unique numbers, as in real sheets.
+    """
+    rng = random.Random(seed)
+    distinct = max(1, int(rows * (1 - duplication_ratio)))
+
+    def column(make_value, vocabulary_size=None):
+        pool = [make_value() for _ in range(min(distinct, vocabulary_size or distinct))]
+        return [pool[i] if i < len(pool) else rng.choice(pool) for i in range(rows)]
+
+    def full_name():
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(FIRST_NAMES)}"
+
+    def address():
+        return f"House {rng.randint(1, 200)}, Road {rng.randint(1, 40)}, {rng.choice(PLACES)}"
+
+    data = {
+        'Name': column(full_name),
+        'Father Name': column(full_name),
+        'Gender': [rng.choice(GENDERS) for _ in range(rows)],
+        'Marital Status': [rng.choice(MARITAL_STATUSES) for _ in range(rows)],
+        'Occupation': [rng.choice(OCCUPATIONS) for _ in range(rows)],
+        'Address': column(address),
+        'Phone': [f"01{rng.randint(3, 9)}{rng.randint(0, 99999999):08d}" for _ in range(rows)],
+        'NID': [f"{rng.randint(10 ** 9, 10 ** 10 - 1)}" for _ in range(rows)],
+    }
+    frame = pd.DataFrame(data)
+    # Shuffle so repeats are spread through the sheet rather than clustered at the end
+    return frame.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_claude(df, columns, services, cache_path, options):
+    from claude import EnglishToBengaliTranslator
+
+    translator = EnglishToBengaliTranslator()
+    translator.translator = services['googletrans'].googletrans_client()
+    translator.cache = CountingCache(cache_path, source='en', target='bn')
+    translator.process_dataframe(df, columns, preserve_numbers_in=NUMBER_COLUMNS)
+    return translator.cache
+
+
+def run_gemini(df, columns, services, cache_path, options):
+    from backends import BACKEND_LIMITS, Backend
+    from translation_engine import TranslationEngine
+
+    engine = TranslationEngine(cache_path=cache_path, custom_translations_path=os.path.join(
+        os.path.dirname(cache_path), 'custom_translations.json'), concurrency=options['workers'],
+        log=lambda message, level="info": None)
+    engine.persistent_cache.close()
+    engine.persistent_cache = CountingCache(cache_path, source='en', target='bn')
+    engine.translators = []
+    for name, limits in BACKEND_LIMITS.items():
+        limits = dict(limits)
+        if options['unthrottled']:
+            limits.update(rate=1e6, burst=1e6)
+        engine.translators.append(Backend(name, services[name].deep_translator_client(), **limits))
+    try:
+        engine.translate_dataframe(df, columns, preserve_number_columns=NUMBER_COLUMNS)
+    finally:
+        engine.close()
+    return engine.persistent_cache
+
+
+def run_translator(df, columns, services, cache_path, options):
+    import translator
+
+    client = services['GoogleTranslator'].deep_translator_client()
+    translator.GoogleTranslator = lambda source='auto', target='bn': client
+    translator.cache = CountingCache(cache_path, source='auto', target='bn')
+    translator.translate_frame(df.copy(deep=False), columns)
+    return translator.cache
+
+
+RUNNERS = {'claude': run_claude, 'gemini': run_gemini, 'translator': run_translator}
+
+
+def run_target(target, options):
+    """Benchmark one front-end; runs in a fresh process so RSS and imports don't leak between targets."""
+    df = make_dataframe(options['rows'], options['duplication'], options['seed'])
+    columns = TEXT_COLUMNS + NUMBER_COLUMNS
+    cells = int(df[columns].notna().sum().sum())
+    services = {name: MockTranslationService(options['latency'], options['jitter'], options['error_rate'],
+                                             options['rate_limit'], options['batch_support'], seed)
+                for seed, name in enumerate(('GoogleTranslator', 'googletrans', 'MyMemoryTranslator'))}
+    work_dir = tempfile.mkdtemp(prefix='translator_bench_')
+    cache_path = os.path.join(work_dir, 'cache.sqlite3')
+    results = []
+    try:
+        for run in ('cold', 'warm')[:1 + options['warm']]:
+            before = {name: service.stats() for name, service in services.items()}
+            started = time.perf_counter()
+            cache = RUNNERS[target](df.copy(), columns, services, cache_path, options)
+            elapsed = time.perf_counter() - started
+            cache.close()
+            calls = {key: sum(service.stats()[key] - before[name][key] for name, service in services.items())
+                     for key in ('requests', 'texts', 'errors', 'rate_limited')}
+            results.append({
+                'target': target,
+                'run': run,
+                'rows': len(df),
+                'cells': cells,
+                'seconds': round(elapsed, 3),
+                'cells_per_sec': round(cells / elapsed, 1) if elapsed > 0 else None,
+                'api_calls': calls['requests'],
+                'texts_sent': calls['texts'],
+                'errors': calls['errors'],
+                'rate_limited': calls['rate_limited'],
+                'cache_hit_ratio': round(cache.hit_ratio(), 3),
+                'peak_rss_mb': peak_rss_mb(),
+            })
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def print_report(results):
+    header = f"{'target':<11}{'run':<6}{'cells':>9}{'sec':>9}{'cells/s':>11}{'API calls':>11}" \
+             f"{'sent':>9}{'errors':>8}{'429s':>7}{'hit %':>8}{'RSS MB':>9}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        rss = f"{r['peak_rss_mb']:.1f}" if r['peak_rss_mb'] is not None else 'n/a'
+        print(f"{r['target']:<11}{r['run']:<6}{r['cells']:>9}{r['seconds']:>9.2f}{r['cells_per_sec'] or 0:>11.1f}"
+              f"{r['api_calls']:>11}{r['texts_sent']:>9}{r['errors']:>8}{r['rate_limited']:>7}"
+              f"{r['cache_hit_ratio'] * 100:>8.1f}{rss:>9}")
+
+
+def print_import_times(targets, top=15):
+    """python -X importtime per front-end, plus what the background preload costs."""
+    statements = [(target, STARTUP_IMPORTS[target]) for target in targets]
+    statements.append(('preload', "import " + ", ".join(HEAVY_MODULES)))
+    for label, statement in statements:
+        print(f"{label}: {statement}")
+        try:
+            print(format_import_report(import_report(statement), top))
+        except RuntimeError as e:
+            print(f"  failed: {e}")
+        print()
+
+
+def find_regressions(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Results whose cells/sec fell more than `tolerance` below the matching baseline result."""
+    previous = {(r['target'], r['run']): r for r in baseline}
+    regressions = []
+    for r in results:
+        base = previous.get((r['target'], r['run']))
+        if base and base.get('cells_per_sec') and r['cells_per_sec'] is not None \
+                and r['cells_per_sec'] < base['cells_per_sec'] * (1 - tolerance):
+            regressions.append((r, base))
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the translator front-ends against a mock translation service.")
+    parser.add_argument('--targets', nargs='+', choices=TARGETS, default=list(TARGETS))
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--duplication', type=float, default=0.7, help="Share of text cells repeating an earlier value")
+    parser.add_argument('--latency', type=float, default=0.05, help="Mock service seconds per request")
+    parser.add_argument('--jitter', type=float, default=0.02)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with a 500")
+    parser.add_argument('--rate-limit', type=float, help="Requests/sec per service before it answers 429")
+    parser.add_argument('--no-batch-support', dest='batch_support', action='store_false',
+                        help="Mock service merges the lines of a batched request")
+    parser.add_argument('--workers', type=int, default=8, help="Parallel requests for the gemini engine")
+    parser.add_argument('--unthrottled', action='store_true',
+                        help="Lift the client-side per-backend rate limits to measure pipeline overhead")
+    parser.add_argument('--warm', action='store_true', help="Run each target a second time against the warmed cache")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="Write the results to this file")
+    parser.add_argument('--baseline', help="Earlier --json results; exit 1 if throughput regressed")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--import-times', action='store_true',
+                        help="Only report start-up import times of the targets (python -X importtime)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.import_times:
+        print_import_times(args.targets)
+        return 0
+    options = vars(args)
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for target in args.targets:
+        print(f"Running {target}...", file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.extend(pool.submit(run_target, target, options).result())
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = find_regressions(results, json.load(f), args.tolerance)
+        for r, base in regressions:
+            print(f"REGRESSION {r['target']} ({r['run']}): {r['cells_per_sec']} cells/s "
+                  f"vs {base['cells_per_sec']} in the baseline", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
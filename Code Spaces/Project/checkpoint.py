@@ -0,0 +1,121 @@
+"""Checkpoint journal so long translation jobs can resume after a crash or cancel.
+
+The journal is an append-only JSON-lines file next to the input. Its first
+line identifies the job (input file, size, mtime, columns, output); after
+that it holds either finished cells ({"row", "col", "text"}) for in-memory
+jobs or finished chunks ({"chunk", "rows", "bytes"}) for streamed jobs.
+A job started with the same signature picks up where the journal ends;
+a journal for a different job is discarded. The journal is deleted once
+the job completes.
+"""
+import json
+import os
+import threading
+
+JOURNAL_SUFFIX = '.checkpoint.jsonl'
+
+
+def journal_path_for(file_path):
+    return f"{file_path}{JOURNAL_SUFFIX}"
+
+
+def job_signature(file_path, columns, output_path=None):
+    """Identify a job, so a journal is only reused for the same input, columns and output."""
+    stat = os.stat(file_path)
+    return {
+        'file': os.path.abspath(file_path),
+        'size': stat.st_size,
+        'mtime': int(stat.st_mtime),
+        'columns': [str(col) for col in columns],
+        'output': os.path.abspath(output_path) if output_path else None,
+    }
+
+
+def _label(value):
+    # Index labels become JSON; numpy integers must turn into plain ints
+    # so a reloaded label compares equal to the one in the DataFrame
+    try:
+        if int(value) == value:
+            return int(value)
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+class CheckpointJournal:
+    def __init__(self, path, signature):
+        self.path = path
+        self.signature = signature
+        self.cells = {}  # (row label, column) -> translation
+        self.chunks_done = 0
+        self.rows_done = 0
+        self.output_bytes = 0
+        self._lock = threading.Lock()
+        self.resumed = self._load()
+        self._file = open(path, 'a' if self.resumed else 'w', encoding='utf-8')
+        if not self.resumed:
+            self._write({'job': signature})
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, 'rb') as f:
+            lines = f.readlines()
+        if not lines:
+            return False
+        try:
+            if json.loads(lines[0]).get('job') != self.signature:
+                return False
+        except (ValueError, AttributeError):
+            return False
+        good_bytes = len(lines[0])
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Half-written last line from a crash: cut it off so new
+                # records don't get glued onto it
+                os.truncate(self.path, good_bytes)
+                break
+            good_bytes += len(line)
+            if 'chunk' in record:
+                self.chunks_done = record['chunk'] + 1
+                self.rows_done = record['rows']
+                self.output_bytes = record['bytes']
+            else:
+                self.cells[(record['row'], record['col'])] = record['text']
+        return True
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def get_cell(self, row, col):
+        return self.cells.get((_label(row), str(col)))
+
+    def record_cells(self, records):
+        """Journal finished (row label, column, translation) cells."""
+        with self._lock:
+            for row, col, text in records:
+                self._write({'row': _label(row), 'col': str(col), 'text': text})
+            self._file.flush()
+
+    def record_chunk(self, chunk_number, rows_done, output_bytes):
+        """Journal a streamed chunk once it is safely appended to the output."""
+        with self._lock:
+            self._write({'chunk': chunk_number, 'rows': rows_done, 'bytes': output_bytes})
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.chunks_done = chunk_number + 1
+            self.rows_done = rows_done
+            self.output_bytes = output_bytes
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def complete(self):
+        """The job finished: nothing left to resume, so drop the journal."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -1,495 +1,744 @@
-import pandas as pd
-import re
-from googletrans import Translator
-import time
-import logging
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
-import threading
-import os
-from pathlib import Path
-
-class EnglishToBengaliTranslator:
-    def __init__(self):
-        self.translator = Translator()
-        
-        # Common translations for frequently used terms
-        self.common_translations = {
-            # Gender/Sex
-            'male': 'পুরুষ',
-            'female': 'মহিলা', 
-            'man': 'পুরুষ',
-            'woman': 'মহিলা',
-            'boy': 'ছেলে',
-            'girl': 'মেয়ে',
-            'mr': 'জনাব',
-            'mrs': 'বেগম',
-            'ms': 'মিস',
-            
-            # Marital Status
-            'married': 'বিবাহিত',
-            'unmarried': 'অবিবাহিত',
-            'single': 'অবিবাহিত',
-            'divorced': 'তালাকপ্রাপ্ত',
-            'widowed': 'বিধবা/বিপত্নীক',
-            
-            # Education
-            'primary': 'প্রাথমিক',
-            'secondary': 'মাধ্যমিক',
-            'higher secondary': 'উচ্চ মাধ্যমিক',
-            'bachelor': 'স্নাতক',
-            'master': 'স্নাতকোত্তর',
-            'phd': 'পিএইচডি',
-            
-            # Occupation
-            'teacher': 'শিক্ষক',
-            'doctor': 'চিকিৎসক',
-            'engineer': 'প্রকৌশলী',
-            'farmer': 'কৃষক',
-            'student': 'ছাত্র/ছাত্রী',
-            'businessman': 'ব্যবসায়ী',
-            'housewife': 'গৃহিণী',
-            
-            # Relationships
-            'father': 'পিতা',
-            'mother': 'মাতা',
-            'son': 'পুত্র',
-            'daughter': 'কন্যা',
-            'husband': 'স্বামী',
-            'wife': 'স্ত্রী',
-            'brother': 'ভাই',
-            'sister': 'বোন',
-            
-            # Common titles
-            'mr.': 'জনাব',
-            'mrs.': 'বেগম',
-            'dr.': 'ডাঃ',
-            'prof.': 'অধ্যাপক',
-        }
-        
-        # Bengali number mapping
-        self.bengali_numbers = {
-            '0': '০', '1': '১', '2': '২', '3': '৩', '4': '৪',
-            '5': '৫', '6': '৬', '7': '৭', '8': '৮', '9': '৯'
-        }
-        
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
-        
-    def is_id_number(self, text):
-        """Check if text is likely an ID number (NID, passport, etc.)"""
-        if pd.isna(text):
-            return False
-        text_str = str(text).strip()
-        return bool(re.match(r'^[0-9\-\s]+$', text_str) and len(text_str) >= 4)
-    
-    def is_phone_number(self, text):
-        """Check if text is a phone number"""
-        if pd.isna(text):
-            return False
-        text_str = str(text).strip()
-        return bool(re.match(r'^[\+]?[0-9\-\s\(\)]+$', text_str) and len(text_str) >= 7)
-    
-    def convert_numbers_to_bengali(self, text):
-        """Convert English numbers to Bengali numbers"""
-        if pd.isna(text):
-            return text
-        
-        text_str = str(text)
-        for eng, ben in self.bengali_numbers.items():
-            text_str = text_str.replace(eng, ben)
-        return text_str
-    
-    def translate_text(self, text, preserve_numbers=False):
-        """Translate text from English to Bengali"""
-        if pd.isna(text) or text == '':
-            return text
-            
-        text_str = str(text).strip().lower()
-        
-        # Check if it's a number-only field (ID, phone, etc.)
-        if self.is_id_number(text) or self.is_phone_number(text):
-            if preserve_numbers:
-                return self.convert_numbers_to_bengali(text)
-            else:
-                return str(text)
-        
-        # Check common translations first
-        if text_str in self.common_translations:
-            return self.common_translations[text_str]
-        
-        # Handle names and other text
-        if re.match(r'^[a-zA-Z\s\.]+$', text_str):
-            try:
-                for attempt in range(3):
-                    try:
-                        result = self.translator.translate(str(text), src='en', dest='bn')
-                        if result and result.text:
-                            return result.text
-                        time.sleep(1)
-                    except Exception as e:
-                        if attempt < 2:
-                            time.sleep(2)
-                        else:
-                            return str(text)
-            except Exception as e:
-                return str(text)
-        
-        # For other text, try translation
-        try:
-            result = self.translator.translate(str(text), src='en', dest='bn')
-            return result.text if result and result.text else str(text)
-        except Exception as e:
-            return str(text)
-    
-    def process_dataframe(self, df, columns_to_translate, preserve_numbers_in, progress_callback=None):
-        """Process DataFrame and translate specified columns"""
-        df_copy = df.copy()
-        total_cells = sum(len([cell for cell in df_copy[col] if pd.notna(cell)]) for col in columns_to_translate)
-        processed_cells = 0
-        
-        for col in columns_to_translate:
-            if col in df_copy.columns:
-                preserve_nums = col in preserve_numbers_in
-                
-                for idx, value in enumerate(df_copy[col]):
-                    if pd.notna(value):
-                        df_copy.loc[idx, col] = self.translate_text(value, preserve_numbers=preserve_nums)
-                        processed_cells += 1
-                        
-                        if progress_callback:
-                            progress = (processed_cells / total_cells) * 100
-                            progress_callback(progress, f"Translating {col}: row {idx + 1}")
-                        
-                        if processed_cells % 5 == 0:
-                            time.sleep(0.1)
-        
-        return df_copy
-
-
-class TranslatorGUI:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("English to Bengali Data Translator")
-        self.root.geometry("800x700")
-        self.root.configure(bg='#f0f0f0')
-        
-        # Initialize translator
-        self.translator = EnglishToBengaliTranslator()
-        self.df = None
-        self.file_path = None
-        
-        self.setup_gui()
-        
-    def setup_gui(self):
-        # Title
-        title_frame = tk.Frame(self.root, bg='#2c3e50', height=60)
-        title_frame.pack(fill='x', padx=5, pady=5)
-        title_frame.pack_propagate(False)
-        
-        title_label = tk.Label(title_frame, text="English to Bengali Data Translator", 
-                              font=('Arial', 16, 'bold'), fg='white', bg='#2c3e50')
-        title_label.pack(expand=True)
-        
-        # Main container
-        main_frame = tk.Frame(self.root, bg='#f0f0f0')
-        main_frame.pack(fill='both', expand=True, padx=10, pady=5)
-        
-        # File selection section
-        file_frame = tk.LabelFrame(main_frame, text="File Selection", font=('Arial', 10, 'bold'),
-                                  bg='#f0f0f0', fg='#2c3e50', padx=10, pady=10)
-        file_frame.pack(fill='x', pady=(0, 10))
-        
-        self.file_path_var = tk.StringVar()
-        file_path_frame = tk.Frame(file_frame, bg='#f0f0f0')
-        file_path_frame.pack(fill='x', pady=5)
-        
-        tk.Label(file_path_frame, text="Selected File:", font=('Arial', 9), 
-                bg='#f0f0f0').pack(anchor='w')
-        self.file_path_label = tk.Label(file_path_frame, textvariable=self.file_path_var,
-                                       font=('Arial', 9), bg='white', relief='sunken',
-                                       anchor='w', padx=5, pady=2)
-        self.file_path_label.pack(fill='x', pady=(2, 5))
-        
-        btn_frame = tk.Frame(file_frame, bg='#f0f0f0')
-        btn_frame.pack(fill='x')
-        
-        self.select_btn = tk.Button(btn_frame, text="📁 Select File", command=self.select_file,
-                                   font=('Arial', 10), bg='#3498db', fg='white',
-                                   padx=20, pady=5, cursor='hand2')
-        self.select_btn.pack(side='left', padx=5)
-        
-        self.preview_btn = tk.Button(btn_frame, text="👁 Preview Data", command=self.preview_data,
-                                    font=('Arial', 10), bg='#95a5a6', fg='white',
-                                    padx=20, pady=5, cursor='hand2', state='disabled')
-        self.preview_btn.pack(side='left', padx=5)
-        
-        # Column selection section
-        column_frame = tk.LabelFrame(main_frame, text="Column Selection", font=('Arial', 10, 'bold'),
-                                    bg='#f0f0f0', fg='#2c3e50', padx=10, pady=10)
-        column_frame.pack(fill='both', expand=True, pady=(0, 10))
-        
-        # Create two columns for checkboxes
-        checkbox_main_frame = tk.Frame(column_frame, bg='#f0f0f0')
-        checkbox_main_frame.pack(fill='both', expand=True)
-        
-        # Left frame for translation columns
-        left_frame = tk.Frame(checkbox_main_frame, bg='#f0f0f0')
-        left_frame.pack(side='left', fill='both', expand=True, padx=(0, 10))
-        
-        tk.Label(left_frame, text="Columns to Translate:", font=('Arial', 9, 'bold'),
-                bg='#f0f0f0', fg='#2c3e50').pack(anchor='w', pady=(0, 5))
-        
-        self.translate_frame = tk.Frame(left_frame, bg='#f0f0f0')
-        self.translate_frame.pack(fill='both', expand=True)
-        
-        # Right frame for number conversion columns
-        right_frame = tk.Frame(checkbox_main_frame, bg='#f0f0f0')
-        right_frame.pack(side='right', fill='both', expand=True, padx=(10, 0))
-        
-        tk.Label(right_frame, text="Convert Numbers to Bengali:", font=('Arial', 9, 'bold'),
-                bg='#f0f0f0', fg='#2c3e50').pack(anchor='w', pady=(0, 5))
-        
-        self.numbers_frame = tk.Frame(right_frame, bg='#f0f0f0')
-        self.numbers_frame.pack(fill='both', expand=True)
-        
-        # Translation section
-        translate_frame = tk.LabelFrame(main_frame, text="Translation", font=('Arial', 10, 'bold'),
-                                       bg='#f0f0f0', fg='#2c3e50', padx=10, pady=10)
-        translate_frame.pack(fill='x', pady=(0, 10))
-        
-        # Progress bar
-        self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(translate_frame, variable=self.progress_var,
-                                           maximum=100, length=400)
-        self.progress_bar.pack(pady=5)
-        
-        self.progress_label = tk.Label(translate_frame, text="Ready to translate",
-                                      font=('Arial', 9), bg='#f0f0f0')
-        self.progress_label.pack(pady=2)
-        
-        # Translate button
-        self.translate_btn = tk.Button(translate_frame, text="🔄 Start Translation",
-                                      command=self.start_translation, font=('Arial', 12, 'bold'),
-                                      bg='#27ae60', fg='white', padx=30, pady=8,
-                                      cursor='hand2', state='disabled')
-        self.translate_btn.pack(pady=10)
-        
-        # Log section
-        log_frame = tk.LabelFrame(main_frame, text="Translation Log", font=('Arial', 10, 'bold'),
-                                 bg='#f0f0f0', fg='#2c3e50', padx=10, pady=10)
-        log_frame.pack(fill='x')
-        
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=6, font=('Consolas', 9),
-                                                 bg='#2c3e50', fg='#ecf0f1', insertbackground='white')
-        self.log_text.pack(fill='x', pady=5)
-        
-        # Initialize column checkboxes storage
-        self.translate_checkboxes = {}
-        self.numbers_checkboxes = {}
-        
-    def log_message(self, message):
-        """Add message to log display"""
-        self.log_text.insert('end', f"{message}\n")
-        self.log_text.see('end')
-        self.root.update_idletasks()
-        
-    def select_file(self):
-        """Open file dialog to select Excel or CSV file"""
-        file_types = [
-            ('Excel files', '*.xlsx *.xls'),
-            ('CSV files', '*.csv'),
-            ('All supported', '*.xlsx *.xls *.csv')
-        ]
-        
-        file_path = filedialog.askopenfilename(
-            title="Select Excel or CSV file",
-            filetypes=file_types
-        )
-        
-        if file_path:
-            self.file_path = file_path
-            self.file_path_var.set(os.path.basename(file_path))
-            self.log_message(f"File selected: {os.path.basename(file_path)}")
-            
-            try:
-                # Load the file
-                if file_path.endswith('.csv'):
-                    self.df = pd.read_csv(file_path, encoding='utf-8')
-                else:
-                    self.df = pd.read_excel(file_path)
-                
-                self.log_message(f"File loaded: {len(self.df)} rows, {len(self.df.columns)} columns")
-                self.setup_column_checkboxes()
-                self.preview_btn.config(state='normal')
-                self.translate_btn.config(state='normal')
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load file: {str(e)}")
-                self.log_message(f"Error loading file: {str(e)}")
-    
-    def setup_column_checkboxes(self):
-        """Create checkboxes for each column"""
-        # Clear existing checkboxes
-        for widget in self.translate_frame.winfo_children():
-            widget.destroy()
-        for widget in self.numbers_frame.winfo_children():
-            widget.destroy()
-            
-        self.translate_checkboxes.clear()
-        self.numbers_checkboxes.clear()
-        
-        # Auto-detect columns likely to need translation
-        likely_translate_columns = []
-        likely_number_columns = []
-        
-        for col in self.df.columns:
-            col_lower = col.lower()
-            if any(keyword in col_lower for keyword in ['name', 'sex', 'gender', 'occupation', 
-                                                      'education', 'marital', 'relation', 'address']):
-                likely_translate_columns.append(col)
-            elif any(keyword in col_lower for keyword in ['age', 'phone', 'mobile', 'number']):
-                likely_number_columns.append(col)
-        
-        # Create translation checkboxes
-        for i, col in enumerate(self.df.columns):
-            var = tk.BooleanVar(value=col in likely_translate_columns)
-            self.translate_checkboxes[col] = var
-            
-            cb = tk.Checkbutton(self.translate_frame, text=col, variable=var,
-                               font=('Arial', 9), bg='#f0f0f0', anchor='w')
-            cb.pack(fill='x', padx=5, pady=1)
-        
-        # Create number conversion checkboxes
-        for i, col in enumerate(self.df.columns):
-            var = tk.BooleanVar(value=col in likely_number_columns)
-            self.numbers_checkboxes[col] = var
-            
-            cb = tk.Checkbutton(self.numbers_frame, text=col, variable=var,
-                               font=('Arial', 9), bg='#f0f0f0', anchor='w')
-            cb.pack(fill='x', padx=5, pady=1)
-    
-    def preview_data(self):
-        """Show preview of the data"""
-        if self.df is not None:
-            preview_window = tk.Toplevel(self.root)
-            preview_window.title("Data Preview")
-            preview_window.geometry("800x400")
-            
-            # Create treeview for data display
-            tree = ttk.Treeview(preview_window)
-            tree.pack(fill='both', expand=True, padx=10, pady=10)
-            
-            # Configure columns
-            tree['columns'] = list(self.df.columns)
-            tree['show'] = 'headings'
-            
-            for col in self.df.columns:
-                tree.heading(col, text=col)
-                tree.column(col, width=100)
-            
-            # Insert data (first 50 rows)
-            for i, row in self.df.head(50).iterrows():
-                tree.insert('', 'end', values=list(row))
-            
-            # Add scrollbars
-            v_scrollbar = ttk.Scrollbar(preview_window, orient='vertical', command=tree.yview)
-            h_scrollbar = ttk.Scrollbar(preview_window, orient='horizontal', command=tree.xview)
-            tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-            
-            v_scrollbar.pack(side='right', fill='y')
-            h_scrollbar.pack(side='bottom', fill='x')
-    
-    def update_progress(self, progress, message):
-        """Update progress bar and message"""
-        self.progress_var.set(progress)
-        self.progress_label.config(text=message)
-        self.log_message(message)
-        self.root.update_idletasks()
-    
-    def start_translation(self):
-        """Start the translation process in a separate thread"""
-        # Get selected columns
-        columns_to_translate = [col for col, var in self.translate_checkboxes.items() if var.get()]
-        preserve_numbers_in = [col for col, var in self.numbers_checkboxes.items() if var.get()]
-        
-        if not columns_to_translate:
-            messagebox.showwarning("No Columns Selected", "Please select at least one column to translate.")
-            return
-        
-        # Disable UI during translation
-        self.translate_btn.config(state='disabled', text="Translating...")
-        self.select_btn.config(state='disabled')
-        
-        # Start translation in separate thread
-        thread = threading.Thread(target=self.perform_translation, 
-                                args=(columns_to_translate, preserve_numbers_in))
-        thread.daemon = True
-        thread.start()
-    
-    def perform_translation(self, columns_to_translate, preserve_numbers_in):
-        """Perform the actual translation"""
-        try:
-            self.log_message("Starting translation process...")
-            self.log_message(f"Translating columns: {', '.join(columns_to_translate)}")
-            
-            # Process the dataframe
-            translated_df = self.translator.process_dataframe(
-                self.df, columns_to_translate, preserve_numbers_in, 
-                progress_callback=self.update_progress
-            )
-            
-            # Save the file
-            base_name = Path(self.file_path).stem
-            extension = Path(self.file_path).suffix
-            output_path = Path(self.file_path).parent / f"{base_name}_bengali{extension}"
-            
-            if extension.lower() == '.csv':
-                translated_df.to_csv(output_path, index=False, encoding='utf-8-sig')
-            else:
-                translated_df.to_excel(output_path, index=False)
-            
-            self.log_message(f"Translation completed successfully!")
-            self.log_message(f"Output saved as: {output_path.name}")
-            
-            # Show completion message
-            self.root.after(0, lambda: messagebox.showinfo(
-                "Translation Complete", 
-                f"Translation completed successfully!\nOutput saved as: {output_path.name}"
-            ))
-            
-        except Exception as e:
-            error_msg = f"Translation failed: {str(e)}"
-            self.log_message(error_msg)
-            self.root.after(0, lambda: messagebox.showerror("Translation Error", error_msg))
-        
-        finally:
-            # Re-enable UI
-            self.root.after(0, self.reset_ui)
-    
-    def reset_ui(self):
-        """Reset UI after translation"""
-        self.translate_btn.config(state='normal', text="🔄 Start Translation")
-        self.select_btn.config(state='normal')
-        self.progress_var.set(0)
-        self.progress_label.config(text="Ready to translate")
-
-
-def main():
-    # Create and run the GUI
-    root = tk.Tk()
-    app = TranslatorGUI(root)
-    
-    # Center the window
-    root.update_idletasks()
-    width = root.winfo_width()
-    height = root.winfo_height()
-    x = (root.winfo_screenwidth() // 2) - (width // 2)
-    y = (root.winfo_screenheight() // 2) - (height // 2)
-    root.geometry(f"{width}x{height}+{x}+{y}")
-    
-    root.mainloop()
-
-if __name__ == "__main__":
+import re
+import time
+import logging
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox, scrolledtext
+import threading
+import os
+import json
+from pathlib import Path
+from translation_cache import TranslationCache
+from rate_limit import TokenBucket, backoff_delay, is_rate_limit_error
+from phrase_matcher import PhraseMatcher, remainders, compose
+from table_io import INPUT_FILETYPES, write_table
+from streaming import SAMPLE_ROWS, should_stream, read_csv_sample, stream_translate_csv
+from table_loader import TableLoader, read_preview
+from log_sink import LogSink
+from progress import ProgressReporter, SAMPLE_INTERVAL_MS
+from transliterate import Transliterator, detect_name_columns
+from passthrough import is_passthrough, passthrough_mask
+from lazy_imports import lazy_import, preload
+
+# Loaded in the background once the window is up (see lazy_imports.py)
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+class EnglishToBengaliTranslator:
+    # Precompiled once; used with fullmatch on stripped text both per cell and per column
+    ID_PATTERN = re.compile(r'[0-9\-\s]+')
+    PHONE_PATTERN = re.compile(r'\+?[0-9\-\s\(\)]+')
+    ID_MIN_LENGTH = 4
+    PHONE_MIN_LENGTH = 7
+    DEFAULT_REQUESTS_PER_SECOND = 5.0  # What googletrans tolerates before it starts answering 429
+    NAME_RETRIES = 3
+    CUSTOM_TRANSLATIONS_FILE = 'custom_translations.json'  # Shared with the other front-ends
+    
+    def __init__(self, requests_per_second=DEFAULT_REQUESTS_PER_SECOND):
+        # googletrans client with a keep-alive connection pool, so only the first
+        # call pays for the TLS handshake; created by google_client() on first use
+        self.translator = None
+        self._client_lock = threading.Lock()
+        # Only calls to Google take tokens; dictionary and cache hits run at full speed
+        self.rate_limiter = TokenBucket(requests_per_second)
+        # Translations survive restarts; already-seen text costs no API call
+        self.cache = TranslationCache(source='en', target='bn')
+        # Counts translated values; the GUI samples it instead of being called per value
+        self.progress = ProgressReporter()
+        # Name columns are spelled out offline; set name_fallback to let Google
+        # spell the words the rules aren't sure about
+        self.transliterate_names = True
+        self.name_fallback = False
+        self.transliterator = Transliterator(fallback=self.spell_name_word)
+        
+        # Common translations for frequently used terms
+        self.common_translations = {
+            # Gender/Sex
+            'male': 'পুরুষ',
+            'female': 'মহিলা', 
+            'man': 'পুরুষ',
+            'woman': 'মহিলা',
+            'boy': 'ছেলে',
+            'girl': 'মেয়ে',
+            'mr': 'জনাব',
+            'mrs': 'বেগম',
+            'ms': 'মিস',
+            
+            # Marital Status
+            'married': 'বিবাহিত',
+            'unmarried': 'অবিবাহিত',
+            'single': 'অবিবাহিত',
+            'divorced': 'তালাকপ্রাপ্ত',
+            'widowed': 'বিধবা/বিপত্নীক',
+            
+            # Education
+            'primary': 'প্রাথমিক',
+            'secondary': 'মাধ্যমিক',
+            'higher secondary': 'উচ্চ মাধ্যমিক',
+            'bachelor': 'স্নাতক',
+            'master': 'স্নাতকোত্তর',
+            'phd': 'পিএইচডি',
+            
+            # Occupation
+            'teacher': 'শিক্ষক',
+            'doctor': 'চিকিৎসক',
+            'engineer': 'প্রকৌশলী',
+            'farmer': 'কৃষক',
+            'student': 'ছাত্র/ছাত্রী',
+            'businessman': 'ব্যবসায়ী',
+            'housewife': 'গৃহিণী',
+            
+            # Relationships
+            'father': 'পিতা',
+            'mother': 'মাতা',
+            'son': 'পুত্র',
+            'daughter': 'কন্যা',
+            'husband': 'স্বামী',
+            'wife': 'স্ত্রী',
+            'brother': 'ভাই',
+            'sister': 'বোন',
+            
+            # Common titles
+            'mr.': 'জনাব',
+            'mrs.': 'বেগম',
+            'dr.': 'ডাঃ',
+            'prof.': 'অধ্যাপক',
+        }
+        self.common_translations.update(self.load_custom_translations())
+        
+        # Finds the phrases above inside longer cells, e.g. "father: rahim"
+        self.phrase_matching = True
+        self.phrase_matcher = PhraseMatcher(self.common_translations)
+        
+        # Bengali number mapping
+        self.bengali_numbers = {
+            '0': '০', '1': '১', '2': '২', '3': '৩', '4': '৪',
+            '5': '৫', '6': '৬', '7': '৭', '8': '৮', '9': '৯'
+        }
+        self.bengali_digit_table = str.maketrans(self.bengali_numbers)
+        
+        # Setup logging
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+        
+    def load_custom_translations(self):
+        """Entries saved from the other front-ends' custom dictionary, if any"""
+        try:
+            with open(self.CUSTOM_TRANSLATIONS_FILE, 'r', encoding='utf-8') as f:
+                return {str(k).strip().lower(): v for k, v in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+        except (ValueError, OSError, AttributeError) as e:
+            logging.getLogger(__name__).warning(f"Could not load {self.CUSTOM_TRANSLATIONS_FILE}: {e}")
+            return {}
+    
+    def is_id_number(self, text):
+        """Check if text is likely an ID number (NID, passport, etc.)"""
+        if pd.isna(text):
+            return False
+        text_str = str(text).strip()
+        return len(text_str) >= self.ID_MIN_LENGTH and bool(self.ID_PATTERN.fullmatch(text_str))
+    
+    def is_phone_number(self, text):
+        """Check if text is a phone number"""
+        if pd.isna(text):
+            return False
+        text_str = str(text).strip()
+        return len(text_str) >= self.PHONE_MIN_LENGTH and bool(self.PHONE_PATTERN.fullmatch(text_str))
+    
+    def convert_numbers_to_bengali(self, text):
+        """Convert English numbers to Bengali numbers"""
+        if pd.isna(text):
+            return text
+        
+        return str(text).translate(self.bengali_digit_table)
+    
+    def number_mask(self, series):
+        """Vectorized is_id_number or is_phone_number over a Series of non-null values"""
+        stripped = series.astype(str).str.strip()
+        lengths = stripped.str.len()
+        is_id = stripped.str.fullmatch(self.ID_PATTERN) & (lengths >= self.ID_MIN_LENGTH)
+        is_phone = stripped.str.fullmatch(self.PHONE_PATTERN) & (lengths >= self.PHONE_MIN_LENGTH)
+        return (is_id | is_phone).fillna(False).astype(bool)
+    
+    def convert_series_to_bengali(self, series):
+        """Vectorized convert_numbers_to_bengali: one translate table over the whole Series"""
+        return series.astype(str).str.translate(self.bengali_digit_table)
+    
+    def translate_text(self, text, preserve_numbers=False):
+        """Translate text from English to Bengali"""
+        if pd.isna(text) or text == '':
+            return text
+            
+        text_str = str(text).strip().lower()
+        
+        # Check if it's a number-only field (ID, phone, etc.)
+        if self.is_id_number(text) or self.is_phone_number(text):
+            if preserve_numbers:
+                return self.convert_numbers_to_bengali(text)
+            else:
+                return str(text)
+        
+        # Already Bengali, or nothing a translator would change (emails, dates, codes)
+        if is_passthrough(text):
+            return text
+        
+        # Check common translations first
+        if text_str in self.common_translations:
+            return self.common_translations[text_str]
+        
+        # Check the persistent cache before going to the network
+        cached = self.cache.get(text_str)
+        if cached is not None:
+            return cached
+        
+        # Known phrases inside a longer cell are translated locally; only the
+        # pieces between them go to Google (each through the cache as usual)
+        parts = self.phrase_matcher.split(text) if self.phrase_matching else None
+        if parts is not None:
+            return compose(parts, {piece: self.translate_text(piece) for piece in remainders(parts)})
+        
+        # Names get a few attempts, other text one
+        attempts = self.NAME_RETRIES if re.match(r'^[a-zA-Z\s\.]+$', text_str) else 1
+        translated = self.remote_translate(str(text), attempts)
+        if translated:
+            self.cache.put(text_str, translated, backend='googletrans')
+            return translated
+        return str(text)
+    
+    def spell_name_word(self, word):
+        """Fallback for uncertain name words: Google's spelling, or None to keep the rule-based one"""
+        if not self.name_fallback:
+            return None
+        translated = self.translate_text(word)
+        return translated if translated != word else None
+    
+    def set_requests_per_second(self, requests_per_second):
+        """Change the throughput target for calls to Google"""
+        self.rate_limiter = TokenBucket(requests_per_second)
+    
+    def google_client(self):
+        """The googletrans client; googletrans and httpx are only imported for the first call to Google"""
+        with self._client_lock:
+            if self.translator is None:
+                from http_clients import create_googletrans_client
+                self.translator = create_googletrans_client()
+            return self.translator
+    
+    def remote_translate(self, text, attempts=1):
+        """Rate-limited call to Google with jittered backoff between retries; None on failure"""
+        for attempt in range(attempts):
+            self.rate_limiter.acquire()
+            try:
+                result = self.google_client().translate(text, src='en', dest='bn')
+                if result and result.text:
+                    return result.text
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    # Google pushed back: hold every caller, not just this retry
+                    self.rate_limiter.penalize(backoff_delay(attempt, base=2.0))
+                    continue
+                self.logger.debug(f"Translation attempt {attempt + 1} failed: {e}")
+            if attempt + 1 < attempts:
+                time.sleep(backoff_delay(attempt))
+        return None
+    
+    def normalize_values(self, series):
+        """Vectorized normalization used to group repeated cell values"""
+        return series.astype(str).str.strip().str.lower().str.replace(r'\s+', ' ', regex=True)
+    
+    def process_dataframe(self, df, columns_to_translate, preserve_numbers_in, progress_callback=None,
+                          track_progress=True):
+        """Process DataFrame and translate specified columns
+        
+        Progress goes to self.progress (unless track_progress is False, e.g. when
+        the caller counts streamed rows itself) and to progress_callback if given.
+        """
+        columns = [col for col in columns_to_translate if col in df.columns]
+        name_columns = set(detect_name_columns(df, columns)) if self.transliterate_names else set()
+        
+        # Everything below works on positions, never index labels, so frames with
+        # duplicate or non-integer index labels are handled like any other.
+        # Each column gets one result array (a copy of its values, so NaN cells
+        # stay as they are) that is filled in and assigned back once.
+        results = {}
+        text_cells = {}
+        pending = {}
+        pending_names = {}
+        for col in columns:
+            values = df[col].to_numpy(dtype=object)
+            result = values.copy()
+            positions = np.flatnonzero(~pd.isna(values))
+            non_null = pd.Series(values[positions], dtype=object)
+            
+            # Number stage: ID and phone cells are classified and converted a whole
+            # column at a time and never reach the per-value loop below
+            is_number = self.number_mask(non_null).to_numpy()
+            if is_number.any():
+                as_text = non_null[is_number].astype(str)
+                if col in preserve_numbers_in:
+                    as_text = self.convert_series_to_bengali(as_text)
+                result[positions[is_number]] = as_text.to_numpy()
+            
+            # Passthrough stage: Bengali, empty, email, date and code cells keep
+            # their original value (already in result) and are never queued
+            is_text = ~(is_number | passthrough_mask(non_null).to_numpy())
+            
+            # Dedup stage: collect every distinct normalized value across the selected
+            # columns so each one is translated once, however many cells repeat it
+            non_null = non_null[is_text]
+            keys = self.normalize_values(non_null)
+            results[col] = result
+            text_cells[col] = (positions[is_text], keys)
+            first_seen = ~keys.duplicated()
+            target = pending_names if col in name_columns else pending
+            for key, value in zip(keys[first_seen], non_null[first_seen]):
+                target.setdefault(key, value)
+        
+        # Name stage: person names are transliterated in-process, no network round trip
+        name_translations = {key: self.transliterator.transliterate(value) for key, value in pending_names.items()}
+        
+        total_unique = len(pending)
+        if track_progress:
+            self.progress.start(total=total_unique, unit='values')
+        translations = {}
+        for processed, (key, value) in enumerate(pending.items(), start=1):
+            translations[key] = self.translate_text(value)
+            if track_progress:
+                self.progress.update(processed)
+            
+            if progress_callback:
+                progress = (processed / total_unique) * 100
+                progress_callback(progress, f"Translating unique value {processed}/{total_unique}")
+        
+        # Write back with one vectorized map per column. The output is a shallow
+        # copy, so untouched columns share memory with the input frame and each
+        # translated column is swapped in with a single assignment
+        df_out = df.copy(deep=False)
+        for col in columns:
+            text_positions, keys = text_cells[col]
+            lookup = name_translations if col in name_columns else translations
+            results[col][text_positions] = keys.map(lookup).to_numpy()
+            df_out[col] = results[col]
+        
+        return df_out
+
+
+class TranslatorGUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("English to Bengali Data Translator")
+        self.root.geometry("800x700")
+        self.root.configure(bg='#f0f0f0')
+        
+        # Initialize translator
+        self.translator = EnglishToBengaliTranslator()
+        self.df = None
+        self.file_path = None
+        self.streaming = False  # True when self.df only holds a sample of a large CSV
+        self.loader = None  # Parses the rest of the file in the background; self.df is a preview until it's done
+        self.log_sink = LogSink()
+        self.translating = False  # While True, refresh_progress samples the translator's progress
+        
+        self.setup_gui()
+        self.log_sink.attach(self.log_text)
+        # pandas/numpy load in the background while the window is already usable
+        self.preloader = preload(log=self.log_message)
+        
+    def setup_gui(self):
+        # Title
+        title_frame = tk.Frame(self.root, bg='#2c3e50', height=60)
+        title_frame.pack(fill='x', padx=5, pady=5)
+        title_frame.pack_propagate(False)
+        
+        title_label = tk.Label(title_frame, text="English to Bengali Data Translator", 
+                              font=('Arial', 16, 'bold'), fg='white', bg='#2c3e50')
+        title_label.pack(expand=True)
+        
+        # Main container
+        main_frame = tk.Frame(self.root, bg='#f0f0f0')
+        main_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        # File selection section
+        file_frame = tk.LabelFrame(main_frame, text="File Selection", font=('Arial', 10, 'bold'),
+                                  bg='#f0f0f0', fg='#2c3e50', padx=10, pady=10)
+        file_frame.pack(fill='x', pady=(0, 10))
+        
+        self.file_path_var = tk.StringVar()
+        file_path_frame = tk.Frame(file_frame, bg='#f0f0f0')
+        file_path_frame.pack(fill='x', pady=5)
+        
+        tk.Label(file_path_frame, text="Selected File:", font=('Arial', 9), 
+                bg='#f0f0f0').pack(anchor='w')
+        self.file_path_label = tk.Label(file_path_frame, textvariable=self.file_path_var,
+                                       font=('Arial', 9), bg='white', relief='sunken',
+                                       anchor='w', padx=5, pady=2)
+        self.file_path_label.pack(fill='x', pady=(2, 5))
+        
+        btn_frame = tk.Frame(file_frame, bg='#f0f0f0')
+        btn_frame.pack(fill='x')
+        
+        self.select_btn = tk.Button(btn_frame, text="📁 Select File", command=self.select_file,
+                                   font=('Arial', 10), bg='#3498db', fg='white',
+                                   padx=20, pady=5, cursor='hand2')
+        self.select_btn.pack(side='left', padx=5)
+        
+        self.preview_btn = tk.Button(btn_frame, text="👁 Preview Data", command=self.preview_data,
+                                    font=('Arial', 10), bg='#95a5a6', fg='white',
+                                    padx=20, pady=5, cursor='hand2', state='disabled')
+        self.preview_btn.pack(side='left', padx=5)
+        
+        # Column selection section
+        column_frame = tk.LabelFrame(main_frame, text="Column Selection", font=('Arial', 10, 'bold'),
+                                    bg='#f0f0f0', fg='#2c3e50', padx=10, pady=10)
+        column_frame.pack(fill='both', expand=True, pady=(0, 10))
+        
+        # Create two columns for checkboxes
+        checkbox_main_frame = tk.Frame(column_frame, bg='#f0f0f0')
+        checkbox_main_frame.pack(fill='both', expand=True)
+        
+        # Left frame for translation columns
+        left_frame = tk.Frame(checkbox_main_frame, bg='#f0f0f0')
+        left_frame.pack(side='left', fill='both', expand=True, padx=(0, 10))
+        
+        tk.Label(left_frame, text="Columns to Translate:", font=('Arial', 9, 'bold'),
+                bg='#f0f0f0', fg='#2c3e50').pack(anchor='w', pady=(0, 5))
+        
+        self.translate_frame = tk.Frame(left_frame, bg='#f0f0f0')
+        self.translate_frame.pack(fill='both', expand=True)
+        
+        # Right frame for number conversion columns
+        right_frame = tk.Frame(checkbox_main_frame, bg='#f0f0f0')
+        right_frame.pack(side='right', fill='both', expand=True, padx=(10, 0))
+        
+        tk.Label(right_frame, text="Convert Numbers to Bengali:", font=('Arial', 9, 'bold'),
+                bg='#f0f0f0', fg='#2c3e50').pack(anchor='w', pady=(0, 5))
+        
+        self.numbers_frame = tk.Frame(right_frame, bg='#f0f0f0')
+        self.numbers_frame.pack(fill='both', expand=True)
+        
+        # Translation section
+        translate_frame = tk.LabelFrame(main_frame, text="Translation", font=('Arial', 10, 'bold'),
+                                       bg='#f0f0f0', fg='#2c3e50', padx=10, pady=10)
+        translate_frame.pack(fill='x', pady=(0, 10))
+        
+        # Progress bar
+        self.progress_var = tk.DoubleVar()
+        self.progress_bar = ttk.Progressbar(translate_frame, variable=self.progress_var,
+                                           maximum=100, length=400)
+        self.progress_bar.pack(pady=5)
+        
+        self.progress_label = tk.Label(translate_frame, text="Ready to translate",
+                                      font=('Arial', 9), bg='#f0f0f0')
+        self.progress_label.pack(pady=2)
+        
+        # Throughput target for calls to Google; cached values aren't limited
+        rate_frame = tk.Frame(translate_frame, bg='#f0f0f0')
+        rate_frame.pack(pady=2)
+        tk.Label(rate_frame, text="Max requests/sec:", font=('Arial', 9), bg='#f0f0f0').pack(side='left')
+        self.rate_var = tk.DoubleVar(value=EnglishToBengaliTranslator.DEFAULT_REQUESTS_PER_SECOND)
+        tk.Spinbox(rate_frame, from_=0.5, to=50, increment=0.5, textvariable=self.rate_var,
+                   width=5, font=('Arial', 9)).pack(side='left', padx=5)
+        
+        # Translate button
+        self.translate_btn = tk.Button(translate_frame, text="🔄 Start Translation",
+                                      command=self.start_translation, font=('Arial', 12, 'bold'),
+                                      bg='#27ae60', fg='white', padx=30, pady=8,
+                                      cursor='hand2', state='disabled')
+        self.translate_btn.pack(pady=10)
+        
+        # Log section
+        log_frame = tk.LabelFrame(main_frame, text="Translation Log", font=('Arial', 10, 'bold'),
+                                 bg='#f0f0f0', fg='#2c3e50', padx=10, pady=10)
+        log_frame.pack(fill='x')
+        
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=6, font=('Consolas', 9),
+                                                 bg='#2c3e50', fg='#ecf0f1', insertbackground='white')
+        self.log_text.pack(fill='x', pady=5)
+        
+        # Initialize column checkboxes storage
+        self.translate_checkboxes = {}
+        self.numbers_checkboxes = {}
+        
+    def log_message(self, message):
+        """Queue a message for the log display; safe from the worker thread"""
+        self.log_sink.append(message)
+        
+    def select_file(self):
+        """Open file dialog to select Excel or CSV file"""
+        file_path = filedialog.askopenfilename(
+            title="Select Excel or CSV file",
+            filetypes=INPUT_FILETYPES
+        )
+        
+        if file_path:
+            self.file_path = file_path
+            self.file_path_var.set(os.path.basename(file_path))
+            self.log_message(f"File selected: {os.path.basename(file_path)}")
+            self.preloader.wait()  # Usually long done by the time a file is picked
+            
+            if self.loader:
+                self.loader.cancel()  # Still reading the previous file
+                self.loader = None
+            try:
+                # Load the file
+                self.streaming = False
+                if file_path.endswith('.csv') and should_stream(file_path):
+                    # Too big to hold in memory: keep a sample for the column list and
+                    # preview, the whole file is translated chunk by chunk later
+                    self.df = read_csv_sample(file_path, encoding='utf-8')
+                    self.streaming = True
+                    self.log_message(f"Large file: streaming mode, showing the first {len(self.df)} rows")
+                else:
+                    # CSV, Excel, Parquet or Feather: header and first rows only, so the
+                    # columns and preview show up at once; the rest loads in the background
+                    self.df = read_preview(file_path, encoding='utf-8')
+                    if len(self.df) >= SAMPLE_ROWS:
+                        self.loader = TableLoader(file_path, encoding='utf-8').start()
+                
+                if self.loader:
+                    self.log_message(f"Showing the first {len(self.df)} rows, {len(self.df.columns)} columns; "
+                                     "loading the rest in the background")
+                    self.watch_loader(self.loader)
+                else:
+                    self.log_message(f"File loaded: {len(self.df)} rows, {len(self.df.columns)} columns")
+                self.setup_column_checkboxes()
+                self.preview_btn.config(state='normal')
+                self.translate_btn.config(state='normal')
+                
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load file: {str(e)}")
+                self.log_message(f"Error loading file: {str(e)}")
+    
+    def watch_loader(self, loader):
+        """Show load progress until the background load finishes; then self.df is the whole file"""
+        if loader is not self.loader:
+            return  # Another file was selected since
+        if not loader.done:
+            if not self.translating:
+                snapshot = loader.progress.sample()
+                self.progress_var.set(snapshot.fraction * 100)
+                self.progress_label.config(text=f"Loading file... {ProgressReporter.describe(snapshot)}")
+            self.root.after(SAMPLE_INTERVAL_MS, self.watch_loader, loader)
+            return
+        self.loader = None
+        try:
+            self.df = loader.frame()
+        except Exception as e:
+            self.log_message(f"Error loading file: {str(e)}")
+            if not self.translating:  # A running translation reports the error itself
+                messagebox.showerror("Error", f"Failed to load file: {str(e)}")
+            return
+        self.log_message(f"File loaded: {len(self.df)} rows, {len(self.df.columns)} columns")
+        if not self.translating:
+            self.progress_var.set(0)
+            self.progress_label.config(text="Ready to translate")
+    
+    def setup_column_checkboxes(self):
+        """Create checkboxes for each column"""
+        # Clear existing checkboxes
+        for widget in self.translate_frame.winfo_children():
+            widget.destroy()
+        for widget in self.numbers_frame.winfo_children():
+            widget.destroy()
+            
+        self.translate_checkboxes.clear()
+        self.numbers_checkboxes.clear()
+        
+        # Auto-detect columns likely to need translation
+        likely_translate_columns = []
+        likely_number_columns = []
+        
+        for col in self.df.columns:
+            col_lower = col.lower()
+            if any(keyword in col_lower for keyword in ['name', 'sex', 'gender', 'occupation', 
+                                                      'education', 'marital', 'relation', 'address']):
+                likely_translate_columns.append(col)
+            elif any(keyword in col_lower for keyword in ['age', 'phone', 'mobile', 'number']):
+                likely_number_columns.append(col)
+        
+        # Create translation checkboxes
+        for i, col in enumerate(self.df.columns):
+            var = tk.BooleanVar(value=col in likely_translate_columns)
+            self.translate_checkboxes[col] = var
+            
+            cb = tk.Checkbutton(self.translate_frame, text=col, variable=var,
+                               font=('Arial', 9), bg='#f0f0f0', anchor='w')
+            cb.pack(fill='x', padx=5, pady=1)
+        
+        # Create number conversion checkboxes
+        for i, col in enumerate(self.df.columns):
+            var = tk.BooleanVar(value=col in likely_number_columns)
+            self.numbers_checkboxes[col] = var
+            
+            cb = tk.Checkbutton(self.numbers_frame, text=col, variable=var,
+                               font=('Arial', 9), bg='#f0f0f0', anchor='w')
+            cb.pack(fill='x', padx=5, pady=1)
+    
+    def preview_data(self):
+        """Show preview of the data"""
+        if self.df is not None:
+            preview_window = tk.Toplevel(self.root)
+            preview_window.title("Data Preview")
+            preview_window.geometry("800x400")
+            
+            # Create treeview for data display
+            tree = ttk.Treeview(preview_window)
+            tree.pack(fill='both', expand=True, padx=10, pady=10)
+            
+            # Configure columns
+            tree['columns'] = list(self.df.columns)
+            tree['show'] = 'headings'
+            
+            for col in self.df.columns:
+                tree.heading(col, text=col)
+                tree.column(col, width=100)
+            
+            # Insert data (first 50 rows)
+            for i, row in self.df.head(50).iterrows():
+                tree.insert('', 'end', values=list(row))
+            
+            # Add scrollbars
+            v_scrollbar = ttk.Scrollbar(preview_window, orient='vertical', command=tree.yview)
+            h_scrollbar = ttk.Scrollbar(preview_window, orient='horizontal', command=tree.xview)
+            tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+            
+            v_scrollbar.pack(side='right', fill='y')
+            h_scrollbar.pack(side='bottom', fill='x')
+    
+    def refresh_progress(self):
+        """Show progress, throughput and ETA on the Tk thread, 10 times a second while translating"""
+        if not self.translating:
+            return
+        snapshot = self.translator.progress.sample()
+        self.progress_var.set(snapshot.fraction * 100)
+        if snapshot.total:
+            self.progress_label.config(text=ProgressReporter.describe(snapshot))
+        self.root.after(SAMPLE_INTERVAL_MS, self.refresh_progress)
+    
+    def start_translation(self):
+        """Start the translation process in a separate thread"""
+        # Get selected columns
+        columns_to_translate = [col for col, var in self.translate_checkboxes.items() if var.get()]
+        preserve_numbers_in = [col for col, var in self.numbers_checkboxes.items() if var.get()]
+        
+        if not columns_to_translate:
+            messagebox.showwarning("No Columns Selected", "Please select at least one column to translate.")
+            return
+        
+        try:
+            requests_per_second = self.rate_var.get()
+            if requests_per_second <= 0:
+                raise ValueError
+        except (tk.TclError, ValueError):
+            messagebox.showwarning("Invalid Rate", "Max requests/sec must be a positive number.")
+            return
+        self.translator.set_requests_per_second(requests_per_second)
+        
+        # Disable UI during translation
+        self.translate_btn.config(state='disabled', text="Translating...")
+        self.select_btn.config(state='disabled')
+        
+        # Start translation in separate thread
+        self.translator.progress.start()
+        self.translating = True
+        self.refresh_progress()
+        # Taken here on the Tk thread, where watch_loader swaps it for the full frame
+        thread = threading.Thread(target=self.perform_translation, 
+                                args=(columns_to_translate, preserve_numbers_in, self.loader))
+        thread.daemon = True
+        thread.start()
+    
+    def perform_translation(self, columns_to_translate, preserve_numbers_in, loader=None):
+        """Perform the actual translation"""
+        try:
+            self.log_message("Starting translation process...")
+            self.log_message(f"Translating columns: {', '.join(columns_to_translate)}")
+            
+            base_name = Path(self.file_path).stem
+            extension = Path(self.file_path).suffix
+            if extension.lower() == '.xls':
+                extension = '.xlsx'  # Old-style .xls can't be written
+            output_path = Path(self.file_path).parent / f"{base_name}_bengali{extension}"
+            
+            if self.streaming:
+                # Translate and append one chunk at a time; the file is never fully in memory
+                # Rows are counted here; the total is estimated from how much of the file was read
+                self.translator.progress.start(unit='rows')
+                
+                def chunk_progress(rows_done, fraction):
+                    self.translator.progress.update(rows_done, round(rows_done / fraction) if fraction else None)
+                    self.log_message(f"Translated {rows_done} rows")
+                
+                rows_done = stream_translate_csv(
+                    self.file_path, output_path,
+                    lambda chunk: self.translator.process_dataframe(chunk, columns_to_translate, preserve_numbers_in,
+                                                                    track_progress=False),
+                    progress_callback=chunk_progress, encoding='utf-8'
+                )
+                self.log_message(f"Streamed {rows_done} rows")
+            elif loader and not loader.done:
+                # The file is still being parsed: translate the chunks loaded so far
+                # and pick up the others as they come in
+                self.translator.progress.start(unit='rows')
+                translated_chunks = []
+                rows_done = 0
+                for chunk in loader.chunks():
+                    translated_chunks.append(self.translator.process_dataframe(
+                        chunk, columns_to_translate, preserve_numbers_in, track_progress=False))
+                    rows_done += len(chunk)
+                    self.translator.progress.update(rows_done, max(loader.progress.total, rows_done))
+                translated_df = pd.concat(translated_chunks)
+            else:
+                # Process the dataframe
+                translated_df = self.translator.process_dataframe(
+                    loader.frame() if loader else self.df, columns_to_translate, preserve_numbers_in
+                )
+            
+            if not self.streaming:
+                # Save the file in the input's format; Excel is written row by row
+                write_table(translated_df, output_path)
+            
+            self.log_message(f"Translation completed successfully!")
+            self.log_message(f"Output saved as: {output_path.name}")
+            
+            # Show completion message
+            self.root.after(0, lambda: messagebox.showinfo(
+                "Translation Complete", 
+                f"Translation completed successfully!\nOutput saved as: {output_path.name}"
+            ))
+            
+        except Exception as e:
+            error_msg = f"Translation failed: {str(e)}"
+            self.log_message(error_msg)
+            self.root.after(0, lambda: messagebox.showerror("Translation Error", error_msg))
+        
+        finally:
+            # Re-enable UI
+            self.root.after(0, self.reset_ui)
+    
+    def reset_ui(self):
+        """Reset UI after translation"""
+        self.translating = False
+        self.translate_btn.config(state='normal', text="🔄 Start Translation")
+        self.select_btn.config(state='normal')
+        self.progress_var.set(0)
+        self.progress_label.config(text="Ready to translate")
+
+
+def main():
+    # Create and run the GUI
+    root = tk.Tk()
+    app = TranslatorGUI(root)
+    
+    # Center the window
+    root.update_idletasks()
+    width = root.winfo_width()
+    height = root.winfo_height()
+    x = (root.winfo_screenwidth() // 2) - (width // 2)
+    y = (root.winfo_screenheight() // 2) - (height // 2)
+    root.geometry(f"{width}x{height}+{x}+{y}")
+    
+    root.mainloop()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""Pooled, keep-alive HTTP connections for the translation backends.
+
+deep_translator calls requests.get() for every translation, which sets up
+a new TCP + TLS connection each time; for a short name the handshake is
+most of the latency. install_session_pools() points deep_translator's
+Google and MyMemory modules at one requests.Session per worker thread and
+backend, so connections stay open for the whole job. googletrans already
+talks through an httpx client; create_googletrans_client() sizes its
+connection pool, sets timeouts and turns on HTTP/2 when the h2 package is
+installed (requests itself only speaks HTTP/1.1).
+"""
+import importlib
+import importlib.util
+import inspect
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CONNECT_TIMEOUT = 5.0  # Seconds
+READ_TIMEOUT = 30.0
+KEEPALIVE_EXPIRY = 60.0  # Idle seconds before a pooled connection is dropped (httpx)
+POOL_CONNECTIONS = 4  # Hosts one session keeps pools for (service host, redirects)
+POOL_MAXSIZE = 2  # Connections per host and session; each session serves one thread
+HTTP2 = importlib.util.find_spec('h2') is not None
+
+# deep_translator modules that call requests.get -> the backend they belong to
+DEEP_TRANSLATOR_MODULES = {
+    'deep_translator.google': 'GoogleTranslator',
+    'deep_translator.mymemory': 'MyMemoryTranslator',
+}
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with a default timeout, since deep_translator passes none."""
+
+    def __init__(self, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=timeout if timeout is not None else self.timeout, **kwargs)
+
+
+def make_session(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                 timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)):
+    session = requests.Session()
+    # Retries are left to the engine's backoff, which knows about rate limits
+    adapter = TimeoutHTTPAdapter(timeout=timeout, pool_connections=pool_connections,
+                                 pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class SessionPool:
+    """One Session per (thread, backend); requests.Session isn't meant to be shared across threads.
+
+    Sessions are kept per thread, and those of threads that have ended are
+    closed as new ones are made, so short-lived worker pools don't pile up
+    open connections until close().
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = {}  # Thread -> the sessions it made
+
+    def session(self, backend):
+        sessions = getattr(self._local, 'sessions', None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        session = sessions.get(backend)
+        if session is None:
+            session = sessions[backend] = make_session()
+            with self._lock:
+                self._sessions.setdefault(threading.current_thread(), []).append(session)
+                finished = [thread for thread in self._sessions if not thread.is_alive()]
+                stale = [old for thread in finished for old in self._sessions.pop(thread)]
+            for old in stale:
+                old.close()
+        return session
+
+    def close(self):
+        """Close every session; threads that go on get fresh ones."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+            self._local = threading.local()
+        for thread_sessions in sessions.values():
+            for session in thread_sessions:
+                session.close()
+
+
+session_pool = SessionPool()
+
+
+class _PooledRequests:
+    """Stands in for the requests module inside a deep_translator module."""
+
+    def __init__(self, backend):
+        self._backend = backend
+
+    def get(self, url, **kwargs):
+        return session_pool.session(self._backend).get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return session_pool.session(self._backend).post(url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)  # exceptions, codes, ...
+
+
+_install_lock = threading.Lock()
+
+
+def install_session_pools():
+    """Route deep_translator's HTTP calls through session_pool. Safe to call repeatedly."""
+    with _install_lock:
+        for module_name, backend in DEEP_TRANSLATOR_MODULES.items():
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                continue
+            if getattr(module, 'requests', None) is requests:
+                module.requests = _PooledRequests(backend)
+
+
+def create_googletrans_client(max_connections=4):
+    """googletrans Translator whose httpx client keeps up to max_connections alive."""
+    from googletrans import Translator
+
+    # googletrans 3.x has neither option, 4.x takes both
+    accepted = inspect.signature(Translator).parameters
+    options = {'timeout': READ_TIMEOUT, 'http2': HTTP2}
+    translator = Translator(**{key: value for key, value in options.items() if key in accepted})
+
+    client = getattr(translator, 'client', None)
+    if client is None or not hasattr(client, 'headers'):
+        return translator
+    import httpx
+    if not hasattr(httpx, 'Limits'):
+        return translator  # httpx 0.13 (what googletrans 4.0.0rc1 pins) has no Limits to tune
+
+    # Same headers (user agent, referer), but a pool sized for the backend's concurrency
+    tuned = httpx.Client(
+        http2=HTTP2, headers=client.headers,
+        timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                            keepalive_expiry=KEEPALIVE_EXPIRY))
+    translator.client = tuned
+    token_acquirer = getattr(translator, 'token_acquirer', None)
+    if token_acquirer is not None and getattr(token_acquirer, 'client', None) is client:
+        token_acquirer.client = tuned
+    client.close()
+    return translator
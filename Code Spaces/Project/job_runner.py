@@ -0,0 +1,302 @@
+"""Batch translation of many files, and of every sheet in them, with one engine.
+
+    python job_runner.py monthly/ -o monthly_bn/
+    python job_runner.py "reports/2024-*.xlsx" -c Name Address -p Phone --report summary.json
+
+Inputs are files, directories (the CSV/Excel/Parquet/Feather files in
+them) or glob patterns. Every sheet of a workbook is translated, not just
+the first, and the output keeps them together in one workbook per input.
+
+All sheets go through one TranslationEngine, so they share its worker
+threads and backend connections as well as the session and persistent
+translation caches: a value repeated across the monthly files is sent to
+a backend once per batch instead of once per file. Sheets are translated
+one after another, each with the whole worker pool, while a small I/O
+pool reads the next sheets ahead and writes the finished files. CSVs
+above the streaming threshold are streamed chunk by chunk as in
+translate_cli.py.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from async_engine import DEFAULT_BATCH_CHARS, DEFAULT_CONCURRENCY
+from backends import DEFAULT_BACKENDS
+from streaming import should_stream
+from table_io import SUPPORTED_EXTENSIONS, extension, read_table, sheet_names, write_sheets
+from translation_cache import DEFAULT_CACHE_PATH
+from translation_engine import CSV_READ_OPTIONS, CUSTOM_TRANSLATIONS_FILE, TranslationEngine
+from translate_cli import default_output_path
+
+READ_AHEAD = 2  # Sheets loaded while the current one is translated
+
+Sheet = namedtuple('Sheet', 'path name')
+
+
+def is_output_file(path):
+    """Outputs of an earlier run and Office lock files, which a directory input shouldn't pick up."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return name.startswith('~$') or name.endswith('_translated')
+
+
+def expand_inputs(inputs, log=None):
+    """Supported files named by `inputs` (files, directories or glob patterns), sorted and without repeats.
+
+    Earlier outputs and lock files are left out of directories and glob
+    matches; a file named on its own is always taken if its format is supported.
+    """
+    paths = []
+    for pattern in inputs:
+        if os.path.isfile(pattern):
+            if extension(pattern) in SUPPORTED_EXTENSIONS:
+                paths.append(os.path.abspath(pattern))
+            elif log:
+                log(f"Skipping {pattern}: not a CSV, Excel, Parquet or Feather file", "warning")
+            continue
+        if os.path.isdir(pattern):
+            candidates = [os.path.join(pattern, name) for name in sorted(os.listdir(pattern))]
+        else:
+            candidates = sorted(glob.glob(pattern, recursive=True))
+        paths.extend(os.path.abspath(path) for path in candidates
+                     if os.path.isfile(path) and extension(path) in SUPPORTED_EXTENSIONS
+                     and not is_output_file(path))
+    return list(dict.fromkeys(paths))
+
+
+def output_path_for(input_path, output_dir=None):
+    path = default_output_path(input_path)
+    return os.path.join(output_dir, os.path.basename(path)) if output_dir else path
+
+
+def select_columns(frame_columns, columns):
+    return list(frame_columns) if columns is None else [col for col in columns if col in frame_columns]
+
+
+def run_batch(engine, paths, output_dir=None, columns=None, preserve_number_columns=(), read_ahead=READ_AHEAD,
+              skip_existing=False, should_cancel=None):
+    """Translate every sheet of every file in `paths`; returns the summary report (a dict).
+
+    columns=None translates all columns of each sheet; otherwise the ones a
+    sheet has (sheets with none of them are copied as they are).
+    """
+    log = engine.log
+    cancelled = should_cancel or (lambda: False)
+    started = time.time()
+    engine.reset_stats()
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    files = []
+    sheets = []
+    streamed = []
+    outputs = set()
+    for path in paths:
+        output = output_path_for(path, output_dir)
+        if output in outputs:
+            # Same file name in two input directories, one output directory
+            folder, name = os.path.split(output)
+            output = os.path.join(folder, f"{os.path.basename(os.path.dirname(path))}_{name}")
+        outputs.add(output)
+        entry = {'input': path, 'output': output, 'sheets': [], 'status': 'pending'}
+        files.append(entry)
+        if skip_existing and os.path.exists(entry['output']):
+            entry['status'] = 'skipped'
+            continue
+        if extension(path) == '.csv' and should_stream(path):
+            if extension(entry['output']) != '.csv':
+                entry['output'] = os.path.splitext(entry['output'])[0] + '.csv'
+            streamed.append(entry)
+            continue
+        try:
+            names = sheet_names(path)
+        except Exception as e:
+            entry.update(status='failed', error=str(e))
+            log(f"Could not open {path}: {e}", "error")
+            continue
+        entry['expected_sheets'] = len(names)
+        sheets.extend((entry, Sheet(path, name)) for name in names)
+    log(f"{len(paths)} files, {len(sheets)} sheets to translate"
+        + (f", {len(streamed)} large CSVs to stream" if streamed else "") + ".")
+
+    def load(sheet):
+        options = dict(CSV_READ_OPTIONS)
+        if sheet.name is not None:
+            options['sheet_name'] = sheet.name
+        return read_table(sheet.path, **options)
+
+    def save(entry, translated):
+        entry['outputs'] = write_sheets(translated, entry['output'])
+        entry['status'] = 'done'
+        log(f"Saved {entry['output']}")
+
+    with ThreadPoolExecutor(max_workers=max(1, read_ahead), thread_name_prefix="batch-io") as io_pool, \
+            engine.batch() as remote:
+        queued = deque()
+        upcoming = iter(sheets)
+
+        def fill_queue():
+            # Keeps up to read_ahead sheets loading behind the one being translated
+            while len(queued) < max(1, read_ahead):
+                entry, sheet = next(upcoming, (None, None))
+                if sheet is None:
+                    return
+                queued.append((entry, sheet, io_pool.submit(load, sheet)))
+
+        writes = []
+        translated = {}  # Sheets of the current file, until its last one is done
+        fill_queue()
+        while queued and not cancelled():
+            entry, sheet, future = queued.popleft()
+            fill_queue()
+            label = os.path.basename(sheet.path) + (f" [{sheet.name}]" if sheet.name is not None else "")
+            if entry['status'] == 'failed':
+                continue  # An earlier sheet of this file failed; the file isn't written
+            try:
+                df = future.result()
+                sheet_columns = select_columns(df.columns, columns)
+                api_calls_before = engine.api_calls
+                sheet_started = time.time()
+                if sheet_columns:
+                    log(f"Translating {label}: {len(df)} rows, {len(sheet_columns)} columns")
+                    df = engine.translate_dataframe(
+                        df, sheet_columns, [col for col in preserve_number_columns if col in df.columns],
+                        should_cancel=should_cancel, remote=remote)
+                else:
+                    log(f"{label}: none of the selected columns, copied as is", "warning")
+            except Exception as e:
+                entry.update(status='failed', error=f"{label}: {e}")
+                translated.pop(entry['input'], None)
+                log(f"Translation of {label} failed: {e}", "error")
+                continue
+            entry['sheets'].append({
+                'sheet': sheet.name, 'rows': len(df), 'columns': sheet_columns,
+                'seconds': round(time.time() - sheet_started, 2),
+                'api_calls': engine.api_calls - api_calls_before,
+            })
+            translated.setdefault(entry['input'], {})[sheet.name or 'Sheet1'] = df
+            if len(entry['sheets']) == entry['expected_sheets'] and not cancelled():
+                # Last sheet of the file: written on the I/O pool while the next file is translated
+                writes.append((entry, io_pool.submit(save, entry, translated.pop(entry['input']))))
+
+        for entry, future in writes:
+            try:
+                future.result()
+            except Exception as e:
+                entry.update(status='failed', error=f"saving: {e}")
+                log(f"Could not save {entry['output']}: {e}", "error")
+
+    # Streamed files open their own remote, after the shared one is closed; the caches are still shared
+    for entry in streamed:
+        if cancelled():
+            break
+        log(f"Streaming {os.path.basename(entry['input'])}")
+        try:
+            stream_columns = columns
+            if stream_columns is None:
+                stream_columns = list(read_table(entry['input'], nrows=0, **CSV_READ_OPTIONS).columns)
+            rows = engine.translate_csv_stream(entry['input'], entry['output'], stream_columns,
+                                               preserve_number_columns, should_cancel=should_cancel)
+            entry['sheets'].append({'sheet': None, 'rows': rows, 'columns': stream_columns, 'streamed': True})
+            entry['status'] = 'done'
+        except Exception as e:
+            entry.update(status='failed', error=str(e))
+            log(f"Streaming {entry['input']} failed: {e}", "error")
+
+    if cancelled():
+        for entry in files:
+            if entry['status'] == 'pending':
+                entry['status'] = 'cancelled'
+    else:
+        engine.save_custom_translations() # Auto-save newly learned translations
+    engine.export_metrics()
+    for entry in files:
+        entry.pop('expected_sheets', None)
+    return {
+        'files': files,
+        'sheets': sum(len(entry['sheets']) for entry in files),
+        'rows': sum(sheet['rows'] for entry in files for sheet in entry['sheets']),
+        'failed': sum(entry['status'] == 'failed' for entry in files),
+        'seconds': round(time.time() - started, 1),
+        'cache_hits': engine.cache_hits,
+        'api_calls': engine.api_calls,
+        'backends': engine.backend_stats,
+    }
+
+
+def print_report(report):
+    header = f"{'file':<40}{'status':<11}{'sheets':>7}{'rows':>10}{'API calls':>11}"
+    print(header)
+    print('-' * len(header))
+    for entry in report['files']:
+        api_calls = sum(sheet.get('api_calls', 0) for sheet in entry['sheets'])
+        print(f"{os.path.basename(entry['input'])[:39]:<40}{entry['status']:<11}{len(entry['sheets']):>7}"
+              f"{sum(sheet['rows'] for sheet in entry['sheets']):>10}{api_calls:>11}")
+        if entry.get('error'):
+            print(f"    {entry['error']}")
+    print(f"{report['sheets']} sheets, {report['rows']} rows in {report['seconds']}s; "
+          f"cache hits: {report['cache_hits']}, API calls: {report['api_calls']}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Translate every sheet of many CSV/Excel files from English to Bangla with one shared cache.")
+    parser.add_argument('inputs', nargs='+', help="Files, directories or glob patterns (quote them)")
+    parser.add_argument('-o', '--output-dir', help="Where the outputs go (default: next to each input)")
+    parser.add_argument('-c', '--columns', nargs='+', help="Columns to translate where a sheet has them (default: all)")
+    parser.add_argument('-p', '--preserve-numbers', nargs='+', default=[], metavar='COLUMN',
+                        help="Columns whose ID/phone numbers are converted to Bengali digits")
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Parallel translation requests, shared by all files (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument('-j', '--processes', type=int, default=1,
+                        help="Worker processes for dictionary/number work on big sheets, 0 for one per core (default: 1)")
+    parser.add_argument('--backends', nargs='+', default=list(DEFAULT_BACKENDS), choices=DEFAULT_BACKENDS,
+                        help="Translation services to use")
+    parser.add_argument('--batch-chars', type=int, default=DEFAULT_BATCH_CHARS,
+                        help="Characters per batched request, 0 for one text per request")
+    parser.add_argument('--read-ahead', type=int, default=READ_AHEAD,
+                        help=f"Sheets loaded ahead of the one being translated (default: {READ_AHEAD})")
+    parser.add_argument('--skip-existing', action='store_true', help="Leave out inputs whose output already exists")
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help="Persistent translation cache file")
+    parser.add_argument('--custom-dict', default=CUSTOM_TRANSLATIONS_FILE, help="Custom translations JSON file")
+    parser.add_argument('--report', metavar='FILE', help="Write the summary report here as JSON")
+    parser.add_argument('--metrics', metavar='FILE',
+                        help="Write job metrics here (.json, anything else gets Prometheus text format)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Only print errors and the final summary")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    def log(message, level="info"):
+        if not args.quiet or level in ("warning", "error"):
+            print(f"[{level.upper()}] {message}", file=sys.stderr)
+
+    paths = expand_inputs(args.inputs, log)
+    if not paths:
+        print("No CSV, Excel, Parquet or Feather files found.", file=sys.stderr)
+        return 2
+
+    engine = TranslationEngine(args.backends, concurrency=args.workers, batch_chars=args.batch_chars,
+                               cache_path=args.cache, custom_translations_path=args.custom_dict, log=log,
+                               local_workers=args.processes or os.cpu_count() or 1, metrics_path=args.metrics)
+    try:
+        report = run_batch(engine, paths, args.output_dir, args.columns, args.preserve_numbers,
+                           read_ahead=args.read_ahead, skip_existing=args.skip_existing)
+    finally:
+        engine.close()
+
+    print_report(report)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+    return 1 if report['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
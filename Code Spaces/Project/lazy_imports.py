@@ -0,0 +1,122 @@
+"""Deferred imports of the heavy libraries, so the windows show up first.
+
+pandas and numpy (and the translation clients with their HTTP stacks)
+take seconds to import on a slow machine, and every front-end used to pay
+for all of them before drawing anything. Modules now bind pandas/numpy
+with lazy_import(): the name exists at once, but the library only runs on
+first attribute access (importlib.util.LazyLoader). The translation
+clients are imported where a backend is created. A GUI starts a Preloader
+right after its window is up, which makes that first access on a
+background thread, and calls wait() before it first touches the data.
+
+Note that a plain `import pandas` anywhere loads it on the spot, so
+modules on the GUI start-up path must use lazy_import() instead.
+
+import_report() is `python -X importtime` for the front-ends; see
+`python benchmark.py --import-times`.
+"""
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import time
+
+HEAVY_MODULES = ('numpy', 'pandas')  # What a Preloader loads by default
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def lazy_import(name):
+    """Module `name`, executed on first attribute access instead of now."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class Preloader:
+    """Loads lazily imported modules on a daemon thread.
+
+    Call wait() before the first use of any of them from another thread:
+    a module LazyLoader is still executing must not be touched concurrently.
+    """
+
+    def __init__(self, modules=HEAVY_MODULES, log=None):
+        self.modules = modules
+        self.log = log
+        self.timings = {}  # Module -> seconds
+        self.error = None
+        self._done = threading.Event()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def start(self):
+        threading.Thread(target=self._run, name="preload", daemon=True).start()
+        return self
+
+    def _run(self):
+        try:
+            for name in self.modules:
+                started = time.perf_counter()
+                getattr(lazy_import(name), '__name__')  # Any attribute access runs the module
+                self.timings[name] = time.perf_counter() - started
+            if self.log:
+                self.log("Libraries loaded: " + ", ".join(f"{name} {seconds:.2f}s"
+                                                          for name, seconds in self.timings.items()))
+        except Exception as e:
+            self.error = e
+            if self.log:
+                self.log(f"Could not load {name}: {e}")
+        finally:
+            self._done.set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+
+def preload(modules=HEAVY_MODULES, log=None):
+    return Preloader(modules, log).start()
+
+
+def import_report(statement, cwd=HERE):
+    """Run `statement` in a fresh interpreter under -X importtime.
+
+    Returns (module, self_us, cumulative_us, depth) per imported module, in
+    import order; depth 0 are the modules the statement imported itself.
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                               cwd=cwd, capture_output=True, text=True)
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The column header
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        rows.append((stripped, int(fields[0]), int(fields[1]), (len(name) - len(stripped) - 1) // 2))
+    if completed.returncode:
+        # Timings of an import that stopped half-way would look like a fast start-up
+        errors = [line for line in completed.stderr.splitlines() if not line.startswith('import time:')]
+        raise RuntimeError(errors[-1] if errors else f"{statement} failed")
+    return rows
+
+
+def format_import_report(rows, top=15):
+    """Total import time plus the modules that took longest themselves."""
+    total = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+    lines = [f"{total / 1e6:.3f}s in {len(rows)} modules"]
+    for name, self_us, cumulative, _ in sorted(rows, key=lambda row: row[1], reverse=True)[:top]:
+        lines.append(f"  {self_us / 1e3:9.1f} ms  (cumulative {cumulative / 1e3:9.1f} ms)  {name}")
+    return "\n".join(lines)
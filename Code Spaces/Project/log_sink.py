@@ -0,0 +1,80 @@
+"""Bounded log buffer between worker threads and a Tk text widget.
+
+Tk widgets may only be touched from the thread running mainloop, and one
+insert + update_idletasks per message made the GUI thread the bottleneck
+on big sheets. Workers append to a ring buffer instead (deque appends are
+atomic, no lock needed); the Tk thread drains it on an after() timer with
+one insert per tick and trims the widget to a fixed number of lines, so
+a long run doesn't grow the Text widget without bound.
+"""
+from collections import deque
+import tkinter as tk
+
+DEFAULT_CAPACITY = 5000  # Messages kept between two drains; older ones are dropped
+DEFAULT_MAX_LINES = 2000  # Lines kept in the widget
+DEFAULT_INTERVAL_MS = 100
+
+
+class LogSink:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._buffer = deque(maxlen=capacity)
+        self.widget = None
+
+    def append(self, message):
+        """Queue one message; safe from any thread."""
+        self._buffer.append(message)
+
+    def drain(self):
+        """Take every queued message, oldest first."""
+        messages = []
+        try:
+            while True:
+                messages.append(self._buffer.popleft())
+        except IndexError:
+            return messages
+
+    def discard(self):
+        """Drop queued messages that haven't been shown yet."""
+        self._buffer.clear()
+
+    def attach(self, widget, interval_ms=DEFAULT_INTERVAL_MS, max_lines=DEFAULT_MAX_LINES):
+        """Start draining into a Text/ScrolledText widget every interval_ms (call from the Tk thread)."""
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self.max_lines = max_lines
+        self._tick()
+        return self
+
+    def _tick(self):
+        try:
+            self.flush()
+            self.widget.after(self.interval_ms, self._tick)
+        except tk.TclError:
+            pass  # Widget destroyed (window closed): stop draining
+
+    def flush(self):
+        """Write queued messages to the attached widget now (Tk thread only)."""
+        messages = self.drain()
+        if not messages or self.widget is None:
+            return
+        widget = self.widget
+        # Only follow the output if the user hasn't scrolled up to read something
+        at_bottom = widget.yview()[1] >= 0.999
+        state = widget.cget('state')
+        widget.configure(state='normal')
+        widget.insert('end', '\n'.join(messages[-self.max_lines:]) + '\n')
+        lines = int(widget.index('end-1c').split('.')[0]) - 1
+        if lines > self.max_lines:
+            widget.delete('1.0', f"{lines - self.max_lines + 1}.0")
+        widget.configure(state=state)
+        if at_bottom:
+            widget.see('end')
+
+    def clear(self):
+        """Empty the attached widget and drop queued messages (Tk thread only)."""
+        self.discard()
+        if self.widget is not None:
+            state = self.widget.cget('state')
+            self.widget.configure(state='normal')
+            self.widget.delete('1.0', 'end')
+            self.widget.configure(state=state)
@@ -0,0 +1,189 @@
+"""Thread-safe counters, gauges and histograms for translation jobs.
+
+Worker threads, the engine's event loop and the Tk thread all record into
+one Metrics object; every update takes the same lock. A snapshot can be
+written as JSON or in the Prometheus text format (pick by file extension),
+once at the end of a job and periodically by a MetricsExporter while it runs.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds of the histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)  # Seconds
+SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250)  # Texts per request
+DEFAULT_EXPORT_INTERVAL = 10.0  # Seconds between periodic exports
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            index = len(self.buckets)
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def as_dict(self):
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            running += count
+            cumulative.append((bound, running))
+        return {'buckets': cumulative, 'sum': round(self.sum, 6), 'count': self.count}
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(label_key, extra=()):
+    pairs = list(label_key) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (key + '="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+               for key, value in pairs)
+    return '{' + ','.join(escaped) + '}'
+
+
+class Metrics:
+    """Named, labelled counters, gauges and histograms.
+
+        metrics.inc('translator_api_calls_total')
+        metrics.observe('translator_request_seconds', 0.4, backend='googletrans')
+        with metrics.timer('save'):
+            ...
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}  # name -> {label key: value}
+        self._gauges = {}
+        self._histograms = {}
+        self.started = time.time()
+
+    def inc(self, name, amount=1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def set_gauge(self, name, value, **labels):
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram(buckets)
+            series[key].observe(value)
+
+    @contextmanager
+    def timer(self, stage):
+        """Add the wall time of the block to translator_stage_seconds_total{stage=...}."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.inc('translator_stage_seconds_total', time.perf_counter() - started, stage=stage)
+
+    def total(self, name, **label_filter):
+        """Sum of a counter over every label set that matches label_filter."""
+        wanted = set(_label_key(label_filter))
+        with self._lock:
+            return sum(value for key, value in self._counters.get(name, {}).items() if wanted <= set(key))
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self.started = time.time()
+
+    def snapshot(self):
+        """Plain-dict copy of every metric, for JSON export or logging."""
+        def series(values, convert=lambda value: value):
+            return [{'labels': dict(key), 'value': convert(value)} for key, value in values.items()]
+
+        with self._lock:
+            return {
+                'started': self.started,
+                'exported': time.time(),
+                'counters': {name: series(values) for name, values in self._counters.items()},
+                'gauges': {name: series(values) for name, values in self._gauges.items()},
+                'histograms': {name: series(values, Histogram.as_dict) for name, values in self._histograms.items()},
+            }
+
+    def to_prometheus(self):
+        lines = []
+        with self._lock:
+            for kind, metrics in (('counter', self._counters), ('gauge', self._gauges)):
+                for name, values in sorted(metrics.items()):
+                    lines.append(f"# TYPE {name} {kind}")
+                    lines.extend(f"{name}{_format_labels(key)} {value}" for key, value in values.items())
+            for name, values in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in values.items():
+                    for bound, count in histogram.as_dict()['buckets']:
+                        lines.append(f"{name}_bucket{_format_labels(key, [('le', str(bound))])} {count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path):
+        """Write the metrics to `path`: JSON for .json, Prometheus text otherwise.
+
+        Written to a temporary file first, so a scraper never reads half a file.
+        """
+        if path.lower().endswith('.json'):
+            content = json.dumps(self.snapshot(), indent=2, ensure_ascii=False)
+        else:
+            content = self.to_prometheus()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+
+class MetricsExporter:
+    """Exports a Metrics object every `interval` seconds until stopped, then once more."""
+
+    def __init__(self, metrics, path, interval=DEFAULT_EXPORT_INTERVAL, log=None):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self.log = log or (lambda message, level="info": None)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+
+    def _export(self):
+        try:
+            self.metrics.export(self.path)
+        except OSError as e:
+            self.log(f"Could not write metrics to {self.path}: {e}", "warning")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._export()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._export()
@@ -0,0 +1,47 @@
+"""Cells that are copied to the output instead of translated.
+
+Mixed-language sheets are largely Bengali already, and emails, dates,
+codes and lone punctuation come back from a backend unchanged (or worse)
+after costing a request. passthrough_mask() finds them for a whole column
+with vectorized string operations, so only the rest reaches the
+translation queue:
+
+- empty and NA cells
+- cells without a single Latin letter (a script check that covers Bengali
+  text, numbers and punctuation)
+- emails, URLs, dates and codes like "AB-1234" (precompiled patterns below)
+"""
+import re
+
+from lazy_imports import lazy_import
+
+pd = lazy_import('pandas')  # Loaded on first use, see lazy_imports.py
+
+LATIN_LETTER = re.compile(r'[A-Za-z]')
+EMAIL = r'[\w.+\-]+@[\w\-]+(?:\.[\w\-]+)+'
+URL = r'(?:https?://|www\.)\S+'
+MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+DATE = (r'\d{1,4}[\-/.]\d{1,2}[\-/.]\d{1,4}(?:[ T]\d{1,2}:\d{2}(?::\d{2})?)?'
+        rf'|\d{{1,2}}[\-/ ]{MONTH}[\-/ ,]+\d{{2,4}}'
+        rf'|{MONTH} \d{{1,2}},? \d{{4}}')
+CODE = r'(?=[^\s]*\d)[A-Za-z0-9]+(?:[\-_/.#][A-Za-z0-9]+)*'  # One "word" with at least one digit
+PASSTHROUGH = re.compile(rf'(?:{EMAIL}|{URL}|{DATE}|{CODE})', re.IGNORECASE)
+
+
+def is_passthrough(text):
+    """Scalar version of passthrough_mask, for code that works cell by cell."""
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return True
+    text = str(text).strip()
+    return not text or not LATIN_LETTER.search(text) or bool(PASSTHROUGH.fullmatch(text))
+
+
+def passthrough_mask(values):
+    """Boolean Series (positional index) marking the cells of a column that need no translation."""
+    series = pd.Series(values, dtype=object).reset_index(drop=True)
+    missing = series.isna()
+    text = series.where(~missing, '').astype(str).str.strip()
+    mask = missing | (text == '')
+    mask |= ~text.str.contains(LATIN_LETTER)
+    mask |= text.str.fullmatch(PASSTHROUGH).fillna(False).astype(bool)
+    return mask
@@ -0,0 +1,159 @@
+"""Dictionary phrase lookup inside longer cells.
+
+The common/custom dictionaries only ever matched whole cells, so an address
+like "house 12, road 5, dhaka" went to a translation service even though
+every word in it is in the dictionary. PhraseMatcher compiles all phrases
+into one Aho-Corasick automaton and finds them in a single pass over the
+cell. Matches must sit on word boundaries and the longest leftmost match
+wins. Only the pieces in between that contain letters still need a backend.
+
+Only multi-word phrases and the single words in EMBEDDED_WORDS are looked
+for inside cells. Generic words ("no", "present", "time") mean something
+else in the middle of a sentence or a name ("House No. 12", "Present
+address", "Time Square Tower"), and cutting them out would also send the
+rest of the cell to the backend without its context; they still match
+whole cells through the dictionary lookup.
+"""
+import re
+from collections import deque
+
+# Single words that mean the same wherever they appear in an address or a
+# name cell: address parts, place names and relationship terms
+EMBEDDED_WORDS = frozenset({
+    'house', 'flat', 'building', 'road', 'street', 'village', 'union', 'ward', 'thana', 'upazila',
+    'district', 'division', 'bangladesh', 'dhaka', 'chittagong', 'sylhet', 'rajshahi', 'khulna',
+    'barisal', 'rangpur', 'mymensingh',
+    'father', 'mother', 'husband', 'wife', 'son', 'daughter', 'guardian', 'nominee',
+})
+
+# Leading and trailing punctuation/space stay outside the piece sent to a backend
+_PADDING = re.compile(r'^(\W*)(.*?)(\W*)$', re.DOTALL)
+
+
+def _normalize(text):
+    return ' '.join(str(text).lower().split())
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over the (lowercase) keys of a phrase -> translation dict.
+
+    Single-word keys are only taken if they are in embedded_words.
+    """
+
+    def __init__(self, phrases, embedded_words=EMBEDDED_WORDS):
+        self.translations = {}
+        self._goto = [{}]  # state -> {char: next state}
+        self._fail = [0]
+        self._outputs = [[]]  # state -> lengths of the phrases ending here, incl. via fail links
+        for phrase, translation in phrases.items():
+            phrase = _normalize(phrase)
+            if phrase and translation and (' ' in phrase or phrase in embedded_words):
+                self._add(phrase)
+                self.translations[phrase] = translation
+        self._link()
+
+    def _add(self, phrase):
+        state = 0
+        for char in phrase:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        if len(phrase) not in self._outputs[state]:
+            self._outputs[state].append(len(phrase))
+
+    def _link(self):
+        # Breadth-first, so every fail target is finished before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state].extend(self._outputs[self._fail[next_state]])
+                queue.append(next_state)
+
+    def __len__(self):
+        return len(self.translations)
+
+    def find(self, text):
+        """Non-overlapping (start, end) spans of known phrases in `text` (already normalized).
+
+        A phrase starting or ending with a letter/digit must not touch another
+        letter/digit, so "male" is not found inside "female".
+        """
+        longest = {}  # start -> longest phrase length starting there
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            end = position + 1
+            for length in self._outputs[state]:
+                start = end - length
+                if text[start].isalnum() and start > 0 and text[start - 1].isalnum():
+                    continue
+                if char.isalnum() and end < len(text) and text[end].isalnum():
+                    continue
+                if length > longest.get(start, 0):
+                    longest[start] = length
+        spans = []
+        covered = 0
+        for start in sorted(longest):
+            if start >= covered:
+                covered = start + longest[start]
+                spans.append((start, covered))
+        return spans
+
+    def split(self, text):
+        """Split a cell into (piece, translation) parts, or None if no phrase matched.
+
+        Dictionary phrases come with their translation and so do pieces without
+        letters (numbers, punctuation, spaces), which are kept as they are.
+        Pieces that still need a backend have translation None.
+        """
+        normalized = ' '.join(str(text).split())
+        lowered = normalized.lower()
+        if len(lowered) != len(normalized):
+            return None  # Lowercasing changed offsets (rare Unicode); fall back to whole-cell lookup
+        spans = self.find(lowered)
+        if not spans:
+            return None
+        parts = []
+        position = 0
+        for start, end in spans + [(len(normalized), len(normalized))]:
+            if start > position:
+                parts.extend(self._gap_parts(normalized[position:start]))
+            if end > start:
+                parts.append((normalized[start:end], self.translations[lowered[start:end]]))
+            position = end
+        return parts
+
+    @staticmethod
+    def _gap_parts(gap):
+        lead, core, trail = _PADDING.match(gap).groups()
+        if not any(char.isalpha() for char in core):
+            return [(gap, gap)]
+        parts = [(lead, lead)] if lead else []
+        parts.append((core, None))
+        if trail:
+            parts.append((trail, trail))
+        return parts
+
+
+def remainders(parts):
+    """Pieces of a split cell that still need a backend."""
+    return [piece for piece, translation in parts if translation is None]
+
+
+def compose(parts, translated):
+    """Join a split cell back together; pieces missing from `translated` stay in English."""
+    return ''.join(translation if translation is not None else (translated.get(piece) or piece)
+                   for piece, translation in parts)
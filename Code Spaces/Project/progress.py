@@ -0,0 +1,83 @@
+"""Progress shared between translation threads and a UI that samples it.
+
+Workers only bump counters (O(1), under a tiny lock); they never touch a
+widget. The UI calls sample() on a timer, ~10 times a second, and gets the
+fraction done plus a throughput and ETA computed over the last few seconds,
+so the cost of showing progress depends on the frame rate, not on how many
+cells there are.
+"""
+import threading
+import time
+from collections import deque, namedtuple
+
+SAMPLE_INTERVAL_MS = 100  # 10 Hz
+RATE_WINDOW = 10.0  # Seconds of history behind the throughput/ETA figures
+
+Snapshot = namedtuple('Snapshot', 'done total fraction elapsed rate eta unit')
+
+
+def format_duration(seconds):
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+class ProgressReporter:
+    def __init__(self, window=RATE_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self.start()
+
+    def start(self, total=0, unit='cells'):
+        """Begin a new job (also clears the throughput history)."""
+        with self._lock:
+            self.done = 0
+            self.total = total
+            self.unit = unit
+            self.started = time.monotonic()
+            self._history = deque([(self.started, 0)])
+
+    def set_total(self, total):
+        with self._lock:
+            self.total = total
+
+    def add(self, amount=1):
+        """Count finished work; safe from any number of threads."""
+        with self._lock:
+            self.done += amount
+
+    def update(self, done, total=None):
+        """Set absolute progress, for a single writer that keeps its own count."""
+        with self._lock:
+            self.done = done
+            if total is not None:
+                self.total = total
+
+    def sample(self):
+        """Snapshot for display; call from the UI timer, not per item."""
+        now = time.monotonic()
+        with self._lock:
+            done, total = self.done, self.total
+            history = self._history
+            history.append((now, done))
+            while len(history) > 2 and now - history[1][0] >= self.window:
+                history.popleft()
+            oldest_time, oldest_done = history[0]
+        span = now - oldest_time
+        rate = (done - oldest_done) / span if span > 0 else 0.0
+        remaining = max(total - done, 0)
+        eta = remaining / rate if rate > 0 else None
+        fraction = min(done / total, 1.0) if total else 0.0
+        return Snapshot(done, total, fraction, now - self.started, rate, eta, self.unit)
+
+    @staticmethod
+    def describe(snapshot):
+        """One status line: '42.0% - 1200/2857 cells - 85.3 cells/s - ETA 00:00:19'."""
+        parts = [f"{snapshot.fraction * 100:.1f}%"]
+        if snapshot.total:
+            parts.append(f"{snapshot.done}/{snapshot.total} {snapshot.unit}")
+        if snapshot.rate > 0:
+            parts.append(f"{snapshot.rate:.1f} {snapshot.unit}/s")
+        if snapshot.eta is not None:
+            parts.append(f"ETA {format_duration(snapshot.eta)}")
+        return " - ".join(parts)
@@ -0,0 +1,65 @@
+"""Rate limiting helpers used by the translation engine."""
+import asyncio
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, bursts of up to `capacity`.
+
+    Callers reserve tokens up front and sleep for the returned delay, so the
+    same bucket can be shared by worker threads and asyncio tasks.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens=1):
+        """Take `tokens` (going into debt if needed) and return the seconds to wait before using them."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def wait_time(self, tokens=1):
+        """Seconds until `tokens` would be available, without taking them."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def acquire(self, tokens=1):
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens=1):
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, seconds):
+        """Stop handing out tokens for `seconds`, e.g. after the server answered 429."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+def backoff_delay(attempt, base=0.5, cap=30.0):
+    """Exponential backoff with full jitter for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def is_rate_limit_error(error):
+    message = str(error).lower()
+    return any(marker in message for marker in ("rate limit", "too many requests", "429", "quota"))
@@ -0,0 +1,203 @@
+"""Adaptive routing of translation requests across backends.
+
+The scheduler keeps rolling latency, throughput and error statistics per
+backend, sends new work to the backend expected to finish it soonest, and
+trips a circuit breaker on a backend that keeps failing or throttling us.
+An open breaker is probed with a single request once its cooldown expires.
+"""
+import threading
+import time
+from collections import deque
+
+WINDOW_SIZE = 50  # Requests remembered per backend
+MIN_SAMPLES = 5  # Requests needed before the error rate can trip the breaker
+ERROR_RATE_THRESHOLD = 0.5
+CONSECUTIVE_FAILURES_THRESHOLD = 3
+INITIAL_COOLDOWN = 10.0  # Seconds; doubles on each failed probe
+MAX_COOLDOWN = 300.0
+LATENCY_SMOOTHING = 0.2  # Weight of the newest sample in the latency average
+DEFAULT_LATENCY = 1.0  # Prior for backends that haven't been measured yet
+PROBE_RESERVE_TIMEOUT = 30.0  # Seconds a chosen probe may take to start before another may be chosen
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half-open'
+
+
+class BackendStats:
+    """Rolling request history and breaker state of one backend."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.samples = deque(maxlen=WINDOW_SIZE)  # (finished_at, latency, items, ok, rate_limited)
+        self.latency = None  # Smoothed seconds per request
+        self.in_flight = 0
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.cooldown = INITIAL_COOLDOWN
+        self.probe_in_flight = False
+        self.probe_chosen_at = 0.0
+        self.probe_owner = None  # What the caller passed to choose() for the probe request
+
+    def error_rate(self):
+        if not self.samples:
+            return 0.0
+        return sum(1 for sample in self.samples if not sample[3]) / len(self.samples)
+
+    def rate_limit_rate(self):
+        if not self.samples:
+            return 0.0
+        return sum(1 for sample in self.samples if sample[4]) / len(self.samples)
+
+    def throughput(self):
+        """Items per second over the window, counting successful requests only."""
+        if len(self.samples) < 2:
+            return 0.0
+        span = self.samples[-1][0] - self.samples[0][0] + self.samples[0][1]
+        items = sum(sample[2] for sample in self.samples if sample[3])
+        return items / span if span > 0 else 0.0
+
+    def as_dict(self):
+        return {
+            'state': self.state,
+            'latency': round(self.latency, 3) if self.latency is not None else None,
+            'throughput': round(self.throughput(), 2),
+            'error_rate': round(self.error_rate(), 3),
+            'rate_limit_rate': round(self.rate_limit_rate(), 3),
+            'in_flight': self.in_flight,
+        }
+
+
+class BackendScheduler:
+    """Chooses a backend per request and records how it went.
+
+    Typical use:
+        backend = scheduler.choose()
+        started = scheduler.begin(backend)
+        ... call the backend ...
+        scheduler.end(backend, started, items=len(batch), error=None)
+
+    A caller that chose a backend but gets no outcome after all (cancelled,
+    or went elsewhere) calls release(backend, owner) instead of end(), so a
+    half-open backend's probe isn't left reserved by a request that never
+    reports back. owner is any object identifying the request, passed to
+    choose() as well; only the request holding the probe can give it back.
+    """
+
+    def __init__(self, backends, log=None):
+        self.backends = list(backends)
+        self.stats = {backend.name: BackendStats(backend) for backend in self.backends}
+        self.log = log or (lambda message, level="info": None)
+        self._lock = threading.Lock()
+
+    def _available(self, stats, now):
+        if stats.state == OPEN and now - stats.opened_at >= stats.cooldown:
+            stats.state = HALF_OPEN
+        if stats.state == HALF_OPEN:
+            if stats.probe_in_flight and not stats.in_flight and \
+                    now - stats.probe_chosen_at >= PROBE_RESERVE_TIMEOUT:
+                stats.probe_in_flight = False  # Chosen, never sent and never released
+                stats.probe_owner = None
+            return not stats.probe_in_flight
+        return stats.state == CLOSED
+
+    def _expected_wait(self, stats):
+        # Time until this backend would finish one more request: rate-limit
+        # wait plus its latency, stretched by the requests already queued on it
+        # and by how often it fails
+        measured = [s.latency for s in self.stats.values() if s.latency is not None]
+        latency = stats.latency if stats.latency is not None else (min(measured) if measured else DEFAULT_LATENCY)
+        queueing = 1 + stats.in_flight / max(1, stats.backend.max_concurrency)
+        reliability = max(0.05, 1 - stats.error_rate())
+        return stats.backend.bucket.wait_time() + latency * queueing / reliability
+
+    def has_available(self, exclude=()):
+        """Whether a backend not in `exclude` could take a request now (breaker closed or probe free)."""
+        with self._lock:
+            now = time.monotonic()
+            return any(self._available(s, now) for s in self.stats.values() if s.backend.name not in exclude)
+
+    def choose(self, exclude=(), owner=None):
+        """Return the healthy backend expected to answer soonest.
+
+        Backends in `exclude` (e.g. ones that already failed this request) are
+        used only when nothing else is available. If every breaker is open the
+        backend whose cooldown ends first is returned rather than failing.
+        If the backend is half-open, the probe is reserved for `owner`.
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [s for s in self.stats.values() if self._available(s, now)]
+            preferred = [s for s in candidates if s.backend.name not in exclude]
+            candidates = preferred or candidates
+            if not candidates:
+                return min(self.stats.values(), key=lambda s: s.opened_at + s.cooldown).backend
+            chosen = min(candidates, key=self._expected_wait)
+            if chosen.state == HALF_OPEN:
+                # Reserved until end() records the probe, or release() gives it back
+                chosen.probe_in_flight = True
+                chosen.probe_chosen_at = now
+                chosen.probe_owner = owner
+                self.log(f"Probing {chosen.backend.name} after its cooldown.", "info")
+            return chosen.backend
+
+    def begin(self, backend):
+        with self._lock:
+            self.stats[backend.name].in_flight += 1
+        return time.monotonic()
+
+    def release(self, backend, owner, begun=False):
+        """Give back a backend returned by choose(owner=owner) whose request has no outcome.
+
+        begun=True for a request started with begin() and then abandoned
+        (cancelled) instead of finished with end(). The probe reservation is
+        cleared only if this request holds it.
+        """
+        with self._lock:
+            stats = self.stats[backend.name]
+            if begun:
+                stats.in_flight = max(0, stats.in_flight - 1)
+            if stats.state == HALF_OPEN and owner is not None and stats.probe_owner is owner:
+                stats.probe_in_flight = False
+                stats.probe_owner = None
+
+    def end(self, backend, started, items=1, error=None, rate_limited=False):
+        """Record the outcome of a request started with begin()."""
+        now = time.monotonic()
+        latency = now - started
+        ok = error is None
+        with self._lock:
+            stats = self.stats[backend.name]
+            stats.in_flight = max(0, stats.in_flight - 1)
+            stats.samples.append((now, latency, items, ok, rate_limited))
+            if ok:
+                stats.latency = latency if stats.latency is None else \
+                    (1 - LATENCY_SMOOTHING) * stats.latency + LATENCY_SMOOTHING * latency
+                stats.consecutive_failures = 0
+                if stats.state == HALF_OPEN:
+                    stats.state = CLOSED
+                    stats.cooldown = INITIAL_COOLDOWN
+                    stats.probe_in_flight = False
+                    stats.probe_owner = None
+                    stats.samples.clear()
+                    self.log(f"{backend.name} recovered; routing work to it again.", "info")
+                return
+            stats.consecutive_failures += 1
+            if stats.state == HALF_OPEN:
+                stats.cooldown = min(MAX_COOLDOWN, stats.cooldown * 2)
+                self._open(stats, now, "probe failed")
+            elif stats.state == CLOSED and (
+                    rate_limited or stats.consecutive_failures >= CONSECUTIVE_FAILURES_THRESHOLD
+                    or (len(stats.samples) >= MIN_SAMPLES and stats.error_rate() >= ERROR_RATE_THRESHOLD)):
+                self._open(stats, now, "rate limited" if rate_limited else "too many errors")
+
+    def _open(self, stats, now, reason):
+        stats.state = OPEN
+        stats.opened_at = now
+        stats.probe_in_flight = False
+        stats.probe_owner = None
+        self.log(f"Circuit open for {stats.backend.name} ({reason}); "
+                 f"retrying it in {stats.cooldown:.0f}s.", "warning")
+
+    def snapshot(self):
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self.stats.items()}
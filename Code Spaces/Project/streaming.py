@@ -0,0 +1,65 @@
+"""Chunked CSV translation for files that don't fit in memory.
+
+Instead of loading the whole sheet, the CSV is read `chunksize` rows at a
+time, each chunk is translated and appended to the output straight away.
+Peak memory is a couple of chunks plus whatever cache the translator keeps.
+"""
+import os
+
+from lazy_imports import lazy_import
+
+pd = lazy_import('pandas')  # Loaded on first use, see lazy_imports.py
+
+DEFAULT_CHUNKSIZE = 20000
+STREAMING_THRESHOLD_MB = 100  # CSV files above this size are streamed instead of loaded
+SAMPLE_ROWS = 1000  # Rows loaded up front for column checkboxes and preview
+
+
+def should_stream(file_path, threshold_mb=STREAMING_THRESHOLD_MB):
+    """True for CSV files large enough that loading them whole is a bad idea."""
+    return file_path.lower().endswith('.csv') and os.path.getsize(file_path) > threshold_mb * 1024 * 1024
+
+
+def read_csv_sample(file_path, nrows=SAMPLE_ROWS, **read_kwargs):
+    """Read only the header and the first `nrows` rows."""
+    return pd.read_csv(file_path, nrows=nrows, **read_kwargs)
+
+
+def stream_translate_csv(input_path, output_path, translate_chunk, chunksize=DEFAULT_CHUNKSIZE,
+                         progress_callback=None, should_cancel=None, checkpoint=None, **read_kwargs):
+    """Translate `input_path` chunk by chunk into `output_path` (UTF-8 with BOM, like the other savers).
+
+    translate_chunk(chunk_df) must return the translated chunk.
+    progress_callback(rows_done, fraction_of_file_read) is called after every chunk;
+    should_cancel() is checked before and after each chunk: a chunk cancelled
+    half-way is neither written nor journaled. With a CheckpointJournal, every
+    finished chunk is journaled and a resumed job skips the chunks already written.
+    Returns the number of rows written.
+    """
+    total_bytes = max(1, os.path.getsize(input_path))
+    start_chunk = checkpoint.chunks_done if checkpoint else 0
+    rows_done = checkpoint.rows_done if checkpoint else 0
+    if start_chunk and os.path.exists(output_path):
+        # Drop anything written after the last journaled chunk, then append
+        os.truncate(output_path, checkpoint.output_bytes)
+        mode = 'a'
+    else:
+        start_chunk, rows_done, mode = 0, 0, 'w'
+    with open(input_path, 'rb') as source, open(output_path, mode, encoding='utf-8-sig', newline='') as out:
+        reader = pd.read_csv(source, chunksize=chunksize, **read_kwargs)
+        for chunk_number, chunk in enumerate(reader):
+            if chunk_number < start_chunk:
+                continue  # Already in the output from an earlier run
+            if should_cancel and should_cancel():
+                break
+            translated = translate_chunk(chunk)
+            if should_cancel and should_cancel():
+                break  # translate_chunk may have stopped part-way; the resume redoes this chunk
+            translated.to_csv(out, header=(chunk_number == 0), index=False)
+            out.flush()
+            rows_done += len(chunk)
+            if checkpoint:
+                checkpoint.record_chunk(chunk_number, rows_done, os.fstat(out.fileno()).st_size)
+            if progress_callback:
+                progress_callback(rows_done, min(1.0, source.tell() / total_bytes))
+    return rows_done
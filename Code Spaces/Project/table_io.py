@@ -0,0 +1,276 @@
+"""Reading and writing the sheets the translators work on.
+
+Besides CSV and Excel this handles Parquet and Feather/Arrow, which load
+and save a million-row sheet in seconds. Excel output goes through a
+write-only workbook that streams rows to disk instead of building every
+cell object in memory first. Excel input uses the calamine reader when
+python-calamine is installed (pandas 2.2+), openpyxl otherwise.
+iter_table_chunks() reads any of these formats a chunk of rows at a time
+(see table_loader.py).
+"""
+import importlib.util
+import os
+
+from lazy_imports import lazy_import
+
+pd = lazy_import('pandas')  # Loaded on first use, see lazy_imports.py
+
+CSV_EXTENSIONS = ('.csv',)
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+FEATHER_EXTENSIONS = ('.feather', '.arrow')
+SUPPORTED_EXTENSIONS = CSV_EXTENSIONS + EXCEL_EXTENSIONS + PARQUET_EXTENSIONS + FEATHER_EXTENSIONS
+EXCEL_MAX_ROWS = 1048576  # Including the header row
+LOAD_CHUNKSIZE = 20000  # Rows per chunk when a sheet is read piece by piece
+
+# read_csv options that read_excel understands too, plus the sheet to read
+EXCEL_READ_OPTIONS = ('dtype', 'keep_default_na', 'na_filter', 'na_values', 'sheet_name')
+
+# For the file dialogs
+INPUT_FILETYPES = [
+    ("All supported", "*.xlsx *.xls *.csv *.parquet *.pq *.feather *.arrow"),
+    ("Excel files", "*.xlsx *.xls"),
+    ("CSV files", "*.csv"),
+    ("Parquet files", "*.parquet *.pq"),
+    ("Feather/Arrow files", "*.feather *.arrow"),
+    ("All files", "*.*"),
+]
+OUTPUT_FILETYPES = [
+    ("Excel files", "*.xlsx"),
+    ("CSV files (UTF-8)", "*.csv"),
+    ("Parquet files", "*.parquet"),
+    ("Feather files", "*.feather"),
+    ("All files", "*.*"),
+]
+
+
+def extension(file_path):
+    return os.path.splitext(str(file_path))[1].lower()
+
+
+def excel_engine():
+    """Fastest installed Excel reader, or None for pandas' default (openpyxl)."""
+    major, minor = (int(part) for part in pd.__version__.split('.')[:2])
+    if (major, minor) >= (2, 2) and importlib.util.find_spec('python_calamine') is not None:
+        return 'calamine'
+    return None
+
+
+def _as_strings(df, na_filter=True):
+    # Columnar files keep their types; match what dtype=str gives for CSV/Excel
+    df = df.astype(object).where(df.notna(), None)
+    df = df.apply(lambda col: col.map(lambda value: value if value is None else str(value)))
+    return df.fillna('') if not na_filter else df
+
+
+def sheet_names(file_path):
+    """Names of the sheets in an Excel file, in workbook order; [None] for the other formats."""
+    ext = extension(file_path)
+    if ext == '.xlsx':
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+    if ext in EXCEL_EXTENSIONS:
+        with pd.ExcelFile(file_path) as workbook:
+            return list(workbook.sheet_names)
+    return [None]
+
+
+def read_table(file_path, **read_options):
+    """Load a whole sheet. read_options are read_csv options; Excel gets the ones it supports.
+
+    For Excel, sheet_name picks the sheet (default: the first).
+
+    For Parquet/Feather only dtype=str and na_filter apply: values are turned
+    into strings and, with na_filter=False, missing values into ''.
+    """
+    ext = extension(file_path)
+    if ext in CSV_EXTENSIONS:
+        return pd.read_csv(file_path, **read_options)
+    if ext in EXCEL_EXTENSIONS:
+        excel_options = {key: value for key, value in read_options.items() if key in EXCEL_READ_OPTIONS}
+        engine = excel_engine()
+        if engine and ext == '.xlsx':
+            excel_options['engine'] = engine
+        return pd.read_excel(file_path, **excel_options)
+    if ext in PARQUET_EXTENSIONS:
+        df = pd.read_parquet(file_path)
+    elif ext in FEATHER_EXTENSIONS:
+        df = pd.read_feather(file_path)
+    else:
+        raise ValueError(f"Unsupported file type: {file_path}")
+    if read_options.get('dtype') is str:
+        df = _as_strings(df, read_options.get('na_filter', True))
+    return df
+
+
+def _excel_columns(header):
+    # Same names read_excel gives: "Unnamed: 3" for blanks, "Name.1" for repeats
+    columns = []
+    seen = {}
+    for i, value in enumerate(header):
+        name = f"Unnamed: {i}" if value is None else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        columns.append(name)
+    return columns
+
+
+def _excel_frame(rows, columns, read_options):
+    width = len(columns)
+    rows = [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+    df = pd.DataFrame(rows, columns=columns, dtype=object)
+    if read_options.get('dtype') is str:
+        df = df.apply(lambda col: col.map(lambda value: value if value is None else str(value)))
+    elif not df.empty:
+        df = df.infer_objects()
+    return df.fillna('') if read_options.get('na_filter', True) is False else df
+
+
+def _xlsx_chunks(file_path, chunksize, read_options):
+    """(chunk, fraction) pairs from the first sheet of an .xlsx file, via a read-only workbook."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]  # read_excel's default sheet
+        total = (sheet.max_row or 1) - 1  # From the stored dimension, which some writers leave out
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = _excel_columns(header)
+        chunk = []
+        blank = []  # Blank rows are held back, so trailing ones are dropped like read_excel does
+        rows_read = 0
+        for row in rows:
+            if all(value is None for value in row):
+                blank.append(row)
+                continue
+            chunk.extend(blank)
+            blank = []
+            chunk.append(row)
+            if len(chunk) >= chunksize:
+                rows_read += len(chunk)
+                yield _excel_frame(chunk, columns, read_options), min(1.0, rows_read / total) if total > 0 else None
+                chunk = []
+        if chunk or not rows_read:
+            yield _excel_frame(chunk, columns, read_options), 1.0
+    finally:
+        workbook.close()
+
+
+def _parquet_chunks(file_path, chunksize, read_options):
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(file_path)
+    total = parquet_file.metadata.num_rows
+    rows_read = 0
+    for batch in parquet_file.iter_batches(batch_size=chunksize):
+        rows_read += batch.num_rows
+        df = batch.to_pandas()
+        if read_options.get('dtype') is str:
+            df = _as_strings(df, read_options.get('na_filter', True))
+        yield df, min(1.0, rows_read / total) if total else 1.0
+
+
+def iter_table_chunks(file_path, chunksize=LOAD_CHUNKSIZE, excel_chunks=None, **read_options):
+    """Read a sheet `chunksize` rows at a time; yields (chunk, fraction of the file read).
+
+    Only the chunk being parsed is held in memory. CSV, .xlsx (read-only
+    openpyxl workbook) and Parquet (row batches) are really read piece by
+    piece; .xls and Feather have no such reader and are loaded whole, then
+    sliced. Chunks are indexed by their row positions in the file, so
+    concatenating them gives what read_table() returns. fraction is None
+    when the size of the file isn't known up front.
+
+    excel_chunks=None reads .xlsx piece by piece only when calamine isn't
+    installed: calamine loads a whole sheet several times faster than
+    openpyxl streams it. Pass True when only the first rows are wanted.
+    """
+    ext = extension(file_path)
+    if ext in CSV_EXTENSIONS:
+        total_bytes = max(1, os.path.getsize(file_path))
+        with open(file_path, 'rb') as source:
+            for chunk in pd.read_csv(source, chunksize=chunksize, **read_options):
+                yield chunk, min(1.0, source.tell() / total_bytes)
+        return
+    if ext == '.xlsx' and (excel_chunks or excel_chunks is None and excel_engine() is None):
+        chunks = _xlsx_chunks(file_path, chunksize, read_options)
+    elif ext in PARQUET_EXTENSIONS:
+        chunks = _parquet_chunks(file_path, chunksize, read_options)
+    else:
+        df = read_table(file_path, **read_options)
+        chunks = ((df.iloc[start:start + chunksize], min(1.0, (start + chunksize) / max(len(df), 1)))
+                  for start in range(0, max(len(df), 1), chunksize))
+    start = 0
+    for chunk, fraction in chunks:
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk, fraction
+
+
+def write_xlsx(df, file_path, sheet_name='Sheet1'):
+    """Write an .xlsx file with a write-only workbook: rows stream to disk, memory stays flat."""
+    write_xlsx_sheets({sheet_name: df}, file_path)
+
+
+def write_xlsx_sheets(sheets, file_path):
+    """Like write_xlsx, for a {sheet name: DataFrame} dict; sheets keep the dict's order."""
+    from openpyxl import Workbook
+
+    for name, df in sheets.items():
+        if len(df) + 1 > EXCEL_MAX_ROWS:
+            raise ValueError(f"{len(df)} rows of sheet {name!r} don't fit in one Excel sheet; "
+                             "save as CSV, Parquet or Feather instead")
+    workbook = Workbook(write_only=True)
+    for name, df in sheets.items():
+        sheet = workbook.create_sheet(title=str(name))
+        sheet.append([str(col) for col in df.columns])
+        for row in df.itertuples(index=False, name=None):
+            # Missing values become empty cells; strings (most cells here) skip the check
+            sheet.append([value if isinstance(value, str) or not pd.isna(value) else None for value in row])
+    workbook.save(file_path)
+
+
+def write_table(df, file_path):
+    """Save a sheet in the format its extension asks for; unknown extensions get Excel."""
+    ext = extension(file_path)
+    if ext in CSV_EXTENSIONS:
+        df.to_csv(file_path, index=False, encoding='utf-8-sig') # BOM for Excel
+    elif ext in PARQUET_EXTENSIONS:
+        df.to_parquet(file_path, index=False)
+    elif ext in FEATHER_EXTENSIONS:
+        # Column names must be strings and the index the default one
+        df.reset_index(drop=True).rename(columns=str).to_feather(file_path)
+    else:
+        write_xlsx(df, file_path)
+
+
+def write_sheets(sheets, file_path):
+    """Save a {sheet name: DataFrame} dict: one workbook for Excel output.
+
+    The other formats hold one sheet per file, so with several sheets each
+    goes to <name>_<sheet><ext> next to file_path. Returns the paths written.
+    """
+    ext = extension(file_path)
+    if ext not in CSV_EXTENSIONS + PARQUET_EXTENSIONS + FEATHER_EXTENSIONS:
+        write_xlsx_sheets(sheets, file_path)
+        return [file_path]
+    if len(sheets) == 1:
+        write_table(next(iter(sheets.values())), file_path)
+        return [file_path]
+    name, _ = os.path.splitext(file_path)
+    paths = []
+    for sheet_name, df in sheets.items():
+        path = f"{name}_{sheet_name}{ext}"
+        write_table(df, path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,124 @@
+"""Opening a sheet without freezing the window.
+
+read_preview() parses only the header and the first SAMPLE_ROWS rows, which
+is all the column checkboxes and the preview need, so they show up right
+away. TableLoader then reads the whole sheet chunk by chunk (.xlsx in one
+go through calamine when it's installed) on a background thread (progress
+in rows, sampled by the UI like translation progress). Translation
+doesn't have to wait for it: chunks() hands out the chunks
+that are loaded and waits for the next, so the first rows are translated
+while the last ones are still being parsed.
+"""
+import threading
+
+from lazy_imports import lazy_import
+from progress import ProgressReporter
+from streaming import SAMPLE_ROWS
+from table_io import LOAD_CHUNKSIZE, iter_table_chunks, read_table
+
+pd = lazy_import('pandas')
+
+WAIT_SECONDS = 0.2  # How often a waiting consumer checks should_cancel
+
+
+def read_preview(file_path, nrows=SAMPLE_ROWS, **read_options):
+    """Header and the first nrows rows; the rest of the file isn't parsed (except for .xls/Feather)."""
+    # openpyxl's read-only workbook stops after nrows; calamine would parse the whole sheet first
+    chunks = iter_table_chunks(file_path, chunksize=nrows, excel_chunks=True, **read_options)
+    try:
+        chunk, _ = next(chunks, (None, None))
+    finally:
+        chunks.close()
+    return chunk if chunk is not None else read_table(file_path, **read_options)
+
+
+class TableLoader:
+    """Loads a whole sheet on a daemon thread; start() returns at once."""
+
+    def __init__(self, file_path, chunksize=LOAD_CHUNKSIZE, **read_options):
+        self.file_path = file_path
+        self.chunksize = chunksize
+        self.read_options = read_options
+        self.progress = ProgressReporter()
+        self.done = False
+        self.error = None
+        self._chunks = []
+        self._frame = None
+        self._cancelled = False
+        self._condition = threading.Condition()
+        self._thread = None
+
+    @property
+    def rows(self):
+        return self.progress.done
+
+    def start(self):
+        self.progress.start(unit='rows')
+        self._thread = threading.Thread(target=self._load, name="table-loader", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancelled = True
+
+    def _load(self):
+        rows = 0
+        try:
+            for chunk, fraction in iter_table_chunks(self.file_path, self.chunksize, **self.read_options):
+                if self._cancelled:
+                    break
+                with self._condition:
+                    self._chunks.append(chunk)
+                    self._condition.notify_all()
+                rows += len(chunk)
+                # The total is estimated from how much of the file was read, like streamed CSVs
+                self.progress.update(rows, round(rows / fraction) if fraction else None)
+            if not self._cancelled:
+                # Concatenated here, so the UI thread never pays for it
+                frame = pd.concat(self._chunks) if len(self._chunks) > 1 else self._chunks[0] if self._chunks else None
+                views = []
+                start = 0
+                for chunk in self._chunks:
+                    # Row slices of the whole frame replace the chunks, so the sheet isn't held twice
+                    views.append(frame.iloc[start:start + len(chunk)])
+                    start += len(chunk)
+                self.progress.set_total(rows)
+                with self._condition:
+                    self._frame = frame
+                    self._chunks = views
+        except Exception as e:
+            self.error = e
+        finally:
+            with self._condition:
+                self.done = True
+                self._condition.notify_all()
+
+    def chunks(self, should_cancel=None):
+        """Yield the chunks in file order, waiting for the ones still being parsed.
+
+        Raises the loading error, if there was one, once the chunks read
+        before it are used up.
+        """
+        position = 0
+        while True:
+            with self._condition:
+                while position >= len(self._chunks) and not self.done:
+                    if should_cancel and should_cancel():
+                        return
+                    self._condition.wait(WAIT_SECONDS)
+                if position >= len(self._chunks):
+                    if self.error is not None:
+                        raise self.error
+                    return
+                chunk = self._chunks[position]
+            position += 1
+            yield chunk
+
+    def frame(self):
+        """The whole sheet; waits for the load to finish."""
+        with self._condition:
+            while not self.done:
+                self._condition.wait()
+        if self.error is not None:
+            raise self.error
+        return self._frame
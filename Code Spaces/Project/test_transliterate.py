@@ -0,0 +1,34 @@
+import unicodedata
+import unittest
+
+from transliterate import Transliterator
+
+
+class AccentedNameTest(unittest.TestCase):
+    def setUp(self):
+        self.transliterator = Transliterator()
+
+    def test_accented_word_is_kept_not_spelled(self):
+        self.assertEqual(self.transliterator.transliterate("Zoë"), "Zoë")
+
+    def test_word_boundary_survives_an_accent(self):
+        self.assertEqual(self.transliterator.transliterate("José Rahman"), "José রহমান")
+
+    def test_combining_accent_stays_in_its_word(self):
+        decomposed = unicodedata.normalize('NFD', "José Rahman")
+        self.assertEqual(self.transliterator.transliterate(decomposed), "José রহমান")
+
+    def test_accented_word_is_unsure(self):
+        parts = self.transliterator.split("Noël Khan", keep_unsure=False)
+        self.assertEqual(parts, [("Noël", None), (" ", " "), ("Khan", "খান")])
+
+    def test_fallback_gets_accented_word(self):
+        transliterator = Transliterator(fallback=lambda word: "জোসে" if word == "José" else None)
+        self.assertEqual(transliterator.transliterate("José Rahman"), "জোসে রহমান")
+
+    def test_plain_names_unchanged(self):
+        self.assertEqual(self.transliterator.transliterate("Md. Abdul Karim"), "মোঃ আব্দুল করিম")
+
+
+if __name__ == '__main__':
+    unittest.main()
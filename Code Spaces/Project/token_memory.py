@@ -0,0 +1,84 @@
+"""Word-level translation memory for name and address cells.
+
+Cell-level caching misses whenever a combination is new ("Md. Abdul Karim"
+after "Abdul Karim Mia"), although names and addresses are built from a
+far smaller set of words than there are distinct cells. Cells of such
+columns whose words are mostly known are put together word by word and
+only the unseen words go to a backend (as PhraseMatcher-style parts, so
+the engine's split/compose path does the rest).
+
+Known words come from two places. A single-word cell translated by a
+backend is in the persistent cache anyway. Word pairs taken from
+multi-word cells go to a table of their own (TOKEN_TABLE, same database),
+so they never answer a whole-cell lookup; and since Bengali word order
+and compounding differ from English, a pair is only learned when the
+word in that position is exactly the transliteration of the English one.
+"""
+import re
+
+from transliterate import Transliterator, is_name_header
+
+TOKEN_TABLE = 'token_memory'
+TOKEN_BACKEND = 'token-memory'
+MIN_KNOWN_SHARE = 0.5  # Share of a cell's words the memory must know before the cell is split
+MAX_SEGMENT_WORDS = 8  # Longer cells are more likely prose, which word-by-word would mangle
+ADDRESS_HEADER = re.compile(
+    r"address|village|road|street|house|area|thana|upazila|district|union|ward|post ?office|city|location",
+    re.IGNORECASE)
+
+_TOKEN = re.compile(r'[A-Za-z]+|[^A-Za-z]+')
+_LATIN = re.compile(r'[A-Za-z]')
+_DIGIT = re.compile(r'\d')
+_PUNCTUATION = ',.;:-\'"()'
+
+
+def is_segment_column(header):
+    """Name and address columns, where cells are lists of words rather than sentences."""
+    text = str(header).replace('_', ' ')
+    return is_name_header(text) or bool(ADDRESS_HEADER.search(text))
+
+
+def words(text):
+    return [piece for piece in _TOKEN.findall(str(text)) if piece[0].isalpha()]
+
+
+def segment(text, known, min_share=MIN_KNOWN_SHARE):
+    """Parts for a cell composed from known words, or None if it should go whole.
+
+    known maps lowercase words to translations. Letter-free pieces
+    (spaces, punctuation, numbers) are kept as they are; unknown words get
+    None, like the remainders of PhraseMatcher.split.
+    """
+    pieces = _TOKEN.findall(str(text))
+    cell_words = [piece for piece in pieces if piece[0].isalpha()]
+    if not 2 <= len(cell_words) <= MAX_SEGMENT_WORDS:
+        return None
+    if sum(1 for word in cell_words if word.lower() in known) < min_share * len(cell_words):
+        return None
+    return [(piece, known.get(piece.lower())) if piece[0].isalpha() else (piece, piece) for piece in pieces]
+
+
+_transliterator = None
+
+
+def align(text, translation, transliterator=None):
+    """Word pairs of a translated cell that can be checked, else [].
+
+    Only cells without numbers whose translation has the same number of
+    words and no Latin letters left in it are considered, and of those
+    only the pairs whose Bengali word is the transliteration of the
+    English one: a position match alone says nothing about the meaning.
+    """
+    global _transliterator
+    if _DIGIT.search(str(text)) or _LATIN.search(str(translation)):
+        return []
+    source_words = words(text)
+    target_words = [word for word in (piece.strip(_PUNCTUATION) for piece in str(translation).split()) if word]
+    if len(source_words) < 2 or len(source_words) != len(target_words):
+        return []
+    if transliterator is None:
+        if _transliterator is None:
+            _transliterator = Transliterator()
+        transliterator = _transliterator
+    return [(source.lower(), target) for source, target in zip(source_words, target_words)
+            if transliterator.word(source)[0].strip(_PUNCTUATION) == target]
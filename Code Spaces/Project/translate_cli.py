@@ -0,0 +1,141 @@
+"""Headless English to Bangla translation of CSV/Excel files.
+
+Uses the same TranslationEngine as the Tk front-end but never imports Tk,
+so it runs under cron and on servers without a display. Examples:
+
+    python translate_cli.py voters.csv -c Name Address -p Phone -o voters_bn.csv
+    python translate_cli.py census.xlsx --workers 16 --shard 2/8
+
+--shard K/N translates only the K-th of N equal row ranges (0-based), so a
+big file can be fanned out across machines and the outputs concatenated.
+"""
+import argparse
+import os
+import sys
+import time
+
+from async_engine import DEFAULT_BATCH_CHARS, DEFAULT_CONCURRENCY
+from metrics import DEFAULT_EXPORT_INTERVAL
+from progress import ProgressReporter
+from backends import DEFAULT_BACKENDS
+from streaming import DEFAULT_CHUNKSIZE
+from translation_cache import DEFAULT_CACHE_PATH
+from table_io import SUPPORTED_EXTENSIONS
+from translation_engine import CUSTOM_TRANSLATIONS_FILE, TranslationEngine
+
+
+def default_output_path(input_path, shard=None):
+    name, ext = os.path.splitext(input_path)
+    suffix = f"_part{shard[0]}of{shard[1]}" if shard else ""
+    keep_ext = ext.lower() in SUPPORTED_EXTENSIONS and ext.lower() != '.xls'  # .xls can't be written
+    return f"{name}_translated{suffix}{ext if keep_ext else '.xlsx'}"
+
+
+def parse_shard(value):
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError("shard must look like K/N, e.g. 0/4")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError("shard K/N needs 0 <= K < N")
+    return index, count
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Translate columns of a CSV/Excel file from English to Bangla.")
+    parser.add_argument('input', help="CSV, Excel, Parquet or Feather file to translate")
+    parser.add_argument('-o', '--output',
+                        help="Output file (.csv, .xlsx, .parquet or .feather); default: <input>_translated.<ext>")
+    parser.add_argument('-c', '--columns', nargs='+', help="Columns to translate (default: all)")
+    parser.add_argument('-p', '--preserve-numbers', nargs='+', default=[], metavar='COLUMN',
+                        help="Columns whose ID/phone numbers are converted to Bengali digits")
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Parallel translation requests (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument('-j', '--processes', type=int, default=1,
+                        help="Worker processes for dictionary/number work on big files, 0 for one per core (default: 1)")
+    parser.add_argument('--backends', nargs='+', default=list(DEFAULT_BACKENDS), choices=DEFAULT_BACKENDS,
+                        help="Translation services to use")
+    parser.add_argument('--batch-chars', type=int, default=DEFAULT_BATCH_CHARS,
+                        help="Characters per batched request, 0 for one text per request")
+    stream = parser.add_mutually_exclusive_group()
+    stream.add_argument('--stream', dest='stream', action='store_true', default=None,
+                        help="Force chunked streaming (CSV only)")
+    stream.add_argument('--no-stream', dest='stream', action='store_false',
+                        help="Always load the whole file into memory")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk when streaming")
+    parser.add_argument('--shard', type=parse_shard, metavar='K/N', help="Translate only row range K of N")
+    parser.add_argument('--no-resume', action='store_true', help="Ignore and don't write a checkpoint journal")
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help="Persistent translation cache file")
+    parser.add_argument('--custom-dict', default=CUSTOM_TRANSLATIONS_FILE, help="Custom translations JSON file")
+    parser.add_argument('--no-phrases', action='store_true',
+                        help="Only use the dictionary for whole cells, not for phrases inside longer ones")
+    parser.add_argument('--no-token-memory', action='store_true',
+                        help="Don't compose name/address cells from previously translated words")
+    names = parser.add_mutually_exclusive_group()
+    names.add_argument('--names', nargs='+', metavar='COLUMN',
+                       help="Columns holding person names, transliterated offline (default: detected)")
+    names.add_argument('--no-names', action='store_true', help="Send person names to the translation services too")
+    parser.add_argument('--name-fallback', action='store_true',
+                        help="Let a translation service spell name words the offline rules are unsure about")
+    parser.add_argument('--metrics', metavar='FILE',
+                        help="Write job metrics here (.json, anything else gets Prometheus text format)")
+    parser.add_argument('--metrics-interval', type=float, default=DEFAULT_EXPORT_INTERVAL,
+                        help=f"Seconds between metrics exports during the run (default: {DEFAULT_EXPORT_INTERVAL:g})")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Only print errors and the final summary")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not os.path.exists(args.input):
+        print(f"Input file not found: {args.input}", file=sys.stderr)
+        return 2
+    output_path = args.output or default_output_path(args.input, args.shard)
+
+    def log(message, level="info"):
+        if not args.quiet or level in ("warning", "error"):
+            print(f"[{level.upper()}] {message}", file=sys.stderr)
+
+    last_reported = [-1]
+
+    def progress(percent):
+        # Printed once per whole percent, with throughput/ETA from the engine's counters
+        if not args.quiet and int(percent) > last_reported[0]:
+            last_reported[0] = int(percent)
+            status = ProgressReporter.describe(engine.progress.sample())
+            print(f"\r{status:<70}", end='', file=sys.stderr, flush=True)
+
+    if args.shard:
+        if args.stream:
+            print("--shard can't be combined with --stream", file=sys.stderr)
+            return 2
+        args.stream = False
+
+    engine = TranslationEngine(args.backends, concurrency=args.workers, batch_chars=args.batch_chars,
+                               cache_path=args.cache, custom_translations_path=args.custom_dict, log=log,
+                               phrase_matching=not args.no_phrases,
+                               local_workers=args.processes or os.cpu_count() or 1,
+                               metrics_path=args.metrics, metrics_interval=args.metrics_interval,
+                               transliterate_names=not args.no_names, name_columns=args.names,
+                               name_fallback=args.name_fallback, token_memory=not args.no_token_memory)
+    started = time.time()
+    try:
+        summary = engine.translate_file(args.input, output_path, args.columns, args.preserve_numbers,
+                                        stream=args.stream, resume=not args.no_resume, progress=progress,
+                                        chunksize=args.chunksize, shard=args.shard)
+    except (ValueError, OSError) as e:
+        print(f"\nTranslation failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        engine.close()
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"Translated {summary['rows']} rows ({', '.join(map(str, summary['columns']))}) "
+          f"in {time.time() - started:.1f}s -> {summary['output']}")
+    print(f"Cache hits: {summary['cache_hits']}, API calls: {summary['api_calls']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Persistent translation cache shared by the translator front-ends.
+
+Entries live in a small SQLite database keyed by
+(source lang, target lang, normalized text, backend), so a restarted job
+does not pay for text that an earlier run already translated.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = 'translation_cache.sqlite3'
+DEFAULT_MAX_ENTRIES = 1000000
+DEFAULT_MAX_AGE_DAYS = 365
+EVICT_EVERY_N_WRITES = 5000
+SQLITE_MAX_PARAMS = 900  # Stay below SQLITE_MAX_VARIABLE_NUMBER on old builds
+
+
+def normalize_text(text):
+    """Return the cache key form of a cell value (trimmed, lower-case, single-spaced)."""
+    if text is None:
+        return ""
+    return re.sub(r'\s+', ' ', str(text).strip().lower())
+
+
+class TranslationCache:
+    """Thread-safe on-disk cache of finished translations.
+
+    Every thread gets its own SQLite connection; writes are serialized with a
+    lock and the database runs in WAL mode so readers never block on writers.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, source='en', target='bn',
+                 max_entries=DEFAULT_MAX_ENTRIES, max_age_days=DEFAULT_MAX_AGE_DAYS, table='translations'):
+        self.path = path
+        # Another table of the same database keeps entries that must not answer
+        # cell lookups (the word pairs of token_memory.py)
+        self.table = table
+        self.source = source
+        self.target = target
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._connections = []
+        self._writes_since_evict = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._write_lock:
+            conn = self._connection()
+            # Lets the caller tell a new table from an existing one (e.g. to move entries into it)
+            self.created = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                                        (table,)).fetchone() is None
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                " source TEXT NOT NULL, target TEXT NOT NULL, text TEXT NOT NULL,"
+                " backend TEXT NOT NULL, translation TEXT NOT NULL, created_at REAL NOT NULL,"
+                " UNIQUE (source, target, text, backend))"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_created ON {table} (created_at)")
+            conn.commit()
+        self.evict()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._connections.append(conn)
+        return conn
+
+    def _langs(self, source, target):
+        return (source or self.source, target or self.target)
+
+    def get(self, text, backend=None, source=None, target=None):
+        """Return the cached translation of `text`, or None on a miss."""
+        key = normalize_text(text)
+        if not key:
+            return None
+        return self.get_many([key], backend, source, target).get(key)
+
+    def get_many(self, texts, backend=None, source=None, target=None):
+        """Bulk lookup. Returns {normalized text: translation} for the hits only.
+
+        With backend=None a translation from any backend is accepted; if several
+        backends translated the same text the most recent one wins.
+        """
+        source, target = self._langs(source, target)
+        keys = list(dict.fromkeys(k for k in (normalize_text(t) for t in texts) if k))
+        found = {}
+        newest = {}
+        conn = self._connection()
+        for i in range(0, len(keys), SQLITE_MAX_PARAMS):
+            chunk = keys[i:i + SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            query = (f"SELECT text, translation, created_at FROM {self.table}"
+                     f" WHERE source = ? AND target = ? AND text IN ({placeholders})")
+            params = [source, target] + chunk
+            if backend is not None:
+                query += " AND backend = ?"
+                params.append(backend)
+            for text, translation, created_at in conn.execute(query, params):
+                if created_at >= newest.get(text, float('-inf')):
+                    newest[text] = created_at
+                    found[text] = translation
+        return found
+
+    def put(self, text, translation, backend='', source=None, target=None):
+        self.put_many([(text, translation)], backend, source, target)
+
+    def put_many(self, items, backend='', source=None, target=None):
+        """Store (text, translation) pairs; empty keys or translations are skipped."""
+        source, target = self._langs(source, target)
+        now = time.time()
+        rows = [(source, target, normalize_text(text), backend or '', str(translation), now)
+                for text, translation in items
+                if normalize_text(text) and translation is not None and str(translation).strip()]
+        if not rows:
+            return 0
+        with self._write_lock:
+            conn = self._connection()
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (source, target, text, backend, translation, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)", rows)
+            conn.commit()
+            self._writes_since_evict += len(rows)
+            run_eviction = self._writes_since_evict >= EVICT_EVERY_N_WRITES
+        if run_eviction:
+            self.evict()
+        return len(rows)
+
+    def evict(self):
+        """Drop entries older than max_age_days, then the oldest ones above max_entries."""
+        removed = 0
+        with self._write_lock:
+            conn = self._connection()
+            if self.max_age_days:
+                cutoff = time.time() - self.max_age_days * 86400
+                removed += conn.execute(f"DELETE FROM {self.table} WHERE created_at < ?", (cutoff,)).rowcount
+            if self.max_entries:
+                count = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+                excess = count - self.max_entries
+                if excess > 0:
+                    removed += conn.execute(
+                        f"DELETE FROM {self.table} WHERE rowid IN"
+                        f" (SELECT rowid FROM {self.table} ORDER BY created_at LIMIT ?)", (excess,)).rowcount
+            conn.commit()
+            self._writes_since_evict = 0
+        return removed
+
+    def remove_backend(self, backend):
+        """Drop every entry stored under `backend`; returns how many there were."""
+        with self._write_lock:
+            conn = self._connection()
+            removed = conn.execute(f"DELETE FROM {self.table} WHERE backend = ?", (backend,)).rowcount
+            conn.commit()
+        return removed
+
+    def clear(self):
+        with self._write_lock:
+            conn = self._connection()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+
+    def __len__(self):
+        return self._connection().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def close(self):
+        with self._write_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+            self._local = threading.local()
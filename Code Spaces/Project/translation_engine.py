@@ -0,0 +1,814 @@
+"""GUI-free translation engine.
+
+Everything needed to translate a DataFrame or a file lives here, with no
+Tk import, so the same code runs behind the Tk front-end (gemini v1.py)
+and headless from the command line (translate_cli.py) on servers and cron.
+"""
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from translation_cache import TranslationCache, DEFAULT_CACHE_PATH
+from backends import create_backends, DEFAULT_BACKENDS
+from async_engine import AsyncTranslationEngine, DEFAULT_BATCH_CHARS, DEFAULT_CONCURRENCY
+from streaming import DEFAULT_CHUNKSIZE, should_stream, stream_translate_csv
+from checkpoint import CheckpointJournal, journal_path_for, job_signature
+from phrase_matcher import PhraseMatcher, remainders, compose
+from table_io import read_table as read_any_table, write_table
+from metrics import Metrics, MetricsExporter, DEFAULT_EXPORT_INTERVAL
+from progress import ProgressReporter
+from transliterate import Transliterator, detect_name_columns
+from token_memory import TOKEN_BACKEND, TOKEN_TABLE, align, is_segment_column, segment, words as token_words
+from passthrough import is_passthrough, passthrough_mask
+from lazy_imports import lazy_import
+
+# The GUIs import this module before their window is up; see lazy_imports.py
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+CUSTOM_TRANSLATIONS_FILE = 'custom_translations.json'
+PROCESS_POOL_MIN_ROWS = 20000  # Smaller frames are classified in-process; the pool wouldn't pay off
+SHARDS_PER_WORKER = 2  # Row ranges per worker process, so one slow shard doesn't idle the others
+
+# keep_default_na=False treats empty strings as empty, not NaN
+# na_filter=False also helps ensure empty strings are read as such
+CSV_READ_OPTIONS = dict(encoding='utf-8', keep_default_na=False, na_filter=False, dtype=str)
+
+# Default common translations (can be extensive)
+COMMON_TRANSLATIONS = {
+    # Personal Information
+    "name": "নাম", "first name": "প্রথম নাম", "last name": "শেষ নাম", "full name": "পূর্ণ নাম",
+    "father name": "পিতার নাম", "mother name": "মাতার নাম", "father's name": "পিতার নাম",
+    "mother's name": "মাতার নাম", "age": "বয়স", "sex": "লিঙ্গ", "gender": "লিঙ্গ",
+    "male": "পুরুষ", "female": "নারী", "address": "ঠিকানা", "phone": "ফোন", "mobile": "মোবাইল",
+    "email": "ইমেইল", "id": "আইডি", "id number": "আইডি নম্বর", "nid": "জাতীয় পরিচয়পত্র",
+    "national id": "জাতীয় পরিচয়পত্র", "passport": "পাসপোর্ট", "birth certificate": "জন্ম নিবন্ধন",
+    "date of birth": "জন্ম তারিখ", "birth date": "জন্ম তারিখ", "religion": "ধর্ম",
+    "nationality": "জাতীয়তা", "occupation": "পেশা", "profession": "পেশা", "job": "চাকরি",
+    "work": "কাজ", "salary": "বেতন", "income": "আয়", "marital status": "বৈবাহিক অবস্থা",
+    "married": "বিবাহিত", "unmarried": "অবিবাহিত", "single": "অবিবাহিত",
+    "divorced": "তালাকপ্রাপ্ত", "widow": "বিধবা", "widower": "বিপত্নীক",
+
+    # Educational Information
+    "education": "শিক্ষা", "qualification": "যোগ্যতা", "degree": "ডিগ্রি", "school": "স্কুল",
+    "college": "কলেজ", "university": "বিশ্ববিদ্যালয়", "institute": "প্রতিষ্ঠান",
+    "student": "শিক্ষার্থী", "teacher": "শিক্ষক", "class": "শ্রেণী", "grade": "গ্রেড",
+    "result": "ফলাফল", "marks": "নম্বর", "percentage": "শতাংশ", "cgpa": "সিজিপিএ",
+    "gpa": "জিপিএ", "subject": "বিষয়", "course": "কোর্স", "semester": "সেমিস্টার",
+    "year": "বছর", "batch": "ব্যাচ", "roll": "রোল", "roll number": "রোল নম্বর",
+    "registration": "নিবন্ধন", "admission": "ভর্তি",
+
+    # Address and Location
+    "district": "জেলা", "division": "বিভাগ", "upazila": "উপজেলা", "thana": "থানা",
+    "village": "গ্রাম", "union": "ইউনিয়ন", "ward": "ওয়ার্ড", "city": "শহর", "town": "শহর",
+    "area": "এলাকা", "road": "রাস্তা", "street": "রাস্তা", "house": "বাড়ি", "flat": "ফ্ল্যাট",
+    "building": "ভবন", "postal code": "পোস্টাল কোড", "zip code": "জিপ কোড",
+    "pin code": "পিন কোড", "country": "দেশ", "bangladesh": "বাংলাদেশ", "dhaka": "ঢাকা",
+    "chittagong": "চট্টগ্রাম", "sylhet": "সিলেট", "rajshahi": "রাজশাহী", "khulna": "খুলনা",
+    "barisal": "বরিশাল", "rangpur": "রংপুর", "mymensingh": "ময়মনসিংহ",
+
+    # Common Words and Phrases
+    "yes": "হ্যাঁ", "no": "না", "true": "সত্য", "false": "মিথ্যা", "good": "ভাল", "bad": "খারাপ",
+    "new": "নতুন", "old": "পুরানো", "total": "মোট", "amount": "পরিমাণ", "date": "তারিখ",
+    "time": "সময়", "present": "উপস্থিত", "absent": "অনুপস্থিত",
+
+    # Status and Conditions
+    "active": "সক্রিয়", "inactive": "নিষ্ক্রিয়", "valid": "বৈধ", "invalid": "অবৈধ",
+    "approved": "অনুমোদিত", "rejected": "প্রত্যাখ্যাত", "pending": "অপেক্ষমাণ",
+    "complete": "সম্পূর্ণ", "incomplete": "অসম্পূর্ণ"
+    # Add more common translations as needed
+}
+
+# ID numbers (NID, passport, ...) and phone numbers are never sent to a backend
+ID_NUMBER_PATTERN = re.compile(r'^[0-9\-\s]+$')
+PHONE_NUMBER_PATTERN = re.compile(r'^[\+]?[0-9\-\s\(\)]+$')
+BENGALI_DIGITS = str.maketrans('0123456789', '০১২৩৪৫৬৭৮৯')
+
+
+def is_number_like(text):
+    """True for ID or phone numbers, which are kept as numbers rather than translated."""
+    text = text.strip()
+    return bool((ID_NUMBER_PATTERN.match(text) and len(text) >= 4) or
+                (PHONE_NUMBER_PATTERN.match(text) and len(text) >= 7))
+
+
+def to_bengali_digits(text):
+    return text.translate(BENGALI_DIGITS)
+
+
+def preprocess_text(text):
+    """Lookup key of a cell: lowercase, trimmed, single spaces."""
+    if pd.isna(text) or text is None: # Added None check
+        return ""
+    text_str = str(text).strip().lower()
+    text_str = re.sub(r'\s+', ' ', text_str)
+    return text_str
+
+
+def classify_values(values_by_column, preserve_columns, common_translations, phrase_matcher=None, offset=0,
+                    name_columns=(), transliterator=None, name_fallback=False):
+    """Local-only stage for one row range: everything that doesn't need a backend.
+
+    Cells that need no translation (empty, already Bengali, numbers, emails,
+    dates, codes; see passthrough.py) are found with one vectorized pass per
+    column and kept as they are, except that ID/phone numbers are converted
+    to Bengali digits in preserve_columns. Whole-cell dictionary hits are
+    resolved, names in name_columns are transliterated, and the remaining
+    texts are split into dictionary phrases where possible. With
+    name_fallback, only the confidently transliterated words of a name are
+    kept and the cell is split so the rest goes to a backend.
+    Positions are row offsets into the frame, starting at `offset`.
+    Returns (local, misses, splits, dictionary_hits, names):
+    local maps column -> ([positions], [values]) for the resolved cells,
+    misses lists (column, position, text, key) and splits maps each split
+    text to its phrase_matcher/transliterator parts.
+    """
+    local = {}
+    misses = []
+    splits = {}
+    hits = 0
+    names = 0
+    for col, values in values_by_column.items():
+        convert_numbers = col in preserve_columns
+        is_name = transliterator is not None and col in name_columns
+        positions = []
+        resolved = []
+        skip = passthrough_mask(values).to_numpy()
+        if convert_numbers:
+            for index in np.flatnonzero(skip).tolist():
+                value = values[index]
+                if not pd.isna(value) and is_number_like(str(value)):
+                    positions.append(offset + index)
+                    resolved.append(to_bengali_digits(str(value)))
+        # Only cells with something to translate go through the per-value loop
+        for index in np.flatnonzero(~skip).tolist():
+            position = offset + index
+            str_value = str(values[index]) # Convert once
+            key = preprocess_text(str_value)
+            translation = common_translations.get(key)
+            if translation is not None:
+                positions.append(position)
+                resolved.append(translation)
+                hits += 1
+                continue
+            text = str_value.strip()
+            if is_name:
+                parts = transliterator.split(text, keep_unsure=not name_fallback)
+                if all(bengali is not None for _, bengali in parts):
+                    positions.append(position)
+                    resolved.append(''.join(bengali for _, bengali in parts))
+                    names += 1
+                    continue
+                misses.append((col, position, text, key))
+                splits[text] = parts  # Only the unsure words go to a backend
+                continue
+            misses.append((col, position, text, key))
+            if phrase_matcher is not None and text not in splits:
+                splits[text] = phrase_matcher.split(text)
+        local[col] = (positions, resolved)
+    return local, misses, {text: parts for text, parts in splits.items() if parts is not None}, hits, names
+
+
+_worker_state = {}
+
+
+def _init_worker(common_translations, phrase_matching, transliterate_names):
+    # Runs once per worker process, so the dictionary and automaton aren't shipped with every shard
+    _worker_state['common'] = common_translations
+    _worker_state['matcher'] = PhraseMatcher(common_translations) if phrase_matching else None
+    _worker_state['transliterator'] = Transliterator() if transliterate_names else None
+
+
+def _classify_in_worker(values_by_column, preserve_columns, offset, name_columns, name_fallback):
+    return classify_values(values_by_column, preserve_columns, _worker_state['common'],
+                           _worker_state['matcher'], offset, name_columns,
+                           _worker_state['transliterator'], name_fallback)
+
+
+def print_log(message, level="info"):
+    print(f"[{level.upper()}] {message}")
+
+
+def load_common_translations(custom_file_path=CUSTOM_TRANSLATIONS_FILE, log=print_log):
+    """Load common English to Bangla translations and custom saved translations."""
+    common_translations = dict(COMMON_TRANSLATIONS)
+    # Load custom translations from file, potentially overriding defaults or adding new ones
+    try:
+        if os.path.exists(custom_file_path):
+            with open(custom_file_path, 'r', encoding='utf-8') as f:
+                custom_dict = json.load(f)
+                common_translations.update(custom_dict)
+                log(f"Loaded {len(custom_dict)} custom translations from {custom_file_path}.")
+    except json.JSONDecodeError:
+        log(f"Warning: Could not decode {custom_file_path}. File might be corrupted. Using defaults.", "warning")
+    except Exception as e:
+        log(f"Error loading custom translations from {custom_file_path}: {e}", "error")
+    return common_translations
+
+
+def read_table(file_path):
+    """Load a whole CSV, Excel, Parquet or Feather file with every cell as a string."""
+    return read_any_table(file_path, **CSV_READ_OPTIONS)
+
+
+def shard_row_range(total_rows, shard):
+    """Row range (start, stop) of shard (K, N): the K-th of N near-equal slices."""
+    index, count = shard
+    size = -(-total_rows // count)  # Ceiling division
+    return min(total_rows, index * size), min(total_rows, (index + 1) * size)
+
+
+class TranslationEngine:
+    """Dictionary, caches and backends behind every translation job.
+
+    Lookups go common dictionary (incl. custom_translations.json), then the
+    in-session cache, then the persistent on-disk cache. Dictionary phrases
+    inside longer cells are translated locally (phrase_matching), and only
+    what is left goes to the backends through an AsyncTranslationEngine.
+    """
+
+    def __init__(self, backend_names=DEFAULT_BACKENDS, concurrency=DEFAULT_CONCURRENCY,
+                 batch_chars=DEFAULT_BATCH_CHARS, source='en', target='bn',
+                 cache_path=DEFAULT_CACHE_PATH, custom_translations_path=CUSTOM_TRANSLATIONS_FILE, log=None,
+                 phrase_matching=True, local_workers=1, metrics_path=None,
+                 metrics_interval=DEFAULT_EXPORT_INTERVAL, transliterate_names=True, name_columns=None,
+                 name_fallback=False, token_memory=True):
+        self.log = log or print_log
+        self.phrase_matching = phrase_matching
+        # Person names are transliterated locally instead of sent to a backend.
+        # name_columns=None detects them from headers and values; with
+        # name_fallback, words the rules aren't sure about still go to a backend
+        self.transliterator = Transliterator() if transliterate_names else None
+        self.name_columns = name_columns
+        self.name_fallback = name_fallback
+        # Name/address cells made of mostly known words are composed word by word
+        self.token_memory = token_memory
+        # Worker processes for the local stage (numbers, dictionary, phrases); 1 keeps it in-process
+        self.local_workers = local_workers
+        self._pool = None
+        self.concurrency = concurrency
+        self.batch_chars = batch_chars
+        self.custom_translations_path = custom_translations_path
+        # Thread-safe counters and timers; exported to metrics_path (.json or
+        # Prometheus text) every metrics_interval seconds and when a job ends
+        self.metrics = Metrics()
+        self.metrics_path = metrics_path
+        self.metrics_interval = metrics_interval
+        self._exporter = None
+        self.backend_stats = {}
+        # Updated as cells finish; front-ends sample it on a timer for progress/ETA
+        self.progress = ProgressReporter()
+
+        # Each backend carries its own token bucket (see backends.BACKEND_LIMITS).
+        # They are created, and their client libraries imported, on first use
+        self.backend_names = tuple(backend_names)
+        self.source = source
+        self.target = target
+        self._translators = None
+        self._translators_lock = threading.Lock()
+        self.common_translations = load_common_translations(custom_translations_path, self.log)
+        # Finds dictionary phrases inside longer cells; rebuilt when the dictionary changes
+        self.phrase_matcher = PhraseMatcher(self.common_translations)
+        # This will store API-fetched translations for the current session before saving
+        self.translation_cache = {}
+        # On-disk cache shared with the other front-ends; survives restarts
+        self.persistent_cache = TranslationCache(cache_path, source=source, target=target)
+        # Learned word pairs, in a table of their own so they never answer a cell lookup
+        self.token_cache = TranslationCache(cache_path, source=source, target=target, table=TOKEN_TABLE)
+        if self.token_cache.created:
+            # Older versions kept the pairs among the cell translations, unverified
+            self.persistent_cache.remove_backend(TOKEN_BACKEND)
+        # Hits prefetched from the persistent cache for the current job
+        self.persistent_translations = {}
+
+    @property
+    def translators(self):
+        with self._translators_lock:
+            if self._translators is None:
+                self._translators = create_backends(self.backend_names, source=self.source, target=self.target)
+            return self._translators
+
+    @translators.setter
+    def translators(self, backends):
+        with self._translators_lock:
+            self._translators = backends
+
+    @property
+    def cache_hits(self):
+        return self.metrics.total('translator_cache_lookups_total', result='hit')
+
+    @property
+    def api_calls(self):
+        return self.metrics.total('translator_api_calls_total')
+
+    def reset_stats(self):
+        self.metrics.reset()
+
+    def export_metrics(self):
+        if self.metrics_path:
+            try:
+                self.metrics.export(self.metrics_path)
+            except OSError as e:
+                self.log(f"Could not write metrics to {self.metrics_path}: {e}", "warning")
+
+    def save_custom_translations(self):
+        """Save newly learned API translations by merging them with existing custom translations."""
+        custom_file_path = self.custom_translations_path
+        existing_custom = {}
+        try:
+            if os.path.exists(custom_file_path):
+                with open(custom_file_path, 'r', encoding='utf-8') as f:
+                    try:
+                        existing_custom = json.load(f)
+                    except json.JSONDecodeError:
+                        self.log(f"Warning: {custom_file_path} was corrupted. Overwriting with current session's learned translations.", "warning")
+
+            # Merge: new translations from self.translation_cache take precedence
+            existing_custom.update(self.translation_cache)
+
+            with open(custom_file_path, 'w', encoding='utf-8') as f:
+                json.dump(existing_custom, f, ensure_ascii=False, indent=2)
+            self.log(f"Custom dictionary saved to {custom_file_path} with {len(existing_custom)} total entries.")
+            # Optionally, update self.common_translations with the newly saved combined set
+            self.common_translations.update(existing_custom)
+            self.phrase_matcher = PhraseMatcher(self.common_translations)
+            self._close_pool() # Workers hold the old dictionary
+
+        except Exception as e:
+            self.log(f"Error saving custom translations to {custom_file_path}: {e}", "error")
+
+    def preprocess_text(self, text):
+        return preprocess_text(text)
+
+    def get_cached_translation(self, text):
+        if is_passthrough(text): # Empty, already Bengali, or an email/date/code
+            return str(text) # Return original string form
+
+        processed_text = self.preprocess_text(text)
+        if not processed_text: # If after preprocessing it's empty
+            return str(text)
+
+        # Check common_translations (includes custom.json loaded at start)
+        if processed_text in self.common_translations:
+            self.metrics.inc('translator_cache_lookups_total', tier='common', result='hit')
+            return self.common_translations[processed_text]
+        self.metrics.inc('translator_cache_lookups_total', tier='common', result='miss')
+
+        # Dictionary phrases inside longer cells are handled by phrase_matcher
+        return self._lookup_caches(processed_text)
+
+    def _lookup_caches(self, key):
+        # Check translation_cache (API results from current session)
+        if key in self.translation_cache:
+            self.metrics.inc('translator_cache_lookups_total', tier='session', result='hit')
+            return self.translation_cache[key]
+        self.metrics.inc('translator_cache_lookups_total', tier='session', result='miss')
+
+        # Check translations prefetched from the persistent cache for this job
+        if key in self.persistent_translations:
+            self.metrics.inc('translator_cache_lookups_total', tier='persistent', result='hit')
+            return self.persistent_translations[key]
+        self.metrics.inc('translator_cache_lookups_total', tier='persistent', result='miss')
+        return None
+
+    def _open_remote(self):
+        if self.metrics_path:
+            self._exporter = MetricsExporter(self.metrics, self.metrics_path, self.metrics_interval, self.log).start()
+        return AsyncTranslationEngine(self.translators, concurrency=self.concurrency,
+                                      batch_chars=self.batch_chars, log=self.log, metrics=self.metrics)
+
+    def _close_remote(self, remote):
+        from http_clients import session_pool
+
+        remote.close()
+        session_pool.close()  # The remote's worker threads are gone; so is the use for their connections
+        self.backend_stats = remote.scheduler.snapshot()
+        if self._exporter:
+            self._exporter.stop()
+            self._exporter = None
+
+    def _segment_by_tokens(self, texts):
+        """Word-by-word parts for the texts whose words the token memory mostly knows."""
+        cell_words = {word.lower() for text in texts for word in token_words(text)}
+        # One bulk lookup each per frame/chunk: learned pairs, then single-word cells
+        known = self.token_cache.get_many(cell_words)
+        known.update(self.persistent_cache.get_many(cell_words))
+        for word in cell_words:
+            local = self.common_translations.get(word) or self.translation_cache.get(word)
+            if local:
+                known[word] = local
+        segmented = {}
+        for text in texts:
+            parts = segment(text, known)
+            if parts is not None:
+                segmented[text] = parts
+        self.metrics.inc('translator_token_memory_cells_total', len(segmented))
+        return segmented
+
+    def _name_columns(self, source_df, columns):
+        if self.transliterator is None:
+            return set()
+        if self.name_columns is not None:
+            return {col for col in columns if col in self.name_columns}
+        return set(detect_name_columns(source_df, columns))
+
+    def _classify(self, source_df, columns, preserve_number_columns, name_columns):
+        """Run the local stage over `columns`, sharded across worker processes when enabled."""
+        values_by_column = {col: source_df[col].to_numpy(dtype=object) for col in columns}
+        preserve = {col for col in columns if col in preserve_number_columns}
+        rows = len(source_df)
+        matcher = self.phrase_matcher if self.phrase_matching else None
+        if self.local_workers <= 1 or rows < PROCESS_POOL_MIN_ROWS:
+            return classify_values(values_by_column, preserve, self.common_translations, matcher, 0,
+                                   name_columns, self.transliterator, self.name_fallback)
+
+        # Only the selected columns' values for one row range go to each worker,
+        # and only the locally resolved cells and the misses come back
+        shard_count = self.local_workers * SHARDS_PER_WORKER
+        pool = self._local_pool()
+        futures = []
+        for index in range(shard_count):
+            start, stop = shard_row_range(rows, (index, shard_count))
+            if start < stop:
+                shard = {col: values[start:stop] for col, values in values_by_column.items()}
+                futures.append(pool.submit(_classify_in_worker, shard, preserve, start,
+                                           name_columns, self.name_fallback))
+        local = {col: ([], []) for col in columns}
+        misses = []
+        splits = {}
+        hits = 0
+        names = 0
+        for future in futures:
+            shard_local, shard_misses, shard_splits, shard_hits, shard_names = future.result()
+            for col, (positions, values) in shard_local.items():
+                local[col][0].extend(positions)
+                local[col][1].extend(values)
+            misses.extend(shard_misses)
+            splits.update(shard_splits)
+            hits += shard_hits
+            names += shard_names
+        return local, misses, splits, hits, names
+
+    def _local_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.local_workers, initializer=_init_worker,
+                initargs=(self.common_translations, self.phrase_matching, self.transliterator is not None))
+        return self._pool
+
+    def _close_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _translate_frame(self, source_df, columns, preserve_number_columns, remote,
+                         report=None, should_cancel=None, journal=None):
+        """Translate `columns` of one DataFrame (the whole file or a streamed chunk).
+
+        With a journal, cells finished by an earlier run are restored instead of
+        translated again, and every newly translated cell is journaled.
+        report(done, total) is called with cell counts as work completes.
+        """
+        # Every selected column gets one result array, written by position
+        # (index labels may repeat) and swapped into a shallow copy at the end
+        results = {col: source_df[col].to_numpy(dtype=object).copy() for col in columns}
+
+        def assemble():
+            self.metrics.inc('translator_stage_seconds_total', time.perf_counter() - translate_started,
+                             stage='translate')
+            with self.metrics.timer('assemble'):
+                translated_df = source_df.copy(deep=False)
+                for col in columns:
+                    translated_df[col] = results[col]
+            return translated_df
+
+        # Local stage: numbers, dictionary hits, names and phrase splitting, possibly in worker processes
+        with self.metrics.timer('classify'):
+            name_columns = self._name_columns(source_df, columns)
+            if name_columns:
+                self.log(f"Transliterating name columns locally: {', '.join(map(str, name_columns))}")
+            local, misses, split_texts, dictionary_hits, names = self._classify(
+                source_df, columns, preserve_number_columns, name_columns)
+            for col, (positions, values) in local.items():
+                if positions:
+                    results[col][positions] = values
+        self.metrics.inc('translator_cache_lookups_total', dictionary_hits, tier='common', result='hit')
+        self.metrics.inc('translator_cache_lookups_total', len(misses), tier='common', result='miss')
+        self.metrics.inc('translator_names_transliterated_total', names)
+        local_hits = dictionary_hits + names
+        translate_started = time.perf_counter()
+
+        translation_data_to_process = []
+        resumed_cells = 0
+        for col, position, text, key in misses:
+            journaled = journal.get_cell(source_df.index[position], col) if journal else None
+            if journaled is not None:
+                results[col][position] = journaled
+                resumed_cells += 1
+            else:
+                translation_data_to_process.append((col, position, text, key))
+        if resumed_cells:
+            self.log(f"Restored {resumed_cells} cells translated by the interrupted run.")
+
+        total_items = len(translation_data_to_process) + local_hits
+        if not translation_data_to_process:
+            if not local_hits:
+                self.log("No non-empty text found in selected columns to translate.", "info")
+            return assemble()
+
+        self.log(f"Preparing to translate {total_items} text items.")
+        # One bulk lookup up front instead of a disk query per cell
+        unique_texts = {key for _, _, _, key in translation_data_to_process}
+        self.persistent_translations = self.persistent_cache.get_many(unique_texts)
+        self.log(f"Persistent cache: {len(self.persistent_translations)} of {len(unique_texts)} unique texts already translated.")
+
+        # Cells answered by the caches are filled in locally;
+        # the distinct misses are packed into batched requests by the engine
+        pending_cells = {}
+        text_to_key = {}
+        for col, position, text, key in translation_data_to_process:
+            cached = self._lookup_caches(key)
+            if cached is not None:
+                results[col][position] = cached
+            else:
+                if key not in pending_cells:
+                    pending_cells[key] = []
+                    text_to_key[text] = key
+                pending_cells[key].append((col, position))
+        processed_item_count = total_items - sum(len(cells) for cells in pending_cells.values())
+
+        # Cells containing dictionary phrases were split by the local stage; only
+        # the pieces between the phrases go to a backend and the cell is put
+        # together once they're back
+        split_texts = {text: parts for text, parts in split_texts.items() if text in text_to_key}
+        # Token memory: name/address cells whose words were mostly seen before are
+        # composed the same way, with only the unseen words as remainders
+        segment_texts = set()
+        if self.token_memory:
+            segment_columns = {col for col in columns if is_segment_column(col)}
+            segment_texts = {text for text, key in text_to_key.items() if text not in split_texts
+                             and any(col in segment_columns for col, _ in pending_cells[key])}
+            if segment_texts:
+                split_texts.update(self._segment_by_tokens(segment_texts))
+        learned_words = []
+        waiting_on = {}  # remainder piece -> texts that need it
+        piece_translations = {}
+        if split_texts:
+            pieces = {piece for parts in split_texts.values() for piece in remainders(parts)}
+            self.persistent_translations.update(
+                self.persistent_cache.get_many({self.preprocess_text(piece) for piece in pieces}))
+            for text, parts in split_texts.items():
+                for piece in remainders(parts):
+                    cached = self._lookup_caches(self.preprocess_text(piece))
+                    if cached is not None:
+                        piece_translations[piece] = cached
+                    else:
+                        waiting_on.setdefault(piece, []).append(text)
+        remote_texts = [text for text in text_to_key if text not in split_texts]
+        remote_texts += [piece for piece in waiting_on if piece not in text_to_key or piece in split_texts]
+        if split_texts:
+            self.log(f"{len(split_texts)} texts are composed from dictionary phrases or known words; "
+                     f"{len(waiting_on)} remaining pieces need a translation service.")
+        self.log(f"{len(remote_texts)} distinct texts need a translation service "
+                 f"({self.concurrency} parallel requests, up to {self.batch_chars} characters each).")
+
+        def fill_cells(text, translated_text, record=True):
+            nonlocal processed_item_count
+            cells = pending_cells[text_to_key[text]]
+            if translated_text:
+                for col, position in cells:
+                    results[col][position] = translated_text
+                if journal and record:
+                    journal.record_cells((source_df.index[position], col, translated_text) for col, position in cells)
+            processed_item_count += len(cells)
+
+        finished_splits = set()
+        failed_pieces = set()
+
+        def finish_split(text):
+            if text in finished_splits:
+                return
+            pieces = remainders(split_texts[text])
+            if all(piece in piece_translations for piece in pieces):
+                finished_splits.add(text)
+                translated_text = compose(split_texts[text], piece_translations)
+                if any(piece in failed_pieces for piece in pieces):
+                    # Part of the cell is still English: shown as it is, but kept out of
+                    # the caches, the journal and the custom dictionary so the next run retries it
+                    fill_cells(text, translated_text, record=False)
+                    self.metrics.inc('translator_cells_failed_total', len(pending_cells[text_to_key[text]]))
+                    return
+                self.translation_cache[text_to_key[text]] = translated_text
+                fill_cells(text, translated_text)
+
+        for text in split_texts:
+            finish_split(text)  # Completes the texts whose pieces were all known already
+
+        def on_result(text, translated_text, backend_name):
+            # Runs on the engine's event loop thread, one result at a time
+            if translated_text:
+                key = self.preprocess_text(text)
+                self.translation_cache[key] = translated_text
+                self.persistent_cache.put(key, translated_text, backend=backend_name)
+            if text in text_to_key and text not in split_texts:
+                fill_cells(text, translated_text)
+                if not translated_text:
+                    self.metrics.inc('translator_cells_failed_total', len(pending_cells[text_to_key[text]]))
+                if translated_text and text in segment_texts:
+                    learned_words.extend(align(text, translated_text, self.transliterator))
+            if text in waiting_on:
+                # A failed piece stays in English rather than holding back the cell
+                piece_translations[text] = translated_text or text
+                if not translated_text:
+                    failed_pieces.add(text)
+                for waiting_text in waiting_on[text]:
+                    finish_split(waiting_text)
+            if report:
+                report(processed_item_count, total_items)
+
+        if report:
+            report(processed_item_count, total_items)
+        remote.run(remote_texts, on_result=on_result, should_cancel=should_cancel)
+        if failed_pieces:
+            self.log(f"{len(failed_pieces)} pieces could not be translated; the cells containing them "
+                     "were left partly in English and will be retried on the next run.", "warning")
+        if learned_words:
+            # Word pairs of translated name/address cells, for composing the next ones
+            self.token_cache.put_many(learned_words, backend=TOKEN_BACKEND)
+        return assemble()
+
+    @contextmanager
+    def batch(self):
+        """Keep one remote (worker threads, backend connections) open for several frames.
+
+        Pass what it yields as translate_dataframe(..., remote=...); used for
+        the sheets of a batch job (job_runner.py).
+        """
+        remote = self._open_remote()
+        try:
+            yield remote
+        finally:
+            self._close_remote(remote)
+
+    def translate_dataframe(self, df, columns, preserve_number_columns=(), progress=None,
+                            should_cancel=None, journal=None, remote=None):
+        """Translate `columns` of an in-memory DataFrame and return the translated copy.
+
+        Columns in preserve_number_columns get ID/phone numbers converted to
+        Bengali digits; elsewhere numbers are kept as they are.
+        self.progress counts finished cells; progress(percent) is called as well.
+        remote comes from batch(); without it one is opened for this frame.
+        """
+        self.progress.start(unit='cells')
+
+        def report(done, total):
+            self.progress.update(done, total)
+            if progress:
+                progress(done / total * 100)
+
+        if remote is not None:
+            return self._translate_frame(df, columns, preserve_number_columns, remote,
+                                         report, should_cancel, journal)
+        with self.batch() as remote:
+            return self._translate_frame(df, columns, preserve_number_columns, remote,
+                                         report, should_cancel, journal)
+
+    def translate_chunks(self, chunks, columns, preserve_number_columns=(), total_rows=None,
+                         should_cancel=None, journal=None):
+        """Translate DataFrame chunks as they arrive (e.g. TableLoader.chunks()) and return them as one frame.
+
+        Chunks must be indexed by their row positions in the file, so a
+        journal finds the same cells as with the whole frame. self.progress
+        counts rows; total_rows() gives the current estimate of the total.
+        After a cancel only the chunks translated so far are returned.
+        """
+        self.progress.start(unit='rows')
+        translated = []
+        rows_done = 0
+
+        def report(done, total):
+            # Cells of the current chunk, scaled to its rows
+            rows = rows_done + (round(done / total * chunk_rows) if total else 0)
+            self.progress.update(rows, max(total_rows() if total_rows else 0, rows))
+
+        remote = self._open_remote()
+        try:
+            for chunk in chunks:
+                if should_cancel and should_cancel():
+                    break
+                chunk_rows = len(chunk)
+                translated.append(self._translate_frame(chunk, columns, preserve_number_columns, remote,
+                                                        report, should_cancel, journal))
+                rows_done += chunk_rows
+        finally:
+            self._close_remote(remote)
+        return pd.concat(translated) if translated else None
+
+    def translate_csv_stream(self, input_path, output_path, columns, preserve_number_columns=(),
+                             progress=None, should_cancel=None, journal=None, chunksize=DEFAULT_CHUNKSIZE):
+        """Translate a CSV chunk by chunk into output_path; returns the number of rows written.
+
+        self.progress counts rows; the total is estimated from how much of the file was read.
+        """
+        self.progress.start(unit='rows')
+
+        def report(rows_done, fraction):
+            self.progress.update(rows_done, round(rows_done / fraction) if fraction else None)
+            if progress:
+                progress(fraction * 100)
+
+        remote = self._open_remote()
+        try:
+            return stream_translate_csv(
+                input_path, output_path,
+                lambda chunk: self._translate_frame(chunk, columns, preserve_number_columns, remote,
+                                                    should_cancel=should_cancel),
+                chunksize=chunksize,
+                progress_callback=report,
+                should_cancel=should_cancel, checkpoint=journal, **CSV_READ_OPTIONS)
+        finally:
+            self._close_remote(remote)
+
+    def translate_file(self, input_path, output_path, columns=None, preserve_number_columns=(),
+                       stream=None, resume=True, progress=None, should_cancel=None,
+                       chunksize=DEFAULT_CHUNKSIZE, shard=None):
+        """Load, translate and save one file; returns a summary dict.
+
+        columns=None translates every column. stream=None streams CSVs above
+        the size threshold. With resume, finished work is journaled next to
+        the output and a rerun of the same job continues from the journal.
+        shard=(K, N) translates only the K-th of N row slices, so one file
+        can be split across machines.
+        """
+        self.reset_stats()
+        stream = should_stream(input_path) if stream is None else stream
+        if stream and not input_path.lower().endswith('.csv'):
+            raise ValueError("Streaming mode only supports CSV input")
+        if stream and not output_path.lower().endswith('.csv'):
+            raise ValueError("Streaming mode writes CSV output")
+        if stream and shard:
+            raise ValueError("Shards are not supported in streaming mode")
+
+        if stream:
+            columns = list(columns) if columns else list(pd.read_csv(input_path, nrows=0, **CSV_READ_OPTIONS).columns)
+            df = None
+        else:
+            with self.metrics.timer('load'):
+                df = read_table(input_path)
+            if shard:
+                start, stop = shard_row_range(len(df), shard)
+                df = df.iloc[start:stop]
+            columns = list(columns) if columns else list(df.columns)
+            missing = [col for col in columns if col not in df.columns]
+            if missing:
+                raise ValueError(f"Columns not found in {input_path}: {', '.join(map(str, missing))}")
+
+        journal = None
+        if resume:
+            signature = job_signature(input_path, columns, output_path)
+            if shard:
+                signature['shard'] = list(shard)
+            journal = CheckpointJournal(journal_path_for(output_path), signature)
+            if journal.resumed:
+                self.log(f"Resuming interrupted job: {len(journal.cells)} cells, "
+                         f"{journal.chunks_done} chunks already done.")
+        try:
+            if stream:
+                rows = self.translate_csv_stream(input_path, output_path, columns, preserve_number_columns,
+                                                 progress, should_cancel, journal, chunksize)
+            else:
+                translated_df = self.translate_dataframe(df, columns, preserve_number_columns,
+                                                         progress, should_cancel, journal)
+                rows = len(translated_df)
+                if not (should_cancel and should_cancel()):
+                    with self.metrics.timer('save'):
+                        write_table(translated_df, output_path)
+            cancelled = bool(should_cancel and should_cancel())
+            if not cancelled:
+                self.save_custom_translations() # Auto-save newly learned translations
+                if journal:
+                    journal.complete() # Nothing left to resume
+        finally:
+            if journal:
+                journal.close()
+            self.export_metrics()
+        return {
+            'input': input_path,
+            'output': output_path,
+            'rows': rows,
+            'columns': columns,
+            'streamed': stream,
+            'cancelled': cancelled,
+            'cache_hits': self.cache_hits,
+            'api_calls': self.api_calls,
+            'backends': self.backend_stats,
+        }
+
+    def close(self):
+        self._close_pool()
+        self.persistent_cache.close()
+        self.token_cache.close()
@@ -1,138 +1,244 @@
-import customtkinter as ctk
-import pandas as pd
-from tkinter import filedialog
-from deep_translator import GoogleTranslator
-from concurrent.futures import ThreadPoolExecutor
-import threading
-import time
-import os
-
-BATCH_SIZE = 50
-df = None  # Global DataFrame
-header_vars = {}
-
-def translate_batch(text_list, target_lang="bn"):
-    try:
-        return GoogleTranslator(source='auto', target=target_lang).translate_batch(text_list)
-    except Exception as e:
-        print(f"Batch error: {e}")
-        return text_list
-
-def translate_column(column, progress_callback, col_index, total_cols):
-    text_list = column.fillna("").astype(str).tolist()
-    translated = []
-    for i in range(0, len(text_list), BATCH_SIZE):
-        batch = text_list[i:i + BATCH_SIZE]
-        translated.extend(translate_batch(batch))
-        progress_callback(col_index, i + BATCH_SIZE, len(text_list), total_cols)
-    return translated
-
-def start_translation_thread(selected_columns, file_path, output_label, progress_bar, timer_label, progress_percent_label):
-    threading.Thread(
-        target=translate_and_save,
-        args=(selected_columns, file_path, output_label, progress_bar, timer_label, progress_percent_label),
-        daemon=True
-    ).start()
-
-def translate_and_save(selected_columns, file_path, output_label, progress_bar, timer_label, progress_percent_label):
-    global df
-    start_time = time.time()
-    num_columns = len(selected_columns)
-    progress_bar.set(0)
-    progress_percent_label.configure(text="0%")
-
-    def progress_callback(col_index, batch_end, total_rows, total_cols):
-        batch_progress = min(batch_end / total_rows, 1.0)
-        overall = ((col_index + batch_progress) / total_cols)
-        progress_bar.set(overall)
-        progress_percent_label.configure(text=f"{int(overall * 100)}%")
-        elapsed = time.time() - start_time
-        timer_label.configure(text=f"⏱️ Elapsed: {elapsed:.1f} sec")
-        app.update_idletasks()
-
-    translated_data = {}
-    with ThreadPoolExecutor() as executor:
-        results = executor.map(
-            lambda i_col: translate_column(df[i_col], progress_callback, selected_columns.index(i_col), num_columns),
-            selected_columns
-        )
-    for col_name, translated_column in zip(selected_columns, results):
-        translated_data[col_name] = translated_column
-
-    for col in translated_data:
-        df[col] = translated_data[col]
-
-    output_path = os.path.join(os.path.dirname(file_path), "translated_output.xlsx")
-    df.to_excel(output_path, index=False)
-
-    elapsed = time.time() - start_time
-    output_label.configure(text=f"✅ Done in {elapsed:.1f} sec\nSaved to:\n{output_path}")
-    progress_bar.set(1.0)
-    progress_percent_label.configure(text="100%")
-    timer_label.configure(text=f"⏱️ Total Time: {elapsed:.1f} sec")
-
-def load_file_and_show_checkboxes(output_label, checkbox_frame, progress_bar, timer_label, progress_percent_label):
-    global df, header_vars
-    file_path = filedialog.askopenfilename(filetypes=[("Excel or CSV files", "*.xls *.xlsx *.csv")])
-    if not file_path:
-        return
-
-    ext = os.path.splitext(file_path)[1].lower()
-    df = pd.read_csv(file_path, dtype=str) if ext == '.csv' else pd.read_excel(file_path, dtype=str)
-
-    for widget in checkbox_frame.winfo_children():
-        widget.destroy()
-
-    header_vars.clear()
-
-    for header in df.columns:
-        var = ctk.BooleanVar(value=True)
-        checkbox = ctk.CTkCheckBox(checkbox_frame, text=header, variable=var)
-        checkbox.pack(anchor="w", pady=2, padx=10)
-        header_vars[header] = var
-
-    ctk.CTkButton(app, text="🚀 Start Translation",
-                  command=lambda: start_translation_thread(
-                      [col for col in header_vars if header_vars[col].get()],
-                      file_path,
-                      output_label,
-                      progress_bar,
-                      timer_label,
-                      progress_percent_label
-                  )).pack(pady=10)
-
-# ==== UI SETUP ====
-ctk.set_appearance_mode("system")  # 'dark', 'light', or 'system'
-ctk.set_default_color_theme("blue")
-
-app = ctk.CTk()
-app.title("Bangla Data Translator")
-app.geometry("600x630")
-app.resizable(False, False)
-
-ctk.CTkLabel(app, text="Bangla Data Translator", font=ctk.CTkFont("Segoe UI", 24, "bold")).pack(pady=(20, 10))
-ctk.CTkLabel(app, text="Select a CSV/Excel file, choose which columns to translate into Bangla.", wraplength=560).pack(pady=(0, 15))
-
-ctk.CTkButton(app, text="📂 Load File", command=lambda: load_file_and_show_checkboxes(output_label, checkbox_frame, progress_bar, timer_label, progress_percent_label)).pack(pady=10)
-
-checkbox_frame = ctk.CTkScrollableFrame(app, width=550, height=160)
-checkbox_frame.pack(pady=5)
-
-# Progress + Percentage
-progress_frame = ctk.CTkFrame(app, fg_color="transparent")
-progress_frame.pack(pady=(10, 0))
-
-progress_bar = ctk.CTkProgressBar(progress_frame, width=460, height=18)
-progress_bar.set(0)
-progress_bar.pack(side="left", padx=(10, 5))
-
-progress_percent_label = ctk.CTkLabel(progress_frame, text="0%", width=40, anchor="w")
-progress_percent_label.pack(side="left")
-
-timer_label = ctk.CTkLabel(app, text="", font=ctk.CTkFont(size=12))
-timer_label.pack(pady=(5, 10))
-
-output_label = ctk.CTkLabel(app, text="", wraplength=550, justify="center")
-output_label.pack(pady=10)
-
-app.mainloop()
+import customtkinter as ctk
+from tkinter import filedialog
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import os
+from translation_cache import TranslationCache, normalize_text
+from streaming import should_stream, read_csv_sample, stream_translate_csv
+from table_io import INPUT_FILETYPES, read_table, write_table
+from progress import ProgressReporter, SAMPLE_INTERVAL_MS, format_duration
+from passthrough import passthrough_mask
+from lazy_imports import lazy_import, preload
+
+# Loaded in the background once the window is up (see lazy_imports.py)
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+BATCH_SIZE = 50
+MAX_WORKERS = 8  # Parallel batches; about what Google tolerates before it throttles us
+df = None  # Global DataFrame (only a sample when streaming)
+streaming = False  # Large CSVs are translated chunk by chunk instead of loaded whole
+header_vars = {}
+# Keyed by source 'en' like the engine's and claude.py's entries, so the front-ends share them
+cache = TranslationCache(source='en', target='bn')
+progress = ProgressReporter()  # Bumped by the worker threads, sampled by the UI timer
+translating = False
+_clients = threading.local()  # One long-lived GoogleTranslator per worker thread and target language
+GoogleTranslator = None  # deep_translator's, imported by the first get_client() call
+preloader = None
+# Shared by every frame and streamed chunk, so the worker threads (and their
+# clients and keep-alive sessions) live for the whole job rather than one chunk
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="translate")
+
+def get_client(target_lang="bn"):
+    global GoogleTranslator
+    clients = getattr(_clients, 'by_target', None)
+    if clients is None:
+        clients = _clients.by_target = {}
+    if target_lang not in clients:
+        if GoogleTranslator is None:
+            from deep_translator import GoogleTranslator
+            from http_clients import install_session_pools
+            install_session_pools()  # ... whose requests reuse the thread's keep-alive connections
+        clients[target_lang] = GoogleTranslator(source='auto', target=target_lang)
+    return clients[target_lang]
+
+def translate_batch(text_list, target_lang="bn"):
+    # Only text the persistent cache has never seen is sent to Google
+    known = cache.get_many(text_list, target=target_lang)
+    misses = list(dict.fromkeys(text for text in text_list if normalize_text(text) not in known))
+    if misses:
+        try:
+            translated = get_client(target_lang).translate_batch(misses)
+            cache.put_many(zip(misses, translated), backend='GoogleTranslator', target=target_lang)
+            known.update((normalize_text(text), result) for text, result in zip(misses, translated) if result)
+        except Exception as e:
+            print(f"Batch error: {e}")
+    return [known.get(normalize_text(text)) or text for text in text_list]
+
+def translate_frame(frame, selected_columns, on_batch=None):
+    # Every selected column is cut into batches that go into one shared queue,
+    # so a single huge column keeps all workers busy instead of just one
+    texts = {col: frame[col].fillna("").astype(str).tolist() for col in selected_columns}
+    # Cells that are already Bengali, empty or not translatable (emails, dates,
+    # codes) are found per column in one pass and keep their text; only the
+    # positions of the rest are batched
+    todo = {col: np.flatnonzero(~passthrough_mask(texts[col]).to_numpy()).tolist() for col in selected_columns}
+    batches = [(col, start) for col in selected_columns for start in range(0, len(todo[col]), BATCH_SIZE)]
+    if on_batch:
+        skipped = sum(len(texts[col]) - len(todo[col]) for col in selected_columns)
+        if skipped:
+            on_batch(skipped)
+
+    def run(batch):
+        col, start = batch
+        text_list = [texts[col][position] for position in todo[col][start:start + BATCH_SIZE]]
+        translated = translate_batch(text_list)
+        if on_batch:
+            on_batch(len(text_list))
+        return translated
+
+    results = {col: list(texts[col]) for col in selected_columns}
+    # map yields in submission order, so each batch lands back on its own positions
+    for (col, start), translated in zip(batches, executor.map(run, batches)):
+        for position, text in zip(todo[col][start:start + BATCH_SIZE], translated):
+            results[col][position] = text
+    for col_name in selected_columns:
+        frame[col_name] = results[col_name]
+    return frame
+
+def show_progress(progress_bar, timer_label, progress_percent_label):
+    # Runs on the Tk thread 10 times a second while translating; the workers never touch widgets
+    if not translating:
+        return
+    snapshot = progress.sample()
+    progress_bar.set(snapshot.fraction)
+    progress_percent_label.configure(text=f"{int(snapshot.fraction * 100)}%")
+    details = f" | {snapshot.rate:.0f} {snapshot.unit}/s" if snapshot.rate else ""
+    if snapshot.eta is not None:
+        details += f" | ETA {format_duration(snapshot.eta)}"
+    timer_label.configure(text=f"⏱️ Elapsed: {snapshot.elapsed:.1f} sec{details}")
+    app.after(SAMPLE_INTERVAL_MS, show_progress, progress_bar, timer_label, progress_percent_label)
+
+def start_translation_thread(selected_columns, file_path, output_label, progress_bar, timer_label, progress_percent_label):
+    global translating
+    progress_bar.set(0)
+    progress_percent_label.configure(text="0%")
+    progress.start()
+    translating = True
+    show_progress(progress_bar, timer_label, progress_percent_label)
+    threading.Thread(
+        target=translate_and_save,
+        args=(selected_columns, file_path, output_label, progress_bar, timer_label, progress_percent_label),
+        daemon=True
+    ).start()
+
+def translate_and_save(selected_columns, file_path, output_label, progress_bar, timer_label, progress_percent_label):
+    global df, translating
+    start_time = time.time()
+
+    def show_done():
+        elapsed = time.time() - start_time
+        output_label.configure(text=f"✅ Done in {elapsed:.1f} sec\nSaved to:\n{output_path}")
+        progress_bar.set(1.0)
+        progress_percent_label.configure(text="100%")
+        timer_label.configure(text=f"⏱️ Total Time: {elapsed:.1f} sec")
+
+    def show_error(message):
+        output_label.configure(text=f"❌ Translation failed:\n{message}")
+        timer_label.configure(text=f"⏱️ Stopped after {time.time() - start_time:.1f} sec")
+
+    try:
+        if streaming:
+            # Translate and append one chunk at a time; progress counts rows, the
+            # total is estimated from how much of the file has been read
+            progress.start(unit='rows')
+
+            def chunk_progress(rows_done, fraction):
+                progress.update(rows_done, round(rows_done / fraction) if fraction else None)
+
+            output_path = os.path.join(os.path.dirname(file_path), "translated_output.csv")
+            stream_translate_csv(file_path, output_path,
+                                 lambda chunk: translate_frame(chunk, selected_columns),
+                                 progress_callback=chunk_progress, dtype=str)
+        else:
+            progress.start(total=len(df) * len(selected_columns), unit='cells')
+            translate_frame(df, selected_columns, progress.add)
+            # Parquet/Feather input is saved in the same format, anything else as Excel
+            ext = os.path.splitext(file_path)[1].lower()
+            output_ext = ext if ext in ('.parquet', '.feather') else '.xlsx'
+            output_path = os.path.join(os.path.dirname(file_path), f"translated_output{output_ext}")
+            write_table(df, output_path)
+    except Exception as e:
+        # Reading, translating or saving failed; the worker thread ends here, so tell the user
+        print(f"Translation failed: {e}")
+        app.after(0, show_error, str(e))
+        return
+    finally:
+        translating = False
+        if GoogleTranslator is not None:
+            from http_clients import session_pool
+            session_pool.close()  # Idle until the next job; the workers open new ones then
+
+    app.after(0, show_done)
+
+def load_file_and_show_checkboxes(output_label, checkbox_frame, progress_bar, timer_label, progress_percent_label):
+    global df, header_vars, streaming
+    file_path = filedialog.askopenfilename(filetypes=INPUT_FILETYPES)
+    if not file_path:
+        return
+    preloader.wait()  # Usually long done by the time a file is picked
+
+    ext = os.path.splitext(file_path)[1].lower()
+    streaming = ext == '.csv' and should_stream(file_path)
+    if streaming:
+        df = read_csv_sample(file_path, dtype=str)  # Header and sample only; rows are streamed later
+    else:
+        df = read_table(file_path, dtype=str)
+
+    for widget in checkbox_frame.winfo_children():
+        widget.destroy()
+
+    header_vars.clear()
+
+    for header in df.columns:
+        var = ctk.BooleanVar(value=True)
+        checkbox = ctk.CTkCheckBox(checkbox_frame, text=header, variable=var)
+        checkbox.pack(anchor="w", pady=2, padx=10)
+        header_vars[header] = var
+
+    ctk.CTkButton(app, text="🚀 Start Translation",
+                  command=lambda: start_translation_thread(
+                      [col for col in header_vars if header_vars[col].get()],
+                      file_path,
+                      output_label,
+                      progress_bar,
+                      timer_label,
+                      progress_percent_label
+                  )).pack(pady=10)
+
+# ==== UI SETUP ====
+app = None  # Built by main(), so importing this module never opens a window
+
+def main():
+    global app, preloader
+    ctk.set_appearance_mode("system")  # 'dark', 'light', or 'system'
+    ctk.set_default_color_theme("blue")
+
+    app = ctk.CTk()
+    app.title("Bangla Data Translator")
+    app.geometry("600x630")
+    app.resizable(False, False)
+
+    ctk.CTkLabel(app, text="Bangla Data Translator", font=ctk.CTkFont("Segoe UI", 24, "bold")).pack(pady=(20, 10))
+    ctk.CTkLabel(app, text="Select a CSV/Excel file, choose which columns to translate into Bangla.", wraplength=560).pack(pady=(0, 15))
+
+    ctk.CTkButton(app, text="📂 Load File", command=lambda: load_file_and_show_checkboxes(output_label, checkbox_frame, progress_bar, timer_label, progress_percent_label)).pack(pady=10)
+
+    checkbox_frame = ctk.CTkScrollableFrame(app, width=550, height=160)
+    checkbox_frame.pack(pady=5)
+
+    # Progress + Percentage
+    progress_frame = ctk.CTkFrame(app, fg_color="transparent")
+    progress_frame.pack(pady=(10, 0))
+
+    progress_bar = ctk.CTkProgressBar(progress_frame, width=460, height=18)
+    progress_bar.set(0)
+    progress_bar.pack(side="left", padx=(10, 5))
+
+    progress_percent_label = ctk.CTkLabel(progress_frame, text="0%", width=40, anchor="w")
+    progress_percent_label.pack(side="left")
+
+    timer_label = ctk.CTkLabel(app, text="", font=ctk.CTkFont(size=12))
+    timer_label.pack(pady=(5, 10))
+
+    output_label = ctk.CTkLabel(app, text="", wraplength=550, justify="center")
+    output_label.pack(pady=10)
+
+    # pandas/numpy load in the background while the window is already usable
+    preloader = preload()
+    app.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Offline English to Bengali transliteration of person names.
+
+Translation services don't translate names, they transliterate them,
+slowly and not always the same way twice. Transliterator does it locally:
+common name words come from an exception dictionary, everything else is
+spelled out with a grapheme rule table (longest match first, so "shr"
+beats "sh" beats "s"). Each word gets a confidence; English spelling
+doesn't say whether an "a" is short or long, so words with several such
+guesses score lower and can optionally be sent to a backend instead.
+
+detect_name_columns() picks the columns this applies to: a header that
+says "name" and values shaped like names.
+"""
+import re
+import unicodedata
+
+LOW_CONFIDENCE = 0.7  # Words below this go to the fallback, if there is one
+GUESS_PENALTY = 0.1  # Confidence lost per ambiguous grapheme
+
+# Whole words, lowercase. Spelling variants map to the usual Bengali spelling.
+NAME_EXCEPTIONS = {
+    'md': 'মোঃ', 'mohammad': 'মোহাম্মদ', 'mohammed': 'মোহাম্মদ', 'muhammad': 'মুহাম্মদ',
+    'mohd': 'মোঃ', 'mst': 'মোছাঃ', 'most': 'মোছাঃ', 'mosammat': 'মোছাম্মৎ', 'dr': 'ডাঃ',
+    'abdul': 'আব্দুল', 'abdur': 'আব্দুর', 'abu': 'আবু', 'rahman': 'রহমান', 'rahim': 'রহিম',
+    'karim': 'করিম', 'hasan': 'হাসান', 'hassan': 'হাসান', 'hossain': 'হোসেন', 'hossen': 'হোসেন',
+    'hussain': 'হোসেন', 'islam': 'ইসলাম', 'uddin': 'উদ্দিন', 'ahmed': 'আহমেদ', 'ahmad': 'আহমদ',
+    'ali': 'আলী', 'khan': 'খান', 'begum': 'বেগম', 'khatun': 'খাতুন', 'akter': 'আক্তার',
+    'akhter': 'আক্তার', 'aktar': 'আক্তার', 'sultana': 'সুলতানা', 'nur': 'নূর', 'noor': 'নূর',
+    'chowdhury': 'চৌধুরী', 'choudhury': 'চৌধুরী', 'miah': 'মিয়া', 'mia': 'মিয়া',
+    'sheikh': 'শেখ', 'shaikh': 'শেখ', 'sarkar': 'সরকার', 'sarker': 'সরকার', 'mondal': 'মন্ডল',
+    'mandal': 'মন্ডল', 'das': 'দাস', 'roy': 'রায়', 'saha': 'সাহা', 'paul': 'পাল', 'pal': 'পাল',
+    'kumar': 'কুমার', 'chandra': 'চন্দ্র', 'rani': 'রানী', 'devi': 'দেবী', 'bala': 'বালা',
+    'biswas': 'বিশ্বাস', 'ghosh': 'ঘোষ', 'dey': 'দে', 'sen': 'সেন', 'talukder': 'তালুকদার',
+    'bhuiyan': 'ভূঁইয়া', 'majumder': 'মজুমদার', 'howlader': 'হাওলাদার', 'molla': 'মোল্লা',
+    'mollah': 'মোল্লা', 'sikder': 'সিকদার', 'fatema': 'ফাতেমা', 'fatima': 'ফাতেমা',
+    'ayesha': 'আয়েশা', 'jahan': 'জাহান', 'nahar': 'নাহার', 'parvin': 'পারভীন', 'parveen': 'পারভীন',
+    'yasmin': 'ইয়াসমিন', 'jasmin': 'জেসমিন', 'shahida': 'শাহিদা', 'rashid': 'রশিদ',
+    'habib': 'হাবিব', 'kabir': 'কবির', 'jamal': 'জামাল', 'kamal': 'কামাল', 'alam': 'আলম',
+    'haque': 'হক', 'hoque': 'হক', 'haq': 'হক', 'mahmud': 'মাহমুদ', 'mahmood': 'মাহমুদ',
+    'mostafa': 'মোস্তফা', 'mustafa': 'মোস্তফা', 'ibrahim': 'ইব্রাহিম', 'ismail': 'ইসমাইল',
+    'yusuf': 'ইউসুফ', 'yousuf': 'ইউসুফ', 'jannat': 'জান্নাত', 'nasrin': 'নাসরিন',
+    'shirin': 'শিরিন', 'sumon': 'সুমন', 'rubel': 'রুবেল', 'rifat': 'রিফাত', 'shakil': 'শাকিল',
+    'sakib': 'সাকিব', 'shakib': 'সাকিব', 'tanvir': 'তানভীর', 'nusrat': 'নুসরাত',
+    'sharmin': 'শারমিন', 'farhana': 'ফারহানা', 'rezaul': 'রেজাউল', 'siddique': 'সিদ্দিক',
+    'siddiqui': 'সিদ্দিকী', 'akbar': 'আকবর', 'anwar': 'আনোয়ার', 'arif': 'আরিফ',
+}
+
+# Single letters are initials and are read out
+LETTER_NAMES = {
+    'a': 'এ', 'b': 'বি', 'c': 'সি', 'd': 'ডি', 'e': 'ই', 'f': 'এফ', 'g': 'জি', 'h': 'এইচ',
+    'i': 'আই', 'j': 'জে', 'k': 'কে', 'l': 'এল', 'm': 'এম', 'n': 'এন', 'o': 'ও', 'p': 'পি',
+    'q': 'কিউ', 'r': 'আর', 's': 'এস', 't': 'টি', 'u': 'ইউ', 'v': 'ভি', 'w': 'ডব্লিউ',
+    'x': 'এক্স', 'y': 'ওয়াই', 'z': 'জেড',
+}
+
+# Consonant clusters written as one conjunct
+CONJUNCTS = {
+    'ndr': 'ন্দ্র', 'ntr': 'ন্ত্র', 'str': 'স্ত্র', 'shr': 'শ্র', 'nch': 'ঞ্চ',
+    'pr': 'প্র', 'br': 'ব্র', 'kr': 'ক্র', 'gr': 'গ্র', 'tr': 'ত্র', 'dr': 'দ্র', 'fr': 'ফ্র',
+    'nd': 'ন্দ', 'nt': 'ন্ত', 'nj': 'ঞ্জ', 'nk': 'ঙ্ক', 'st': 'স্ত', 'kt': 'ক্ত', 'bd': 'ব্দ',
+    'mm': 'ম্ম', 'nn': 'ন্ন', 'll': 'ল্ল', 'tt': 'ত্ত', 'dd': 'দ্দ', 'kk': 'ক্ক', 'bb': 'ব্ব',
+    'pp': 'প্প', 'ss': 'স',
+}
+GEMINATES = {'mm', 'nn', 'll', 'tt', 'dd', 'kk', 'bb', 'pp'}
+CONSONANTS = {
+    'chh': 'ছ', 'sh': 'শ', 'kh': 'খ', 'gh': 'ঘ', 'ch': 'চ', 'jh': 'ঝ', 'th': 'থ', 'dh': 'ধ',
+    'ph': 'ফ', 'bh': 'ভ', 'ck': 'ক', 'ng': 'ং',
+    'k': 'ক', 'g': 'গ', 'j': 'জ', 't': 'ত', 'd': 'দ', 'n': 'ন', 'p': 'প', 'f': 'ফ', 'b': 'ব',
+    'v': 'ভ', 'm': 'ম', 'r': 'র', 'l': 'ল', 's': 'স', 'h': 'হ',
+    # No clear Bengali counterpart; each use costs confidence
+    'c': 'ক', 'q': 'ক', 'x': 'ক্স', 'z': 'জ',
+}
+GUESSED_CONSONANTS = {'c', 'q', 'x', 'z'}
+# Vowel -> (independent letter, sign after a consonant)
+VOWELS = {
+    'aa': ('আ', 'া'), 'ee': ('ঈ', 'ী'), 'ii': ('ঈ', 'ী'), 'oo': ('উ', 'ু'), 'ou': ('ঔ', 'ৌ'),
+    'au': ('ঔ', 'ৌ'), 'ow': ('ঔ', 'ৌ'),
+    'a': ('আ', 'া'), 'i': ('ই', 'ি'), 'u': ('উ', 'ু'), 'e': ('এ', 'ে'), 'o': ('ও', 'ো'),
+}
+FRONT_VOWELS = {'i', 'ee', 'ii', 'e'}  # A vowel after these is carried by য় ("maria")
+MAX_GRAPHEME = 3
+
+# Runs of letters (any script) and runs of everything else; split() tells
+# them apart with _LETTERS, so both agree on what a word is
+_TOKEN = re.compile(r'[^\W\d_]+|[\W\d_]+')
+_LETTERS = re.compile(r'[^\W\d_]')
+
+
+def _graphemes(word):
+    """Split a lowercase word into (kind, grapheme) pairs, longest match first."""
+    graphemes = []
+    position = 0
+    while position < len(word):
+        for length in range(MAX_GRAPHEME, 0, -1):
+            piece = word[position:position + length]
+            if len(piece) < length:
+                continue
+            if piece in VOWELS:
+                graphemes.append(('V', piece))
+                break
+            if piece in CONJUNCTS or piece in CONSONANTS or piece in ('y', 'w'):
+                graphemes.append(('C', piece))
+                break
+        position += length
+    return graphemes
+
+
+def _spell(word):
+    """Rule-based spelling of one lowercase word; returns (bengali, number of guesses)."""
+    graphemes = _graphemes(word)
+    output = []
+    guesses = 0
+    previous = None  # 'C', 'V' or None at the start of the word
+    previous_vowel = None
+    for index, (kind, grapheme) in enumerate(graphemes):
+        following = graphemes[index + 1] if index + 1 < len(graphemes) else (None, None)
+        vowel_follows = following[0] == 'V'
+        if kind == 'C':
+            if grapheme == 'y':
+                if previous == 'C' and vowel_follows:
+                    output.append('্য')  # "shyam"
+                    continue
+                if vowel_follows:
+                    output.append('ই' if previous is None else 'য়')  # "yasmin", "maya"
+                    guesses += 1
+                    previous, previous_vowel = ('V', 'i') if previous is None else ('C', None)
+                    continue
+                # "rony": a vowel at the end or before a consonant
+                output.append('ি' if previous == 'C' else 'ই')
+                previous, previous_vowel = 'V', 'i'
+                guesses += 1
+                continue
+            if grapheme == 'w':
+                output.append('ওয়' if vowel_follows else ('ু' if previous == 'C' else 'উ'))
+                previous, previous_vowel = ('C', None) if vowel_follows else ('V', 'u')
+                guesses += 1
+                continue
+            if grapheme == 'ng' and vowel_follows:
+                output.append('ঙ্গ')
+            else:
+                output.append(CONJUNCTS.get(grapheme) or CONSONANTS[grapheme])
+            if grapheme in GUESSED_CONSONANTS:
+                guesses += 1
+            previous = 'C'
+            continue
+
+        independent, sign = VOWELS[grapheme]
+        if previous == 'C':
+            if grapheme == 'a':
+                # Before a consonant cluster the syllable is closed and the vowel is
+                # the inherent one ("rahman"), except before a doubled consonant
+                # ("jannat"); otherwise it is usually long ("hasan"), except in a
+                # final syllable after a conjunct ("sundar")
+                next_after = graphemes[index + 2] if index + 2 < len(graphemes) else (None, None)
+                closed = following[0] == 'C' and (following[1] in CONJUNCTS or next_after[0] == 'C')
+                if closed and following[1] not in GEMINATES:
+                    sign = ''
+                elif following[0] == 'C' and next_after[0] is None and graphemes[index - 1][1] in CONJUNCTS:
+                    sign = ''
+                    guesses += 1
+                elif following[0] == 'C' and next_after[0] == 'V':
+                    guesses += 1  # Open syllable: could be either
+            output.append(sign)
+        elif previous == 'V' and previous_vowel in FRONT_VOWELS and grapheme in ('a', 'aa', 'o', 'u'):
+            output.append('য়' + sign)
+        else:
+            output.append(independent)
+            if grapheme == 'a':
+                guesses += 1  # অ or আ at the start of a word
+        previous, previous_vowel = 'V', grapheme
+    return ''.join(output), guesses
+
+
+class Transliterator:
+    """Names to Bengali script: exceptions first, then the rule table.
+
+    fallback(word) -> translation or None, if given, is asked for words
+    scoring below min_confidence; its answers are remembered.
+    """
+
+    def __init__(self, exceptions=None, fallback=None, min_confidence=LOW_CONFIDENCE):
+        self.exceptions = dict(NAME_EXCEPTIONS)
+        if exceptions:
+            self.exceptions.update((word.lower(), value) for word, value in exceptions.items())
+        self.fallback = fallback
+        self.min_confidence = min_confidence
+        self._words = {}  # lowercase word -> (bengali, confidence); names repeat a lot
+
+    def word(self, word):
+        """(bengali, confidence) for one word of letters.
+
+        The rules only cover A-Z: other words ("José", "Zoë") come back
+        unchanged with confidence 0, so a fallback or backend gets them.
+        """
+        lowered = word.lower()
+        known = self._words.get(lowered)
+        if known is None:
+            if lowered in self.exceptions:
+                known = (self.exceptions[lowered], 1.0)
+            elif not lowered.isascii():
+                known = (word, 0.0)
+            elif len(lowered) == 1:
+                known = (LETTER_NAMES.get(lowered, word), 1.0)
+            else:
+                spelled, guesses = _spell(lowered)
+                known = (spelled, max(0.0, 1.0 - GUESS_PENALTY * guesses))
+            self._words[lowered] = known
+        return known
+
+    def split(self, text, keep_unsure=True):
+        """Parts of a cell as (piece, transliteration) pairs, like PhraseMatcher.split.
+
+        Spaces, punctuation and digits are kept as they are. With
+        keep_unsure=False, low-confidence words get None so the caller can
+        have them translated elsewhere.
+        """
+        parts = []
+        swallow_dot = False
+        # NFC, so an accent typed as a combining mark stays inside its word
+        for piece in _TOKEN.findall(unicodedata.normalize('NFC', str(text))):
+            if not _LETTERS.match(piece):
+                if swallow_dot and piece.startswith('.'):
+                    piece = piece[1:]  # "Md." -> "মোঃ", the visarga already marks the abbreviation
+                swallow_dot = False
+                if piece:
+                    parts.append((piece, piece))
+                continue
+            bengali, confidence = self.word(piece)
+            swallow_dot = bengali.endswith('ঃ')
+            parts.append((piece, bengali if keep_unsure or confidence >= self.min_confidence else None))
+        return parts
+
+    def transliterate(self, text):
+        """Whole cell; low-confidence words go to the fallback when there is one."""
+        parts = self.split(text, keep_unsure=self.fallback is None)
+        output = []
+        for piece, bengali in parts:
+            if bengali is None:
+                answer = self.fallback(piece)
+                if answer:
+                    self._words[piece.lower()] = (answer, 1.0)
+                    bengali = answer
+                else:
+                    bengali = self.word(piece)[0]
+            output.append(bengali)
+        return ''.join(output)
+
+
+# Headers of person-name columns: "Name", "Voter Name", "Father's Name", "father_name", ...
+NAME_HEADER = re.compile(r"\bnames?\b|^(father|mother|husband|wife|spouse|guardian|nominee)('?s)?$", re.IGNORECASE)
+# ... but not these
+NOT_NAME_HEADER = re.compile(
+    r"file|company|institut|school|college|village|district|upazila|union|road|street|bank|branch|"
+    r"product|item|user|organi[sz]ation|place|post|area|city|country|course|subject|domain|host",
+    re.IGNORECASE)
+NAME_VALUE = re.compile(r"^[A-Za-z][A-Za-z.'\- ]*$")
+MAX_NAME_WORDS = 6
+NAME_SAMPLE_SIZE = 200
+MIN_NAME_SHARE = 0.8  # Share of sampled values that must look like names
+
+
+def is_name_header(header):
+    header = str(header).replace('_', ' ').strip()
+    return bool(NAME_HEADER.search(header)) and not NOT_NAME_HEADER.search(header)
+
+
+def looks_like_names(values, sample_size=NAME_SAMPLE_SIZE):
+    """True if most non-empty values are a few words of letters (plus dots, hyphens, apostrophes)."""
+    sample = []
+    for value in values:
+        if isinstance(value, str) and value.strip():
+            sample.append(value.strip())
+            if len(sample) >= sample_size:
+                break
+    if not sample:
+        return False
+    shaped = sum(1 for value in sample if NAME_VALUE.match(value) and len(value.split()) <= MAX_NAME_WORDS)
+    return shaped / len(sample) >= MIN_NAME_SHARE
+
+
+def detect_name_columns(df, columns, sample_size=NAME_SAMPLE_SIZE):
+    """Columns among `columns` whose header and contents both say person names."""
+    return [col for col in columns
+            if is_name_header(col) and looks_like_names(df[col].head(sample_size * 2), sample_size)]